@@ -0,0 +1,80 @@
+"""Streaming exports of application data for administrative reporting.
+
+This API is for administrative purposes only."""
+
+from datetime import datetime
+from typing import Iterator
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from ...services.export import ExportService
+from ...models import User
+from ...models.export import ExportFormat
+from ..authentication import registered_user_identity
+
+
+__authors__ = ["Kris Jordan", "Nicholas Mountain", "Jacob Brown"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+openapi_tags = {
+    "name": "(Admin) Exports",
+    "description": "Streaming CSV and NDJSON exports for reporting.",
+}
+
+api = APIRouter(prefix="/api/admin/exports")
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+
+@api.get("/users", tags=["(Admin) Exports"])
+def export_users(
+    format: ExportFormat = ExportFormat.CSV,
+    subject: User = Depends(registered_user_identity),
+    export_service: ExportService = Depends(),
+) -> StreamingResponse:
+    """Export all users."""
+    return _streaming_response(export_service.users(subject, format), "users", format)
+
+
+@api.get("/reservations", tags=["(Admin) Exports"])
+def export_reservations(
+    format: ExportFormat = ExportFormat.CSV,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    subject: User = Depends(registered_user_identity),
+    export_service: ExportService = Depends(),
+) -> StreamingResponse:
+    """Export coworking reservations starting between optional start and end times."""
+    return _streaming_response(
+        export_service.reservations(subject, format, start, end),
+        "reservations",
+        format,
+    )
+
+
+@api.get("/checkouts", tags=["(Admin) Exports"])
+def export_checkouts(
+    format: ExportFormat = ExportFormat.CSV,
+    active_only: bool = False,
+    subject: User = Depends(registered_user_identity),
+    export_service: ExportService = Depends(),
+) -> StreamingResponse:
+    """Export equipment checkouts, optionally only those not yet returned."""
+    return _streaming_response(
+        export_service.checkouts(subject, format, active_only), "checkouts", format
+    )
+
+
+def _streaming_response(
+    chunks: Iterator[str], name: str, format: ExportFormat
+) -> StreamingResponse:
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}.{format.value}"'
+        },
+    )
@@ -1,8 +1,10 @@
 """User administration API."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, UploadFile
 from ...services import UserService, UserPermissionException
+from ...services.roster import RosterService
 from ...models import User, Paginated, PaginationParams
+from ...models.roster import RosterFormat, RosterImportResult
 from ..authentication import registered_user
 
 
@@ -26,12 +28,47 @@ def list_users(
     page_size: int = 10,
     order_by: str = "first_name",
     filter: str = "",
+    cursor: str = "",
+    estimate_length: bool = False,
 ) -> Paginated[User]:
-    """List users via standard backend pagination query parameters."""
+    """List users via standard backend pagination query parameters.
+
+    Pass the `next_cursor` of a page as `cursor` to efficiently fetch the page after it.
+    """
     try:
         pagination_params = PaginationParams(
-            page=page, page_size=page_size, order_by=order_by, filter=filter
+            page=page,
+            page_size=page_size,
+            order_by=order_by,
+            filter=filter,
+            cursor=cursor,
         )
-        return user_service.list(subject, pagination_params)
+        return user_service.list(subject, pagination_params, estimate_length)
+    except UserPermissionException as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@api.post("/import", tags=["(Admin) Users"])
+def import_roster(
+    file: UploadFile,
+    format: RosterFormat | None = None,
+    subject: User = Depends(registered_user),
+    roster_service: RosterService = Depends(),
+) -> RosterImportResult:
+    """Bulk create or update users and add them to roles from an uploaded CSV or NDJSON roster.
+
+    The format is inferred from the file's extension unless given. Rows which cannot be
+    imported are reported in the result's errors and do not prevent other rows."""
+    if format is None:
+        extension = (file.filename or "").rsplit(".", 1)[-1].lower()
+        format = RosterFormat.CSV if extension == "csv" else RosterFormat.NDJSON
+    try:
+        content = file.file.read().decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Roster must be UTF-8 encoded.")
+    try:
+        return roster_service.import_roster(subject, content, format)
     except UserPermissionException as e:
         raise HTTPException(status_code=403, detail=str(e))
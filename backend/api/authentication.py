@@ -1,7 +1,10 @@
 """User authentication over HTTP via Headers and/or HTTP JWT Bearer Tokens.
 
 This module provides a `registered_user` dependency injection function for other routes
-to use to both ensure a user is authenticated and resolve to the logged in User's model.
+to use to both ensure a user is authenticated and resolve to the logged in User's model,
+including their permissions. Routes which only need to know who the user is, and leave
+permission checks to the service layer, should depend on the lighter `registered_user_identity`
+which does not load permissions, or on `registered_user_identity_async` if they are async.
 Further, this module provides the routes and logic for backend authentication.
 
 The router is mounted at `/auth` and provides the following endpoints:
@@ -59,16 +62,24 @@ for routes used in the process of registering a user.
 """
 
 import jwt
-import requests
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Header, HTTPException, Request, Response, Depends
 from fastapi.exceptions import HTTPException
 from fastapi.security import HTTPBearer
 from fastapi.security.http import HTTPAuthorizationCredentials
 from fastapi.responses import RedirectResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..database import db_async_session
 from ..env import getenv
-from ..services import UserService, GitHubService
+from ..services import PermissionService, UserService, GitHubService
+from ..services.github import GitHubLinkJobs, github_link_jobs
+from ..services.delegated_auth import (
+    DelegatedAuthVerifier,
+    DelegatedAuthUnavailableException,
+)
+from ..services.cache import registered_user_cache, registered_user_identity_cache
 from ..models import User
+from ..models.github import GitHubLinkJob
 
 
 __authors__ = ["Kris Jordan"]
@@ -82,25 +93,105 @@ AUTH_SERVER_HOST = "csxl.unc.edu"
 _JWT_SECRET = getenv("JWT_SECRET")
 _JST_ALGORITHM = "HS256"
 
+_delegated_auth_verifier = DelegatedAuthVerifier(f"https://{AUTH_SERVER_HOST}")
+"""Pooled, cached, and circuit-broken client of the authentication server's /verify route."""
+
 
 def registered_user(
     user_service: UserService = Depends(),
     token: HTTPAuthorizationCredentials | None = Depends(HTTPBearer()),
 ) -> User:
-    """Returns the authenticated user or raises a 401 HTTPException if the user is not authenticated."""
+    """Returns the authenticated user or raises a 401 HTTPException if the user is not authenticated.
+
+    Resolved users are cached by PID for a short time to avoid querying the user and their
+    permissions on every request. A copy is returned because routes may modify their subject.
+    """
+    if token:
+        try:
+            auth_info = jwt.decode(
+                token.credentials, _JWT_SECRET, algorithms=[_JST_ALGORITHM]
+            )
+            pid = int(auth_info["pid"])
+            user = registered_user_cache.get(pid)
+            if user is None:
+                user = user_service.get(pid)
+                if user:
+                    registered_user_cache.set(pid, user)
+            if user:
+                return user.model_copy(deep=True)
+        except:
+            ...
+    raise HTTPException(status_code=401, detail="Unauthorized")
+
+
+def registered_user_identity(
+    user_service: UserService = Depends(),
+    token: HTTPAuthorizationCredentials | None = Depends(HTTPBearer()),
+) -> User:
+    """Returns the authenticated user, without permissions, or raises a 401 HTTPException if the user is not authenticated.
+
+    This is the preferred dependency for routes that never read `permissions` of their subject.
+    """
+    if token:
+        try:
+            auth_info = jwt.decode(
+                token.credentials, _JWT_SECRET, algorithms=[_JST_ALGORITHM]
+            )
+            pid = int(auth_info["pid"])
+            user = _cached_identity(pid)
+            if user is None:
+                user = user_service.get_identity(pid)
+                if user:
+                    registered_user_identity_cache.set(pid, user)
+            if user:
+                return user.model_copy(deep=True)
+        except:
+            ...
+    raise HTTPException(status_code=401, detail="Unauthorized")
+
+
+async def registered_user_identity_async(
+    session: AsyncSession = Depends(db_async_session),
+    token: HTTPAuthorizationCredentials | None = Depends(HTTPBearer()),
+) -> User:
+    """Returns the authenticated user, without permissions, or raises a 401 HTTPException if the user is not authenticated.
+
+    This is `registered_user_identity` for async routes. On a cache miss, the user is read through
+    the request's `AsyncSession`, which the route shares, rather than in a threadpool thread.
+    """
     if token:
         try:
             auth_info = jwt.decode(
                 token.credentials, _JWT_SECRET, algorithms=[_JST_ALGORITHM]
             )
-            user = user_service.get(auth_info["pid"])
+            pid = int(auth_info["pid"])
+            user = _cached_identity(pid)
+            if user is None:
+                user = await session.run_sync(
+                    lambda session: UserService(
+                        session, PermissionService(session)
+                    ).get_identity(pid)
+                )
+                if user:
+                    registered_user_identity_cache.set(pid, user)
             if user:
-                return user
+                return user.model_copy(deep=True)
         except:
             ...
     raise HTTPException(status_code=401, detail="Unauthorized")
 
 
+def _cached_identity(pid: int) -> User | None:
+    """Look up a user's identity in the identity cache, or derive it from the registered user cache."""
+    user = registered_user_identity_cache.get(pid)
+    if user is None:
+        user_details = registered_user_cache.get(pid)
+        if user_details:
+            user = User(**user_details.model_dump(exclude={"permissions"}))
+            registered_user_identity_cache.set(pid, user)
+    return user
+
+
 def authenticated_pid(
     token: HTTPAuthorizationCredentials | None = Depends(HTTPBearer()),
 ) -> tuple[int, str]:
@@ -178,7 +269,8 @@ def bearer_token_impersonate(
 
 @api.get("/oauth/github_oauth_login_url", include_in_schema=False)
 def github_oauth_login_url(
-    subject: User = Depends(registered_user), github_service: GitHubService = Depends()
+    subject: User = Depends(registered_user_identity),
+    github_service: GitHubService = Depends(),
 ) -> str:
     """Return the GitHub OAuth login URL with the appropriate callback URL."""
     redirect_uri = _github_oauth_redirect_uri()
@@ -196,23 +288,36 @@ def github_oauth(code: str):
     return _link_github_html(code)
 
 
-@api.post("/oauth/github", include_in_schema=False)
+@api.post("/oauth/github", status_code=202, include_in_schema=False)
 def github_link(
     code: str,
-    subject: User = Depends(registered_user),
-    github_service: GitHubService = Depends(),
-):
-    """Link the user's GitHub account with their CSXL account."""
+    subject: User = Depends(registered_user_identity),
+    link_jobs: GitHubLinkJobs = Depends(github_link_jobs),
+) -> GitHubLinkJob:
+    """Start linking the user's GitHub account with their CSXL account in the background.
+
+    Poll the returned job's status via GET /oauth/github/jobs/{job_id}."""
     redirect_uri = _github_oauth_redirect_uri()
-    if github_service.link_with_user(subject, code, redirect_uri):
-        return "Successfully linked GitHub account."
-    else:
-        raise HTTPException(status_code=400, detail="Failed to link GitHub account.")
+    return link_jobs.submit(subject, code, redirect_uri)
+
+
+@api.get("/oauth/github/jobs/{job_id}", include_in_schema=False)
+def github_link_status(
+    job_id: str,
+    subject: User = Depends(registered_user_identity),
+    link_jobs: GitHubLinkJobs = Depends(github_link_jobs),
+) -> GitHubLinkJob:
+    """Get the status of one of the user's GitHub account linking jobs."""
+    job = link_jobs.get(subject, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="GitHub linking job not found.")
+    return job
 
 
 @api.delete("/oauth/github", include_in_schema=False)
 def github_unlink(
-    subject: User = Depends(registered_user), github_service: GitHubService = Depends()
+    subject: User = Depends(registered_user_identity),
+    github_service: GitHubService = Depends(),
 ):
     """Unlink user's GitHub account with their CSXL account."""
     github_service.remove_association(subject)
@@ -226,13 +331,15 @@ def _delegate_to_auth_server(continue_to: str):
 
 
 def _verify_delegated_auth_token(continue_to: str, token: str):
-    params = {"token": token}
-    response = requests.get(f"https://{AUTH_SERVER_HOST}/verify", params=params)
-    if response.status_code == requests.codes.ok:
+    try:
+        claims = _delegated_auth_verifier.verify(token)
+    except DelegatedAuthUnavailableException as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    if claims is not None:
         # Generate a token for development app based on verified information
-        body = response.json()
-        uid = body["uid"]
-        pid = body["pid"]
+        uid = claims["uid"]
+        pid = claims["pid"]
         new_token = _generate_token(uid, pid)
         return _set_client_token(new_token, continue_to)
     else:
@@ -336,19 +443,27 @@ def _link_github_html(code: str):
             <p id='message'>One sec while we associate your GitHub account with CSXL!</p>
             <script type='application/javascript'>
                 let token = localStorage.getItem('bearerToken');
-                fetch('/oauth/github?code={code}', {{
-                    method: 'POST',
-                    headers: {{
-                        'Content-Type': 'application/json',
-                        'Authorization': 'Bearer ' + token,
-                    }}
-                }}).then(response => {{
-                    if (response.status === 200) {{
+                let headers = {{
+                    'Content-Type': 'application/json',
+                    'Authorization': 'Bearer ' + token,
+                }};
+                let fail = () => {{ window.location.href = '/profile?error=github'; }};
+                let poll = (job) => {{
+                    if (job.status === 'succeeded') {{
                         window.location.href = '/profile?time={current_time}';
+                    }} else if (job.status === 'pending') {{
+                        setTimeout(() => {{
+                            fetch('/oauth/github/jobs/' + job.id, {{ headers: headers }})
+                                .then(response => response.ok ? response.json().then(poll) : fail());
+                        }}, 500);
                     }} else {{
-                        window.location.href = '/profile?error=github';
+                        fail();
                     }}
-                }});
+                }};
+                fetch('/oauth/github?code={code}', {{
+                    method: 'POST',
+                    headers: headers
+                }}).then(response => response.status === 202 ? response.json().then(poll) : fail());
             </script>
         </body>
     </html>
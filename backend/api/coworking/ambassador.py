@@ -4,7 +4,7 @@ This API is used to make and manage reservations."""
 
 from typing import Sequence
 from fastapi import APIRouter, Depends
-from ..authentication import registered_user
+from ..authentication import registered_user_identity
 from ...services.coworking.reservation import ReservationService
 from ...models import User
 from ...models.coworking import Reservation, ReservationPartial
@@ -19,7 +19,7 @@ api = APIRouter(prefix="/api/coworking/ambassador")
 
 @api.get("", tags=["Coworking"])
 def active_and_upcoming_reservations(
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
     reservation_svc: ReservationService = Depends(),
 ) -> Sequence[Reservation]:
     """List active and upcoming reservations.
@@ -31,7 +31,7 @@ def active_and_upcoming_reservations(
 @api.put("/checkin", tags=["Coworking"])
 def checkin_reservation(
     reservation: ReservationPartial,
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
     reservation_svc: ReservationService = Depends(),
 ) -> Reservation:
     """CheckIn a confirmed reservation."""
@@ -3,8 +3,10 @@
 This API is used to make and manage reservations."""
 
 from fastapi import APIRouter, Depends, HTTPException
-from ..authentication import registered_user
-from ...services.coworking.reservation import ReservationService
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..authentication import registered_user_identity, registered_user_identity_async
+from ...database import db_async_session
+from ...services.coworking.reservation import ReservationService, reservation_service
 from ...models import User
 from ...models.coworking import (
     Reservation,
@@ -26,19 +28,26 @@ openapi_tags = {
 
 
 @api.post("/reservation", tags=["Coworking"])
-def draft_reservation(
+async def draft_reservation(
     reservation_request: ReservationRequest,
-    subject: User = Depends(registered_user),
-    reservation_svc: ReservationService = Depends(),
+    subject: User = Depends(registered_user_identity_async),
+    session: AsyncSession = Depends(db_async_session),
 ) -> Reservation:
-    """Draft a reservation request."""
-    return reservation_svc.draft_reservation(subject, reservation_request)
+    """Draft a reservation request.
+
+    The route is async and runs the ReservationService through the request's `AsyncSession`.
+    """
+    return await session.run_sync(
+        lambda session: reservation_service(session).draft_reservation(
+            subject, reservation_request
+        )
+    )
 
 
 @api.get("/reservation/{id}", tags=["Coworking"])
 def get_reservation(
     id: int,
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
     reservation_svc: ReservationService = Depends(),
 ) -> Reservation:
     return reservation_svc.get_reservation(subject, id)
@@ -47,7 +56,7 @@ def get_reservation(
 @api.put("/reservation/{id}", tags=["Coworking"])
 def update_reservation(
     reservation: ReservationPartial,
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
     reservation_svc: ReservationService = Depends(),
 ) -> Reservation:
     """Modify a reservation."""
@@ -57,7 +66,7 @@ def update_reservation(
 @api.delete("/reservation/{id}", tags=["Coworking"])
 def cancel_reservation(
     id: int,
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
     reservation_svc: ReservationService = Depends(),
 ) -> Reservation:
     """Cancel a reservation."""
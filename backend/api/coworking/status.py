@@ -3,8 +3,10 @@
 This API is used to retrieve and update a user's profile."""
 
 from fastapi import APIRouter, Depends
-from ..authentication import registered_user
-from ...services.coworking import StatusService
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..authentication import registered_user_identity_async
+from ...database import db_async_session
+from ...services.coworking.status import status_service
 from ...models import User
 from ...models.coworking import Status
 
@@ -21,13 +23,19 @@ openapi_tags = {
 
 
 @api.get("", response_model=Status, tags=["Coworking"])
-def get_coworking_status(
-    subject: User = Depends(registered_user), status_svc: StatusService = Depends()
+async def get_coworking_status(
+    subject: User = Depends(registered_user_identity_async),
+    session: AsyncSession = Depends(db_async_session),
 ):
     """Status endpoint supports the primary screen of the coworking features.
 
     It returns information about upcoming, active reservations the subject holds.
     It also fetches the current seat availability of the XL during operating hours.
     Finally, it provides a list of upcoming hours.
+
+    As the primary screen polls it, the route is async and runs the StatusService through the
+    request's `AsyncSession`.
     """
-    return status_svc.get_coworking_status(subject)
+    return await session.run_sync(
+        lambda session: status_service(session).get_coworking_status(subject)
+    )
@@ -2,7 +2,8 @@
 
 This API is used to manage and list user equipment checkouts"""
 
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query
 from backend.models.StagedCheckoutRequest import StagedCheckoutRequest
 
 from backend.models.equipment_checkout import EquipmentCheckout
@@ -11,15 +12,33 @@ from backend.models.equipment_checkout_request import EquipmentCheckoutRequest
 from backend.models.equipment_type import EquipmentType
 from backend.models.user import User
 from ...models.equipment import Equipment
+from ...models.equipment_changes import EquipmentChanges
+from ...models.equipment_inventory import (
+    EquipmentInventoryFilter,
+    EquipmentInventoryItem,
+)
+from ...models.equipment_history import (
+    EquipmentCheckoutHistory,
+    EquipmentConditionNote,
+    EquipmentUtilization,
+)
+from ...models.equipment_overdue import (
+    EquipmentLoanPolicy,
+    OverdueReport,
+    OverdueSummary,
+)
+from ...models.pagination import Paginated, PaginationParams
 from ...services.equipment import (
     DuplicateEquipmentCheckoutRequestException,
     EquipmentCheckoutNotFoundException,
     EquipmentCheckoutRequestNotFoundException,
+    EquipmentNotFoundException,
     EquipmentService,
     WaiverNotSignedException
 )
+from ...services.equipment_overdue import OverdueCheckoutService
 
-from backend.api.authentication import registered_user
+from backend.api.authentication import registered_user_identity
 
 __authors__ = ["Nicholas Mountain", "Jacob Brown", "Ayden Franklin", "David Sprague"]
 __copyright__ = "Copyright 2023"
@@ -32,13 +51,15 @@ openapi_tags = {
 }
 
 
-@api.get("/get_all", tags=["Equipment"])
+@api.get("/get_all", tags=["Equipment"], deprecated=True)
 def get_all(
     equipment_service: EquipmentService = Depends(),
 ) -> list[Equipment]:
     """
     Gets all equipment
 
+    Deprecated in favor of /inventory, whose payload does not grow with the number of items.
+
     Parameters:
         equipment_service: dependency on 'EquipmentService'
 
@@ -49,11 +70,58 @@ def get_all(
     return equipment_service.get_all()
 
 
+@api.get("/inventory", tags=["Equipment"], response_model_exclude_none=True)
+def get_inventory(
+    model: str | None = None,
+    is_checked_out: bool | None = None,
+    min_condition: int | None = None,
+    max_condition: int | None = None,
+    fields: list[str] = Query(default=[]),
+    order_by: str = "",
+    page: int = 0,
+    page_size: int = Query(default=10, ge=1, le=100),
+    cursor: str = "",
+    equipment_service: EquipmentService = Depends(),
+) -> Paginated[EquipmentInventoryItem]:
+    """
+    Gets a page of equipment, filtered by model, checked out state, and condition
+
+    Parameters:
+        model, is_checked_out: only include equipment of this model or checked out state
+        min_condition, max_condition: only include equipment in this range of condition
+        fields: the fields of equipment to include, repeated for each field, or all by default
+        order_by: 'equipment_id' (default) or 'model'
+        page, page_size: the page to get
+        cursor: the next_cursor of the previous page, to efficiently get the page after it
+
+    Returns:
+        Paginated[EquipmentInventoryItem]: a page of equipment with only the selected fields
+
+    Raises:
+        400 if a field or order_by is unknown or the cursor is malformed
+    """
+    try:
+        return equipment_service.get_inventory(
+            PaginationParams(
+                page=page, page_size=page_size, order_by=order_by, cursor=cursor
+            ),
+            EquipmentInventoryFilter(
+                model=model,
+                is_checked_out=is_checked_out,
+                min_condition=min_condition,
+                max_condition=max_condition,
+            ),
+            fields,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @api.put("/update", tags=["Equipment"])
 def update(
     item: Equipment,
     equipment_service: EquipmentService = Depends(),
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
 ) -> Equipment:
     """
     Update an equipment item
@@ -99,7 +167,7 @@ def get_all_types(
 def add_request(
     equipmentCheckoutRequest: EquipmentCheckoutRequest,
     equipmentService: EquipmentService = Depends(),
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
 ) -> EquipmentCheckoutRequest:
     """
     Adds a new checkout request.
@@ -130,7 +198,7 @@ def add_request(
 def delete_request(
     equipmentCheckoutRequest: EquipmentCheckoutRequest,
     equipmentService: EquipmentService = Depends(),
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
 ) -> None:
     """
     Deletes an existing checkout request
@@ -157,7 +225,7 @@ def delete_request(
 @api.get("/get_all_requests", tags=["Equipment"])
 def get_all_requests(
     equipmentService: EquipmentService = Depends(),
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
 ) -> list[EquipmentCheckoutRequest]:
     """
     Gets all pending checkout requests
@@ -173,12 +241,16 @@ def get_all_requests(
     return equipmentService.get_all_requests(subject)
 
 
-@api.get("/get_equipment_for_request/{model}", tags=["Equipment"])
+@api.get(
+    "/get_equipment_for_request/{model}",
+    tags=["Equipment"],
+    response_model_exclude_none=True,
+)
 def get_all_for_request(
     model: str,
     equipmentService: EquipmentService = Depends(),
-    subject: User = Depends(registered_user),
-) -> list[Equipment]:
+    subject: User = Depends(registered_user_identity),
+) -> list[EquipmentInventoryItem]:
     """
     Gets all available equipment for a confirmed checkout request
 
@@ -188,7 +260,7 @@ def get_all_for_request(
         subject: a valid registered user
 
     Returns:
-        List of all available requested equipment
+        The ids, model, and condition of all available requested equipment
     """
 
     return equipmentService.get_equipment_for_request(subject, model)
@@ -197,7 +269,7 @@ def get_all_for_request(
 @api.put("/update_waiver_field", tags=["Equipment"])
 def update_waiver_field(
     equipment_service: EquipmentService = Depends(),
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
 ) -> User:
     """
     Update the signed waiver field of a user
@@ -220,7 +292,7 @@ def update_waiver_field(
 @api.get("/get_all_staged_requests", tags=["Equipment"])
 def get_all_staged_requests(
     equipment_service: EquipmentService = Depends(),
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
 ) -> list[StagedCheckoutRequest]:
     """
     Gets staged equipment checkout requests from db
@@ -241,7 +313,7 @@ def get_all_staged_requests(
 def create_staged_request(
     staged_request: StagedCheckoutRequest,
     equipment_service: EquipmentService = Depends(),
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
 ) -> StagedCheckoutRequest:
     """
     Creates a staged equipment checkout request from db
@@ -265,7 +337,7 @@ def create_staged_request(
 def delete_staged_request(
     staged_request: StagedCheckoutRequest,
     equipment_service: EquipmentService = Depends(),
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
 ) -> None:
     """
     Deletes a staged equipment checkout request from db
@@ -289,7 +361,7 @@ def delete_staged_request(
 @api.get("/get_all_active_checkouts", tags=["Equipment"])
 def get_all_active_checkouts(
     equipment_service: EquipmentService = Depends(),
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
 ) -> list[EquipmentCheckout]:
     """
     Gets equipment checkouts
@@ -307,11 +379,35 @@ def get_all_active_checkouts(
         raise HTTPException(status_code=422, detail=str(e))
 
 
+@api.get("/changes", tags=["Equipment"])
+def get_changes(
+    since: str = "",
+    equipment_service: EquipmentService = Depends(),
+    subject: User = Depends(registered_user_identity),
+) -> EquipmentChanges:
+    """
+    Gets changes to checkout requests, staged requests, and active checkouts since a cursor
+
+    Parameters:
+        since: the cursor of the previous changes, or empty for a snapshot of everything
+
+    Returns:
+        EquipmentChanges: the changes, and the cursor to pass to get the changes following them
+
+    Raises:
+        400 if the cursor is malformed
+    """
+    try:
+        return equipment_service.get_changes(subject, since)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @api.post("/create_checkout", tags=["Equipment"])
 def create_equipment_checkout(
     checkout: EquipmentCheckout,
     equipment_service: EquipmentService = Depends(),
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
 ) -> EquipmentCheckout:
     """
     Creates an equipment checkout
@@ -336,7 +432,7 @@ def create_equipment_checkout(
 def return_checkout(
     checkout: EquipmentCheckout,
     equipment_service: EquipmentService = Depends(),
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
 ) -> EquipmentCheckout:
     """
     Returns an equipment checkout
@@ -362,3 +458,197 @@ def return_checkout(
     # if other error, error was raised because equipment being returned is not checked out
     except Exception as e:
         raise HTTPException(status_code=422, detail=str(e))
+
+
+@api.get("/{equipment_id}/history", tags=["Equipment"])
+def get_checkout_history(
+    equipment_id: int,
+    page: int = 0,
+    page_size: int = Query(default=10, ge=1, le=100),
+    cursor: str = "",
+    equipment_service: EquipmentService = Depends(),
+    subject: User = Depends(registered_user_identity),
+) -> Paginated[EquipmentCheckoutHistory]:
+    """
+    Gets a page of the checkout history of an equipment item, newest first
+
+    Parameters:
+        equipment_id: the equipment id of the item
+        page, page_size: the page to get
+        cursor: the next_cursor of the previous page, to efficiently get the page after it
+
+    Returns:
+        Paginated[EquipmentCheckoutHistory]: a page of the item's checkout history
+
+    Raises:
+        404 if the item does not exist, 400 if the cursor is malformed
+    """
+    try:
+        pagination_params = PaginationParams(
+            page=page, page_size=page_size, cursor=cursor
+        )
+        return equipment_service.get_checkout_history(
+            equipment_id, subject, pagination_params
+        )
+    except EquipmentNotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@api.get("/{equipment_id}/condition_notes", tags=["Equipment"])
+def get_condition_notes(
+    equipment_id: int,
+    page: int = 0,
+    page_size: int = Query(default=10, ge=1, le=100),
+    cursor: str = "",
+    equipment_service: EquipmentService = Depends(),
+    subject: User = Depends(registered_user_identity),
+) -> Paginated[EquipmentConditionNote]:
+    """
+    Gets a page of the notes on the condition of an equipment item, newest first
+
+    Parameters:
+        equipment_id: the equipment id of the item
+        page, page_size: the page to get
+        cursor: the next_cursor of the previous page, to efficiently get the page after it
+
+    Returns:
+        Paginated[EquipmentConditionNote]: a page of the item's condition notes
+
+    Raises:
+        404 if the item does not exist, 400 if the cursor is malformed
+    """
+    try:
+        pagination_params = PaginationParams(
+            page=page, page_size=page_size, cursor=cursor
+        )
+        return equipment_service.get_condition_notes(
+            equipment_id, subject, pagination_params
+        )
+    except EquipmentNotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@api.post("/{equipment_id}/condition_notes", tags=["Equipment"])
+def add_condition_note(
+    equipment_id: int,
+    note: str,
+    equipment_service: EquipmentService = Depends(),
+    subject: User = Depends(registered_user_identity),
+) -> EquipmentConditionNote:
+    """
+    Adds a note on the condition of an equipment item
+
+    Parameters:
+        equipment_id: the equipment id of the item
+        note: the note on the item's condition
+
+    Returns:
+        EquipmentConditionNote: the note that was added
+
+    Raises:
+        404 if the item does not exist
+    """
+    try:
+        return equipment_service.add_condition_note(
+            EquipmentConditionNote(equipment_id=equipment_id, note=note), subject
+        )
+    except EquipmentNotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@api.get("/{equipment_id}/utilization", tags=["Equipment"])
+def get_utilization(
+    equipment_id: int,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    equipment_service: EquipmentService = Depends(),
+    subject: User = Depends(registered_user_identity),
+) -> EquipmentUtilization:
+    """
+    Gets how much an equipment item was checked out within a window of time
+
+    Parameters:
+        equipment_id: the equipment id of the item
+        start: the start of the window, 30 days before its end by default
+        end: the end of the window, now by default
+
+    Returns:
+        EquipmentUtilization: the item's checkouts and checked out time within the window
+
+    Raises:
+        404 if the item does not exist, 400 if the window ends before it starts
+    """
+    try:
+        return equipment_service.get_utilization(equipment_id, subject, start, end)
+    except EquipmentNotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@api.get("/overdue", tags=["Equipment"])
+def get_overdue_checkouts(
+    overdue_service: OverdueCheckoutService = Depends(),
+    subject: User = Depends(registered_user_identity),
+) -> OverdueReport:
+    """
+    Gets the active checkouts which have overrun their loan period, longest overdue first
+
+    The report is refreshed periodically in the background, as of its scanned_at time.
+
+    Returns:
+        OverdueReport: the overdue checkouts and their counts
+    """
+    return overdue_service.get_report(subject)
+
+
+@api.get("/overdue/summary", tags=["Equipment"])
+def get_overdue_summary(
+    overdue_service: OverdueCheckoutService = Depends(),
+    subject: User = Depends(registered_user_identity),
+) -> OverdueSummary:
+    """
+    Gets the number of overdue checkouts, in total and of each model
+
+    Returns:
+        OverdueSummary: counts of the overdue checkouts
+    """
+    return overdue_service.get_summary(subject)
+
+
+@api.get("/loan_policies", tags=["Equipment"])
+def get_loan_policies(
+    overdue_service: OverdueCheckoutService = Depends(),
+    subject: User = Depends(registered_user_identity),
+) -> list[EquipmentLoanPolicy]:
+    """
+    Gets how long each model of equipment with a loan policy may be checked out for
+
+    Models without a loan policy may be checked out for a default period.
+
+    Returns:
+        list[EquipmentLoanPolicy]: the loan policies
+    """
+    return overdue_service.get_loan_policies(subject)
+
+
+@api.put("/loan_policies", tags=["Equipment"])
+def set_loan_policy(
+    policy: EquipmentLoanPolicy,
+    overdue_service: OverdueCheckoutService = Depends(),
+    subject: User = Depends(registered_user_identity),
+) -> EquipmentLoanPolicy:
+    """
+    Creates or replaces the loan policy of a model of equipment
+
+    Parameters:
+        policy: the loan policy
+
+    Returns:
+        EquipmentLoanPolicy: the loan policy
+    """
+    return overdue_service.set_loan_policy(subject, policy)
@@ -2,12 +2,25 @@
 
 Event routes are used to create, retrieve, and update Events."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..services.event import EventService
+from ..database import db_async_session
+from ..services.exceptions import OrganizationNotFoundException
+from ..services.permission import PermissionService
+
+from ..services.event import EventFullException, EventService, event_reader
+from ..services.snapshot import SnapshotBuilder, snapshot_builder
 from ..models.event import Event
 from ..models.event_details import EventDetails
-from ..api.authentication import registered_user
+from ..models.event_calendar import EventCalendar
+from ..models.event_rsvp import EventRsvp
+from ..models.event_feed import EventFeed
+from ..models.pagination import Paginated, PaginationParams
+from ..models.search import EventSearchResult
+from ..api.authentication import registered_user_identity
 from ..models.user import User
 
 __authors__ = ["Ajay Gandecha", "Jade Keegan", "Brianna Ta", "Audrey Toney"]
@@ -22,7 +35,9 @@ openapi_tags = {
 
 
 @api.get("", response_model=list[EventDetails], tags=["Events"])
-def get_events(event_service: EventService = Depends()) -> list[EventDetails]:
+def get_events(
+    event_service: EventService = Depends(event_reader),
+) -> list[EventDetails]:
     """
     Get all events
 
@@ -32,6 +47,159 @@ def get_events(event_service: EventService = Depends()) -> list[EventDetails]:
     return event_service.all()
 
 
+@api.get("/feed", response_model=EventFeed, tags=["Events"])
+async def get_event_feed(
+    start: datetime | None = Query(default=None, alias="from"),
+    end: datetime | None = Query(default=None, alias="to"),
+    cursor: str = "",
+    limit: int = Query(default=50, ge=1, le=200),
+    session: AsyncSession = Depends(db_async_session),
+) -> EventFeed:
+    """
+    Get a page of events within a window of time, in order of time
+
+    The route is async and runs the EventService through the request's `AsyncSession`.
+
+    Parameters:
+        start: only include events at or after this time, given as `from`
+        end: only include events before this time, given as `to`
+        cursor: the `next_cursor` of the previous page, or empty for the first page
+        limit: the maximum number of events on the page
+        session: a valid AsyncSession
+
+    Returns:
+        EventFeed: the page of events, with each organization hosting them included once
+
+    Raises:
+        HTTPException 400 if the cursor is malformed
+    """
+    try:
+        return await session.run_sync(
+            lambda session: EventService(session, PermissionService(session)).feed(
+                start, end, cursor, limit
+            )
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@api.get("/search", response_model=Paginated[EventSearchResult], tags=["Events"])
+def search_events(
+    q: str,
+    page: int = 0,
+    page_size: int = Query(default=10, ge=1, le=100),
+    event_service: EventService = Depends(event_reader),
+) -> Paginated[EventSearchResult]:
+    """
+    Search events by their name, location, and description, most relevant first
+
+    Parameters:
+        q: the search query, which may quote phrases, use `or`, and exclude words with `-`
+        page, page_size: the page of results to get
+        event_service: a valid EventService
+
+    Returns:
+        Paginated[EventSearchResult]: a page of matching events, with excerpts of their
+        descriptions in which matching words are wrapped in `<mark>` tags
+    """
+    return event_service.search(
+        PaginationParams(page=page, page_size=page_size, filter=q)
+    )
+
+
+@api.get(
+    "/calendar.ics",
+    response_class=Response,
+    responses={200: {"content": {"text/calendar": {}}}},
+    tags=["Events"],
+)
+def get_calendar(
+    if_none_match: str | None = Header(default=None),
+    if_modified_since: str | None = Header(default=None),
+    event_service: EventService = Depends(),
+) -> Response:
+    """
+    Get the iCalendar feed of all public events, for subscribing to in calendar apps
+
+    Parameters:
+        if_none_match: ETags of copies of the feed held by the client
+        if_modified_since: when the copy of the feed held by the client was last modified
+        event_service: a valid EventService
+
+    Returns:
+        Response: the feed, or an empty 304 response if the client's copy is unchanged
+    """
+    return _calendar_response(
+        event_service.calendar(), if_none_match, if_modified_since
+    )
+
+
+@api.get(
+    "/organization/{slug}/calendar.ics",
+    response_class=Response,
+    responses={200: {"content": {"text/calendar": {}}}, 404: {"model": None}},
+    tags=["Events"],
+)
+def get_organization_calendar(
+    slug: str,
+    if_none_match: str | None = Header(default=None),
+    if_modified_since: str | None = Header(default=None),
+    event_service: EventService = Depends(),
+) -> Response:
+    """
+    Get the iCalendar feed of an organization's public events, for subscribing to in calendar apps
+
+    Parameters:
+        slug: a valid str representing a unique Organization
+        if_none_match: ETags of copies of the feed held by the client
+        if_modified_since: when the copy of the feed held by the client was last modified
+        event_service: a valid EventService
+
+    Returns:
+        Response: the feed, or an empty 304 response if the client's copy is unchanged
+
+    Raises:
+        HTTPException 404 if the organization does not exist
+    """
+    try:
+        calendar = event_service.calendar(slug)
+    except OrganizationNotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return _calendar_response(calendar, if_none_match, if_modified_since)
+
+
+def _calendar_response(
+    calendar: EventCalendar, if_none_match: str | None, if_modified_since: str | None
+) -> Response:
+    """Serve a calendar, or a 304 response if the client's copy of it is unchanged.
+
+    As with the organization directory, `If-None-Match` is compared with the calendar's ETag;
+    `If-Modified-Since` is only considered when the client sends no ETags, and calendars of no
+    events have no `Last-Modified` time."""
+    headers = {"ETag": calendar.etag, "Cache-Control": "public, max-age=300"}
+    last_modified = None
+    if calendar.last_modified is not None:
+        last_modified = calendar.last_modified.astimezone(timezone.utc)
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    unchanged = False
+    if if_none_match is not None:
+        unchanged = calendar.etag in [
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        ]
+    elif if_modified_since is not None and last_modified is not None:
+        try:
+            unchanged = parsedate_to_datetime(if_modified_since) >= last_modified
+        except (TypeError, ValueError):
+            pass
+    if unchanged:
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=calendar.content,
+        media_type="text/calendar",
+        headers=headers,
+    )
+
+
 @api.get("/organization/{slug}", response_model=list[EventDetails], tags=["Events"])
 def get_events_from_organization(
     slug: str, event_service: EventService = Depends()
@@ -52,8 +220,9 @@ def get_events_from_organization(
 @api.post("", response_model=EventDetails, tags=["Events"])
 def new_event(
     event: Event,
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
     event_service: EventService = Depends(),
+    snapshots: SnapshotBuilder = Depends(snapshot_builder),
 ) -> EventDetails:
     """
     Create event
@@ -62,11 +231,14 @@ def new_event(
         event: a valid Event model
         subject: a valid User model representing the currently logged in User
         event_service: a valid EventService
+        snapshots: the SnapshotBuilder, asked to rebuild the snapshots of public data
 
     Returns:
         EventDetails: latest iteration of the created or updated event after changes made
     """
-    return event_service.create(subject, event)
+    created = event_service.create(subject, event)
+    snapshots.request_rebuild()
+    return created
 
 
 @api.get(
@@ -94,8 +266,9 @@ def get_event_from_id(id: int, event_service: EventService = Depends()) -> Event
 )
 def update_event(
     event: EventDetails,
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
     event_service: EventService = Depends(),
+    snapshots: SnapshotBuilder = Depends(snapshot_builder),
 ) -> EventDetails:
     """
     Update event
@@ -104,18 +277,22 @@ def update_event(
         event: a valid Event model
         subject: a valid User model representing the currently logged in User
         event_service: a valid EventService
+        snapshots: the SnapshotBuilder, asked to rebuild the snapshots of public data
 
     Returns:
         EventDetails: a valid EventDetails model representing the updated Event
     """
-    return event_service.update(subject, event)
+    updated = event_service.update(subject, event)
+    snapshots.request_rebuild()
+    return updated
 
 
 @api.delete("/{id}", tags=["Events"])
 def delete_event(
     id: int,
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
     event_service: EventService = Depends(),
+    snapshots: SnapshotBuilder = Depends(snapshot_builder),
 ):
     """
     Delete event based on id
@@ -124,5 +301,88 @@ def delete_event(
         id: an int representing a unique event ID
         subject: a valid User model representing the currently logged in User
         event_service: a valid EventService
+        snapshots: the SnapshotBuilder, asked to rebuild the snapshots of public data
     """
     event_service.delete(subject, id)
+    snapshots.request_rebuild()
+
+
+@api.get(
+    "/{id}/rsvp",
+    responses={404: {"model": None}},
+    response_model=EventRsvp,
+    tags=["Events"],
+)
+def get_rsvp(
+    id: int,
+    subject: User = Depends(registered_user_identity),
+    event_service: EventService = Depends(),
+) -> EventRsvp:
+    """
+    Get whether the currently logged in User has RSVP'd to an event, and how many have
+
+    Parameters:
+        id: an int representing a unique event ID
+        subject: a valid User model representing the currently logged in User
+        event_service: a valid EventService
+
+    Returns:
+        EventRsvp: the User's RSVP to the event
+    """
+    return event_service.get_rsvp(subject, id)
+
+
+@api.post(
+    "/{id}/rsvp",
+    responses={404: {"model": None}, 409: {"model": None}},
+    response_model=EventRsvp,
+    tags=["Events"],
+)
+def rsvp(
+    id: int,
+    subject: User = Depends(registered_user_identity),
+    event_service: EventService = Depends(),
+) -> EventRsvp:
+    """
+    RSVP the currently logged in User to an event
+
+    Parameters:
+        id: an int representing a unique event ID
+        subject: a valid User model representing the currently logged in User
+        event_service: a valid EventService
+
+    Returns:
+        EventRsvp: the User's RSVP to the event
+
+    Raises:
+        HTTPException 409 if the event has reached its capacity
+    """
+    try:
+        return event_service.rsvp(subject, id)
+    except EventFullException as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+@api.delete(
+    "/{id}/rsvp",
+    responses={404: {"model": None}},
+    response_model=EventRsvp,
+    tags=["Events"],
+)
+def cancel_rsvp(
+    id: int,
+    subject: User = Depends(registered_user_identity),
+    event_service: EventService = Depends(),
+) -> EventRsvp:
+    """
+    Cancel the currently logged in User's RSVP to an event
+
+    Parameters:
+        id: an int representing a unique event ID
+        subject: a valid User model representing the currently logged in User
+        event_service: a valid EventService
+
+    Returns:
+        EventRsvp: the User's RSVP to the event, which is no longer attending
+    """
+    return event_service.cancel_rsvp(subject, id)
@@ -6,6 +6,9 @@ Production systems monitor these end points upon deployment, and at regular inte
 
 from fastapi import APIRouter, Depends
 from ..services.health import HealthService
+from ..models import User
+from ..models.pool_status import PoolStatus
+from .authentication import registered_user_identity
 
 
 __authors__ = ["Kris Jordan"]
@@ -23,3 +26,11 @@ api = APIRouter(prefix="/api/health")
 @api.get("", tags=["System Health"])
 def health_check(health_svc: HealthService = Depends()) -> str:
     return health_svc.check()
+
+
+@api.get("/pool", tags=["System Health"])
+def pool_status(
+    subject: User = Depends(registered_user_identity),
+    health_svc: HealthService = Depends(),
+) -> PoolStatus:
+    return health_svc.pool_status(subject)
@@ -2,14 +2,18 @@
 
 Organization routes are used to create, retrieve, and update Organizations."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 
-from ..services.organization import OrganizationNotFoundException
+from ..services.organization import OrganizationNotFoundException, organization_reader
 from ..services.permission import UserPermissionException
 from ..services import OrganizationService
+from ..services.snapshot import SnapshotBuilder, snapshot_builder
 from ..models.organization import Organization
-from ..models.organization_details import OrganizationDetails
-from ..api.authentication import registered_user
+from ..models.organization_details import OrganizationEvents, OrganizationPage
+from ..models.organization_summary import OrganizationSummary
+from ..models.pagination import Paginated, PaginationParams
+from ..models.search import OrganizationSearchResult
+from ..api.authentication import registered_user_identity
 from ..models.user import User
 
 __authors__ = ["Ajay Gandecha", "Jade Keegan", "Brianna Ta", "Audrey Toney"]
@@ -23,29 +27,41 @@ openapi_tags = {
 }
 
 
-@api.get("", response_model=list[Organization], tags=["Organizations"])
+@api.get("", response_model=list[OrganizationSummary], tags=["Organizations"])
 def get_organizations(
+    if_none_match: str | None = Header(default=None),
     organization_service: OrganizationService = Depends(),
-) -> list[Organization]:
+) -> Response:
     """
-    Get all organizations
+    Get the summaries of all organizations, as listed in the organization directory
+
+    The directory is served with an `ETag`, so that browsers and proxies holding it may
+    revalidate it with `If-None-Match` and receive an empty 304 response if it is unchanged.
 
     Parameters:
+        if_none_match: ETags of copies of the directory held by the client
         organization_service: a valid OrganizationService
 
     Returns:
-        list[Organization]: All `Organization`s in the `Organization` database table
+        list[OrganizationSummary]: All organizations, without their long descriptions
     """
-
-    # Return all organizations
-    return organization_service.all()
+    directory = organization_service.directory()
+    headers = {"ETag": directory.etag, "Cache-Control": "public, max-age=60"}
+    if if_none_match is not None and directory.etag in [
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    ]:
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=directory.content, media_type="application/json", headers=headers
+    )
 
 
 @api.post("", response_model=Organization, tags=["Organizations"])
 def new_organization(
     organization: Organization,
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
     organization_service: OrganizationService = Depends(),
+    snapshots: SnapshotBuilder = Depends(snapshot_builder),
 ) -> Organization:
     """
     Create organization
@@ -54,6 +70,7 @@ def new_organization(
         organization: a valid Organization model
         subject: a valid User model representing the currently logged in User
         organization_service: a valid OrganizationService
+        snapshots: the SnapshotBuilder, asked to rebuild the snapshots of public data
 
     Returns:
         Organization: Created organization
@@ -63,31 +80,64 @@ def new_organization(
     """
 
     try:
-        # Try to create and return new organization
-        return organization_service.create(subject, organization)
+        # Try to create new organization
+        created = organization_service.create(subject, organization)
     except Exception as e:
         # Raise 422 exception if creation fails (request body is shaped incorrectly / not authorized)
         raise HTTPException(status_code=422, detail=str(e))
+    snapshots.request_rebuild()
+    return created
+
+
+@api.get(
+    "/search",
+    response_model=Paginated[OrganizationSearchResult],
+    tags=["Organizations"],
+)
+def search_organizations(
+    q: str,
+    page: int = 0,
+    page_size: int = Query(default=10, ge=1, le=100),
+    organization_service: OrganizationService = Depends(organization_reader),
+) -> Paginated[OrganizationSearchResult]:
+    """
+    Search organizations by their name, shorthand, and short description, most relevant first
+
+    Parameters:
+        q: the search query, which may quote phrases, use `or`, and exclude words with `-`
+        page, page_size: the page of results to get
+        organization_service: a valid OrganizationService
+
+    Returns:
+        Paginated[OrganizationSearchResult]: a page of matching organizations, with excerpts of
+        their short descriptions in which matching words are wrapped in `<mark>` tags
+    """
+    return organization_service.search(
+        PaginationParams(page=page, page_size=page_size, filter=q)
+    )
 
 
 @api.get(
     "/{slug}",
     responses={404: {"model": None}},
-    response_model=OrganizationDetails,
+    response_model=OrganizationPage,
     tags=["Organizations"],
 )
 def get_organization_from_slug(
-    slug: str, organization_service: OrganizationService = Depends()
-) -> OrganizationDetails:
+    slug: str,
+    limit: int = Query(default=10, ge=1, le=100),
+    organization_service: OrganizationService = Depends(),
+) -> OrganizationPage:
     """
-    Get organization with matching slug
+    Get organization with matching slug, with a page of its upcoming events
 
     Parameters:
         slug: a string representing a unique identifier for an Organization
+        limit: the maximum number of upcoming events to include
         organization_service: a valid OrganizationService
 
     Returns:
-        Organization: Organization with matching slug
+        OrganizationPage: Organization with matching slug, and cursors to the rest of its events
 
     Raises:
         HTTPException 404 if get_from_slug() raises an Exception
@@ -96,12 +146,51 @@ def get_organization_from_slug(
     # Try to get organization with matching slug
     try:
         # Return organization
-        return organization_service.get_from_slug(slug)
+        return organization_service.get_from_slug(slug, limit)
     except OrganizationNotFoundException as e:
         # Raise 404 exception if search fails (no response)
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@api.get(
+    "/{slug}/events",
+    responses={404: {"model": None}},
+    response_model=OrganizationEvents,
+    tags=["Organizations"],
+)
+def get_organization_events(
+    slug: str,
+    cursor: str,
+    past: bool = False,
+    limit: int = Query(default=10, ge=1, le=100),
+    organization_service: OrganizationService = Depends(),
+) -> OrganizationEvents:
+    """
+    Get a page of an organization's events following a cursor from its page
+
+    Parameters:
+        slug: a string representing a unique identifier for an Organization
+        cursor: the `events_cursor` or `past_events_cursor` of the organization, or the
+            `next_cursor` of the previous page
+        past: whether the cursor is of past events, which are ordered most recent first
+        limit: the maximum number of events to get
+        organization_service: a valid OrganizationService
+
+    Returns:
+        OrganizationEvents: a page of the organization's events
+
+    Raises:
+        HTTPException 400 if the cursor is malformed
+        HTTPException 404 if the organization does not exist
+    """
+    try:
+        return organization_service.get_events(slug, cursor, past, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except OrganizationNotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 @api.put(
     "",
     responses={404: {"model": None}},
@@ -110,8 +199,9 @@ def get_organization_from_slug(
 )
 def update_organization(
     organization: Organization,
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
     organization_service: OrganizationService = Depends(),
+    snapshots: SnapshotBuilder = Depends(snapshot_builder),
 ) -> Organization:
     """
     Update organization
@@ -120,6 +210,7 @@ def update_organization(
         organization: a valid Organization model
         subject: a valid User model representing the currently logged in User
         organization_service: a valid OrganizationService
+        snapshots: the SnapshotBuilder, asked to rebuild the snapshots of public data
 
     Returns:
         Organization: Updated organization
@@ -128,18 +219,21 @@ def update_organization(
         HTTPException 404 if update() raises an Exception
     """
     try:
-        # Return updated organization
-        return organization_service.update(subject, organization)
+        # Update organization
+        updated = organization_service.update(subject, organization)
     except (OrganizationNotFoundException, UserPermissionException) as e:
         # Raise 404 exception if update fails (organization does not exist / not authorized)
         raise HTTPException(status_code=404, detail=str(e))
+    snapshots.request_rebuild()
+    return updated
 
 
 @api.delete("/{slug}", response_model=None, tags=["Organizations"])
 def delete_organization(
     slug: str,
-    subject: User = Depends(registered_user),
+    subject: User = Depends(registered_user_identity),
     organization_service=Depends(OrganizationService),
+    snapshots: SnapshotBuilder = Depends(snapshot_builder),
 ):
     """
     Delete organization based on slug
@@ -148,6 +242,7 @@ def delete_organization(
         slug: a string representing a unique identifier for an Organization
         subject: a valid User model representing the currently logged in User
         organization_service: a valid OrganizationService
+        snapshots: the SnapshotBuilder, asked to rebuild the snapshots of public data
 
     Raises:
         HTTPException 404 if delete() raises an Exception
@@ -159,3 +254,4 @@ def delete_organization(
     except OrganizationNotFoundException as e:
         # Raise 404 exception if delete fails (organization does not exist / not authorized)
         raise HTTPException(status_code=404, detail=str(e))
+    snapshots.request_rebuild()
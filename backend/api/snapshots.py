@@ -0,0 +1,45 @@
+"""Snapshots API
+
+Points anonymous visitors to the current static snapshots of public directory data, which are
+served by the static files middleware with immutable caching."""
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+
+from ..models.snapshot import SnapshotManifest
+from ..services.snapshot import SnapshotBuilder, snapshot_builder
+
+__authors__ = ["Ajay Gandecha", "Jade Keegan", "Brianna Ta", "Audrey Toney"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+openapi_tags = {
+    "name": "Snapshots",
+    "description": "Locate static snapshots of the organization directory and upcoming events.",
+}
+
+api = APIRouter(prefix="/api/snapshots")
+
+
+@api.get(
+    "",
+    response_model=SnapshotManifest,
+    responses={404: {"model": None}},
+    tags=["Snapshots"],
+)
+def get_snapshot_manifest(
+    response: Response, builder: SnapshotBuilder = Depends(snapshot_builder)
+) -> SnapshotManifest:
+    """
+    Get the URL paths of the current snapshots
+
+    Returns:
+        SnapshotManifest: the current snapshots
+
+    Raises:
+        HTTPException 404 if no snapshots have been built
+    """
+    manifest = builder.manifest()
+    if manifest is None:
+        raise HTTPException(status_code=404, detail="No snapshots have been built.")
+    response.headers["Cache-Control"] = "public, max-age=60"
+    return manifest
@@ -9,9 +9,19 @@ __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
+import mimetypes
 import os
+import re
 
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Scope
+
+HASHED_FILE_NAME = re.compile(r"\.[0-9a-f]{16,}\.")
+"""Matches the names of files versioned by a hash of their content, such as the bundles of the
+front-end and static snapshots, which never change and so may be cached indefinitely."""
 
 
 class StaticFileMiddleware(StaticFiles):
@@ -19,6 +29,53 @@ class StaticFileMiddleware(StaticFiles):
         self.index = index
         super().__init__(directory=directory, packages=None, html=True, check_dir=True)
 
+    def file_response(
+        self,
+        full_path: os.PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        """Serves a file, preferring a pre-compressed `.gz` copy of it if the client accepts gzip.
+
+        Files with hashed names are served with immutable caching.
+
+        Args:
+            full_path (os.PathLike): Path of the file.
+            stat_result (os.stat_result): Stat result of the file.
+            scope (Scope): Scope of the request.
+            status_code (int, optional): Status code of the response.
+
+        Returns:
+            Response: The file, or a 304 response if the client's copy is unchanged.
+        """
+        request_headers = Headers(scope=scope)
+        headers = {}
+        if HASHED_FILE_NAME.search(os.path.basename(full_path)):
+            headers["Cache-Control"] = "public, max-age=31536000, immutable"
+
+        media_type = mimetypes.guess_type(str(full_path))[0] or "text/plain"
+        gzipped_path = f"{full_path}.gz"
+        if "gzip" in request_headers.get("accept-encoding", "") and os.path.isfile(
+            gzipped_path
+        ):
+            full_path, stat_result = gzipped_path, os.stat(gzipped_path)
+            headers["Content-Encoding"] = "gzip"
+        if os.path.isfile(gzipped_path):
+            headers["Vary"] = "Accept-Encoding"
+
+        response = FileResponse(
+            full_path,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            stat_result=stat_result,
+            method=scope["method"],
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
     def lookup_path(self, path: str) -> tuple[str, os.stat_result]:
         """Returns the index file when no match is found.
 
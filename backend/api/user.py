@@ -1,9 +1,10 @@
 """User operations open to registered users such as searching for fellow user profiles."""
 
-from fastapi import APIRouter, Depends
-from ..services import UserService
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from ..services import UserService, GitHubService
+from ..services.user import user_reader
 from ..models import User
-from .authentication import registered_user
+from .authentication import registered_user_identity
 
 api = APIRouter(prefix="/api/user")
 openapi_tags = {
@@ -14,7 +15,33 @@ openapi_tags = {
 
 @api.get("", response_model=list[User], tags=["Users"])
 def search(
-    q: str, subject: User = Depends(registered_user), user_svc: UserService = Depends()
+    q: str,
+    subject: User = Depends(registered_user_identity),
+    user_svc: UserService = Depends(user_reader),
 ):
     """Search for users based on a query string which matches against name, onyen, and email address."""
     return user_svc.search(subject, q)
+
+
+@api.get("/{id}/avatar", tags=["Users"])
+def get_avatar(
+    id: int,
+    if_none_match: str | None = Header(default=None),
+    subject: User = Depends(registered_user_identity),
+    github_svc: GitHubService = Depends(),
+) -> Response:
+    """Serve a user's GitHub avatar from the CSXL's avatar cache.
+
+    Avatars are only served to registered users, so that which users have linked GitHub cannot be
+    enumerated by ID. Clients fetch the avatar with their bearer token and display it as a blob.
+    """
+    avatar = github_svc.get_avatar(id)
+    if avatar is None:
+        raise HTTPException(status_code=404, detail="Avatar not found.")
+
+    headers = {"ETag": avatar.etag, "Cache-Control": "private, max-age=3600"}
+    if if_none_match == avatar.etag:
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=avatar.content, media_type=avatar.media_type, headers=headers
+    )
@@ -1,6 +1,7 @@
 """SQLAlchemy DB Engine and Session niceties for FastAPI dependency injection."""
 
 import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session
 from .env import getenv
 
@@ -9,9 +10,10 @@ __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
 
-def _engine_str(database=getenv("POSTGRES_DATABASE")) -> str:
+def _engine_str(
+    database=getenv("POSTGRES_DATABASE"), dialect: str = "postgresql+psycopg2"
+) -> str:
     """Helper function for reading settings from environment variables to produce connection string."""
-    dialect = "postgresql+psycopg2"
     user = getenv("POSTGRES_USER")
     password = getenv("POSTGRES_PASSWORD")
     host = getenv("POSTGRES_HOST")
@@ -19,9 +21,92 @@ def _engine_str(database=getenv("POSTGRES_DATABASE")) -> str:
     return f"{dialect}://{user}:{password}@{host}:{port}/{database}"
 
 
-engine = sqlalchemy.create_engine(_engine_str(), echo=True)
+def _engine_options() -> dict:
+    """Helper function for reading engine settings from environment variables.
+
+    Each setting is optional:
+
+    - `POSTGRES_POOL_SIZE`: connections kept open in the pool (5)
+    - `POSTGRES_MAX_OVERFLOW`: connections opened beyond the pool size under load (10)
+    - `POSTGRES_POOL_TIMEOUT`: seconds to wait for a connection before failing (30)
+    - `POSTGRES_POOL_PRE_PING`: test connections before use, replacing dropped ones (true)
+    - `POSTGRES_POOL_RECYCLE`: seconds after which connections are replaced, or -1 (1800)
+    - `POSTGRES_STATEMENT_TIMEOUT`: milliseconds after which the database cancels a
+      statement, or 0 for no limit (30000)
+    - `POSTGRES_IDLE_IN_TRANSACTION_SESSION_TIMEOUT`: milliseconds after which the database
+      closes a connection idle in a transaction, or 0 for no limit (60000)
+    - `POSTGRES_ECHO`: log every statement; only honored when `MODE` is development (true)
+    """
+    statement_timeout = int(getenv("POSTGRES_STATEMENT_TIMEOUT", "30000"))
+    idle_timeout = int(getenv("POSTGRES_IDLE_IN_TRANSACTION_SESSION_TIMEOUT", "60000"))
+    return {
+        "pool_size": int(getenv("POSTGRES_POOL_SIZE", "5")),
+        "max_overflow": int(getenv("POSTGRES_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(getenv("POSTGRES_POOL_TIMEOUT", "30")),
+        "pool_pre_ping": _flag(getenv("POSTGRES_POOL_PRE_PING", "true")),
+        "pool_recycle": int(getenv("POSTGRES_POOL_RECYCLE", "1800")),
+        "echo": getenv("MODE", "") == "development"
+        and _flag(getenv("POSTGRES_ECHO", "true")),
+        "connect_args": {
+            "options": f"-c statement_timeout={statement_timeout} "
+            f"-c idle_in_transaction_session_timeout={idle_timeout}"
+        },
+    }
+
+
+def _async_engine_options() -> dict:
+    """Helper function for reading async engine settings from environment variables.
+
+    The settings are those of `_engine_options`, with the timeouts passed as asyncpg server
+    settings rather than psycopg2 connection options."""
+    options = _engine_options()
+    options["connect_args"] = {
+        "server_settings": {
+            "statement_timeout": getenv("POSTGRES_STATEMENT_TIMEOUT", "30000"),
+            "idle_in_transaction_session_timeout": getenv(
+                "POSTGRES_IDLE_IN_TRANSACTION_SESSION_TIMEOUT", "60000"
+            ),
+        }
+    }
+    return options
+
+
+def _flag(value: str) -> bool:
+    """Helper function for reading a boolean setting."""
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _replica_engine_str() -> str:
+    """Helper function for reading the connection string of the read replica.
+
+    The replica is configured by the optional `POSTGRES_REPLICA_URL` setting. When it is unset,
+    reads fall back to the primary database."""
+    return getenv("POSTGRES_REPLICA_URL", "") or _engine_str()
+
+
+def _read_engine(url: str) -> sqlalchemy.Engine:
+    """Helper function for creating an engine whose connections only run read-only transactions.
+
+    Read-only transactions are enforced even when reads fall back to the primary, so a service
+    which writes through a read session fails the same way with or without a replica."""
+    if url == _engine_str():
+        primary = engine
+    else:
+        primary = sqlalchemy.create_engine(url, **_engine_options())
+    return primary.execution_options(postgresql_readonly=True)
+
+
+engine = sqlalchemy.create_engine(_engine_str(), **_engine_options())
 """Application-level SQLAlchemy database engine."""
 
+async_engine = create_async_engine(
+    _engine_str(dialect="postgresql+asyncpg"), **_async_engine_options()
+)
+"""Application-level SQLAlchemy database engine for async routes, connecting with asyncpg."""
+
+read_engine = _read_engine(_replica_engine_str())
+"""Application-level SQLAlchemy database engine for read-only queries, using the replica if any."""
+
 
 def db_session():
     """Generator function offering dependency injection of SQLAlchemy Sessions."""
@@ -30,3 +115,31 @@ def db_session():
         yield session
     finally:
         session.close()
+
+
+def db_read_session():
+    """Generator function offering dependency injection of read-only SQLAlchemy Sessions.
+
+    Services whose queries tolerate replication lag opt into the replica with this dependency,
+    such as those serving reference data and uncached listings and searches. Reads which must
+    observe the request's own writes, or whose results are cached, remain on `db_session`.
+    """
+    session = Session(read_engine)
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+async def db_async_session():
+    """Async generator function offering dependency injection of SQLAlchemy AsyncSessions.
+
+    Async routes do not take a thread from the threadpool, and wait on the database without
+    blocking. Services written against `Session` are run through `AsyncSession.run_sync`, which
+    passes them a `Session` whose queries are made over the async connection, so sync and async
+    routes share one implementation while routes are migrated."""
+    session = AsyncSession(async_engine)
+    try:
+        yield session
+    finally:
+        await session.close()
@@ -1,6 +1,6 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Equipment checkouts."""
 from datetime import datetime
-from sqlalchemy import Boolean, Integer, String, ARRAY, DateTime
+from sqlalchemy import Boolean, Integer, String, ARRAY, DateTime, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Self
 
@@ -20,6 +20,34 @@ class EquipmentCheckoutEntity(EntityBase):
     # Name for the equipment checkout table in the PostgreSQL database
 
     __tablename__ = "equipment_checkouts"
+    # An equipment item may only have one active checkout at a time (see migration c2f8d4a6e1b9)
+    __table_args__ = (
+        Index(
+            "ix_equipment_checkouts_active_equipment_id",
+            "equipment_id",
+            unique=True,
+            postgresql_where=text("is_active"),
+        ),
+        # Serves checks for a user's active checkout of a type of equipment
+        Index(
+            "ix_equipment_checkouts_active_pid_model",
+            "pid",
+            "model",
+            postgresql_where=text("is_active"),
+        ),
+        # Serves scans for active checkouts which have been out longer than a loan period
+        Index(
+            "ix_equipment_checkouts_active_started_at",
+            "started_at",
+            postgresql_where=text("is_active"),
+        ),
+        # Serves utilization of an item over a window of time
+        Index(
+            "ix_equipment_checkouts_equipment_id_started_at",
+            "equipment_id",
+            "started_at",
+        ),
+    )
 
     # Unique ID for the equipment checkout entry
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -41,6 +69,10 @@ class EquipmentCheckoutEntity(EntityBase):
     end_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.now, nullable=False
     )
+    # DateTime the checkout was created or last changed, for feeds of changes since a time
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, onupdate=datetime.now, index=True
+    )
 
     @classmethod
     def from_model(cls, model: EquipmentCheckout) -> Self:
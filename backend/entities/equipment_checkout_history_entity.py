@@ -0,0 +1,74 @@
+"""Definition of SQLAlchemy table-backed object mapping entity for the checkout history of Equipment."""
+
+from datetime import datetime
+from sqlalchemy import DateTime, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from typing import Self
+
+from backend.models.equipment_history import EquipmentCheckoutHistory
+from .entity_base import EntityBase
+
+__authors__ = ["Jacob Brown, Nicholas Mountain"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class EquipmentCheckoutHistoryEntity(EntityBase):
+    """Serves as the database model schema defining the shape of the `Equipment Checkout History` table
+
+    Rows are only ever appended, one per checkout of an equipment item."""
+
+    # Name for the equipment checkout history table in the PostgreSQL database
+    __tablename__ = "equipment_checkout_history"
+    # Serves paging through the history of an item, newest first
+    __table_args__ = (
+        Index(
+            "ix_equipment_checkout_history_equipment_id_time",
+            "equipment_id",
+            "checked_out_at",
+            "id",
+        ),
+    )
+
+    # Unique ID for the history entry
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # Equipment ID of the item that was checked out
+    equipment_id: Mapped[int] = mapped_column(
+        ForeignKey("equipment.equipment_id", ondelete="CASCADE")
+    )
+    # PID of the student who checked out the item
+    pid: Mapped[int] = mapped_column(Integer)
+    # DateTime the item was checked out
+    checked_out_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, nullable=False
+    )
+
+    @classmethod
+    def from_model(cls, model: EquipmentCheckoutHistory) -> Self:
+        """
+        Create an EquipmentCheckoutHistoryEntity from an EquipmentCheckoutHistory model.
+
+        Args:
+            model (EquipmentCheckoutHistory): The model to create the entity from.
+
+        Returns:
+            Self: The entity (not yet persisted).
+        """
+        return cls(
+            equipment_id=model.equipment_id,
+            pid=model.pid,
+            checked_out_at=model.checked_out_at,
+        )
+
+    def to_model(self) -> EquipmentCheckoutHistory:
+        """
+        Create an EquipmentCheckoutHistory model from an EquipmentCheckoutHistoryEntity.
+
+        Returns:
+            EquipmentCheckoutHistory: An EquipmentCheckoutHistory model for API usage.
+        """
+        return EquipmentCheckoutHistory(
+            equipment_id=self.equipment_id,
+            pid=self.pid,
+            checked_out_at=self.checked_out_at,
+        )
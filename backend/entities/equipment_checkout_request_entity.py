@@ -1,8 +1,9 @@
 """Definition of SQLAlchemy table-backed object mapping entity for equipment checkout requests. """
 
 
+from datetime import datetime
 from typing import Self
-from sqlalchemy import Integer, String
+from sqlalchemy import DateTime, Index, Integer, String
 from .entity_base import EntityBase
 from sqlalchemy.orm import Mapped, mapped_column
 from backend.models.equipment_checkout_request import EquipmentCheckoutRequest
@@ -12,6 +13,12 @@ class EquipmentCheckoutRequestEntity(EntityBase):
     # Name for the equipment checkout request table in the PostgreSQL database
 
     __tablename__ = "equipment_checkout_requests"
+    # A user may only have one request for each type of equipment, which the unique
+    # index on (pid, model) enforces and also serves duplicate checks by user (see migration
+    # e5a1b7c3d9f2)
+    __table_args__ = (
+        Index("ix_equipment_checkout_requests_pid_model", "pid", "model", unique=True),
+    )
 
     # Unique ID for the equipment checkout request entry
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -21,6 +28,10 @@ class EquipmentCheckoutRequestEntity(EntityBase):
     model: Mapped[str] = mapped_column(String(64))
     # PID of the user that is requesting a checkout
     pid: Mapped[int] = mapped_column(Integer)
+    # DateTime the checkout request was created or last changed, for feeds of changes since a time
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, onupdate=datetime.now, index=True
+    )
 
     @classmethod
     def from_model(cls, model: EquipmentCheckoutRequest) -> Self:
@@ -0,0 +1,75 @@
+"""Definition of SQLAlchemy table-backed object mapping entity for condition notes on Equipment."""
+
+from datetime import datetime
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from typing import Self
+
+from backend.models.equipment_history import EquipmentConditionNote
+from .entity_base import EntityBase
+
+__authors__ = ["Jacob Brown, Nicholas Mountain"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class EquipmentConditionNoteEntity(EntityBase):
+    """Serves as the database model schema defining the shape of the `Equipment Condition Note` table
+
+    Rows are only ever appended, as the condition of an item changes throughout checkouts.
+    """
+
+    # Name for the equipment condition note table in the PostgreSQL database
+    __tablename__ = "equipment_condition_notes"
+    # Serves paging through the notes on an item, newest first
+    __table_args__ = (
+        Index(
+            "ix_equipment_condition_notes_equipment_id_time",
+            "equipment_id",
+            "created_at",
+            "id",
+        ),
+    )
+
+    # Unique ID for the note
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # Equipment ID of the item the note is about
+    equipment_id: Mapped[int] = mapped_column(
+        ForeignKey("equipment.equipment_id", ondelete="CASCADE")
+    )
+    # Note on the condition of the item
+    note: Mapped[str] = mapped_column(String)
+    # DateTime the note was made
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, nullable=False
+    )
+
+    @classmethod
+    def from_model(cls, model: EquipmentConditionNote) -> Self:
+        """
+        Create an EquipmentConditionNoteEntity from an EquipmentConditionNote model.
+
+        Args:
+            model (EquipmentConditionNote): The model to create the entity from.
+
+        Returns:
+            Self: The entity (not yet persisted).
+        """
+        return cls(
+            equipment_id=model.equipment_id,
+            note=model.note,
+            created_at=model.created_at or datetime.now(),
+        )
+
+    def to_model(self) -> EquipmentConditionNote:
+        """
+        Create an EquipmentConditionNote model from an EquipmentConditionNoteEntity.
+
+        Returns:
+            EquipmentConditionNote: An EquipmentConditionNote model for API usage.
+        """
+        return EquipmentConditionNote(
+            equipment_id=self.equipment_id,
+            note=self.note,
+            created_at=self.created_at,
+        )
@@ -1,6 +1,6 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Equipment."""
 
-from sqlalchemy import Boolean, Integer, String, ARRAY
+from sqlalchemy import Boolean, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Self
 
@@ -19,6 +19,10 @@ class EquipmentEntity(EntityBase):
     # Name for the equipment table in the PostgreSQL database
 
     __tablename__ = "equipment"
+    # Serves inventory queries filtering on, or ordered by, the model of equipment
+    __table_args__ = (
+        Index("ix_equipment_model_equipment_id", "model", "equipment_id"),
+    )
 
     # Unique ID for the equipment entry
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -29,17 +33,12 @@ class EquipmentEntity(EntityBase):
     # Image to represent the item
     equipment_image: Mapped[str] = mapped_column(String)
     # Shows if item is currently checked out
-    is_checked_out: Mapped[bool] = mapped_column(Boolean)
+    is_checked_out: Mapped[bool] = mapped_column(Boolean, index=True)
     # Shows the current condition of the item
     condition: Mapped[int] = mapped_column(Integer)
-    # Notes on how the condition of the item has changed throughout checkouts
-    condition_notes: Mapped[list[str]] = mapped_column(
-        ARRAY(String), nullable=True, default=None
-    )
-    # List of the PIDs of students who have checkout out this item
-    checkout_history: Mapped[list[int]] = mapped_column(
-        ARRAY(Integer), nullable=True, default=None
-    )
+    # Notes on how the condition of the item has changed throughout checkouts, and the PIDs of
+    # students who have checked out the item, are kept in the `equipment_condition_notes` and
+    # `equipment_checkout_history` tables so that equipment rows stay small
 
     @classmethod
     def from_model(cls, model: Equipment) -> Self:
@@ -58,8 +57,6 @@ class EquipmentEntity(EntityBase):
             equipment_image=model.equipment_image,
             is_checked_out=model.is_checked_out,
             condition=model.condition,
-            condition_notes=model.condition_notes,
-            checkout_history=model.checkout_history,
         )
 
     def to_model(self) -> Equipment:
@@ -75,8 +72,6 @@ class EquipmentEntity(EntityBase):
             equipment_image=self.equipment_image,
             is_checked_out=self.is_checked_out,
             condition=self.condition,
-            condition_notes=self.condition_notes,
-            checkout_history=self.checkout_history,
         )
 
     def update(self, model: Equipment) -> None:
@@ -98,5 +93,3 @@ class EquipmentEntity(EntityBase):
         self.equipment_image = model.equipment_image
         self.is_checked_out = model.is_checked_out
         self.condition = model.condition
-        self.condition_notes = model.condition_notes
-        self.checkout_history = model.checkout_history
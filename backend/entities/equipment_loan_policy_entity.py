@@ -0,0 +1,47 @@
+"""Definition of SQLAlchemy table-backed object mapping entity for Equipment loan policies."""
+
+from datetime import timedelta
+from sqlalchemy import Interval, String
+from sqlalchemy.orm import Mapped, mapped_column
+from typing import Self
+
+from backend.models.equipment_overdue import EquipmentLoanPolicy
+from .entity_base import EntityBase
+
+__authors__ = ["Jacob Brown, Nicholas Mountain"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class EquipmentLoanPolicyEntity(EntityBase):
+    """Serves as the database model schema defining the shape of the `Equipment Loan Policy` table"""
+
+    # Name for the equipment loan policy table in the PostgreSQL database
+    __tablename__ = "equipment_loan_policies"
+
+    # Name of the model of equipment the policy applies to ex. Meta Quest 3
+    model: Mapped[str] = mapped_column(String(64), primary_key=True)
+    # How long an item of the model may be checked out before it is overdue
+    loan_period: Mapped[timedelta] = mapped_column(Interval, nullable=False)
+
+    @classmethod
+    def from_model(cls, model: EquipmentLoanPolicy) -> Self:
+        """
+        Create an EquipmentLoanPolicyEntity from an EquipmentLoanPolicy model.
+
+        Args:
+            model (EquipmentLoanPolicy): The model to create the entity from.
+
+        Returns:
+            Self: The entity (not yet persisted).
+        """
+        return cls(model=model.model, loan_period=model.loan_period)
+
+    def to_model(self) -> EquipmentLoanPolicy:
+        """
+        Create an EquipmentLoanPolicy model from an EquipmentLoanPolicyEntity.
+
+        Returns:
+            EquipmentLoanPolicy: An EquipmentLoanPolicy model for API usage.
+        """
+        return EquipmentLoanPolicy(model=self.model, loan_period=self.loan_period)
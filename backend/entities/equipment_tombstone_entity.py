@@ -0,0 +1,34 @@
+"""Definition of SQLAlchemy table-backed object mapping entity for deleted equipment checkout requests."""
+
+from datetime import datetime
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .entity_base import EntityBase
+
+__authors__ = ["Jacob Brown, Nicholas Mountain"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class EquipmentTombstoneEntity(EntityBase):
+    """Serves as the database model schema defining the shape of the `Equipment Tombstone` table
+
+    A tombstone records the deletion of a checkout request or staged checkout request, so that
+    feeds of changes can report deletions. Tombstones are kept for a limited time."""
+
+    # Name for the equipment tombstone table in the PostgreSQL database
+    __tablename__ = "equipment_tombstones"
+
+    # Unique ID for the tombstone
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # Name of the table the row was deleted from
+    table_name: Mapped[str] = mapped_column(String(64))
+    # PID of the user whose request was deleted
+    pid: Mapped[int] = mapped_column(Integer)
+    # Name of the model of equipment that was requested
+    model: Mapped[str] = mapped_column(String(64))
+    # DateTime the row was deleted
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, nullable=False, index=True
+    )
@@ -1,6 +1,7 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Events."""
 
-from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from ..models.event_details import EventDetails
 from .entity_base import EntityBase
@@ -18,6 +19,12 @@ class EventEntity(EntityBase):
 
     # Name for the events table in the PostgreSQL database
     __tablename__ = "event"
+    # Serves feeds of events within a window of time, paged in order of (time, id)
+    __table_args__ = (
+        Index("ix_event_time_id", "time", "id"),
+        # Serves full-text search of events
+        Index("ix_event_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     # Event properties (columns in the database table)
 
@@ -33,6 +40,27 @@ class EventEntity(EntityBase):
     description: Mapped[str] = mapped_column(String)
     # Whether the event is public or not
     public: Mapped[bool] = mapped_column(Boolean)
+    # Maximum number of RSVPs to the event, or None if unlimited
+    capacity: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Number of RSVPs to the event, maintained by `EventService` as RSVPs are made and cancelled
+    rsvp_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    # DateTime the event was created or its details last changed, which RSVPs do not change
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, nullable=False
+    )
+    # Words of the event's name, location, and description, generated by the database for search
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(location, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'C')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     # Organization hosting the event
     # NOTE: This defines a one-to-many relationship between the organization and events tables.
@@ -57,6 +85,7 @@ class EventEntity(EntityBase):
             description=model.description,
             public=model.public,
             organization_id=model.organization_id,
+            capacity=model.capacity,
         )
 
     def to_model(self) -> Event:
@@ -74,6 +103,8 @@ class EventEntity(EntityBase):
             description=self.description,
             public=self.public,
             organization_id=self.organization_id,
+            capacity=self.capacity,
+            rsvp_count=self.rsvp_count,
         )
 
     @classmethod
@@ -94,6 +125,7 @@ class EventEntity(EntityBase):
             description=model.description,
             public=model.public,
             organization_id=model.organization_id,
+            capacity=model.capacity,
         )
 
     def to_details_model(self) -> EventDetails:
@@ -110,5 +142,7 @@ class EventEntity(EntityBase):
             description=self.description,
             public=self.public,
             organization_id=self.organization_id,
+            capacity=self.capacity,
+            rsvp_count=self.rsvp_count,
             organization=self.organization.to_model(),
         )
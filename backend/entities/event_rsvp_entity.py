@@ -0,0 +1,36 @@
+"""Definition of SQLAlchemy table-backed object mapping entity for Event RSVPs."""
+
+from datetime import datetime
+from sqlalchemy import DateTime, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .entity_base import EntityBase
+
+__authors__ = ["Ajay Gandecha", "Jade Keegan", "Brianna Ta", "Audrey Toney"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class EventRsvpEntity(EntityBase):
+    """Serves as the database model schema defining the shape of the `Event RSVP` table
+
+    Each user may RSVP to an event once, as enforced by the primary key. The number of RSVPs to
+    an event is kept on the event's `rsvp_count` rather than counted from this table."""
+
+    # Name for the event RSVP table in the PostgreSQL database
+    __tablename__ = "event_rsvp"
+    # Serves the events a user has RSVP'd to
+    __table_args__ = (Index("ix_event_rsvp_user_id", "user_id"),)
+
+    # Event the user RSVP'd to
+    event_id: Mapped[int] = mapped_column(
+        ForeignKey("event.id", ondelete="CASCADE"), primary_key=True
+    )
+    # User who RSVP'd
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), primary_key=True
+    )
+    # When the user RSVP'd
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.now
+    )
@@ -1,6 +1,7 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Organizations."""
 
-from sqlalchemy import Integer, String, Boolean
+from sqlalchemy import Integer, String, Boolean, Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from .entity_base import EntityBase
 from typing import Self
@@ -17,6 +18,10 @@ class OrganizationEntity(EntityBase):
 
     # Name for the organizations table in the PostgreSQL database
     __tablename__ = "organization"
+    # Serves full-text search of organizations
+    __table_args__ = (
+        Index("ix_organization_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     # Organization properties (columns in the database table)
 
@@ -48,6 +53,17 @@ class OrganizationEntity(EntityBase):
     heel_life: Mapped[str] = mapped_column(String)
     # Whether the organization can be joined by anyone or not
     public: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    # Words of the organization's names and short description, generated by the database for search
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(shorthand, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(short_description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     # NOTE: This field establishes a one-to-many relationship between the organizations and events table.
     events: Mapped[list["EventEntity"]] = relationship(
@@ -2,7 +2,8 @@
 
 from backend.entities.entity_base import EntityBase
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import String, Integer, ARRAY
+from sqlalchemy import String, Integer, ARRAY, DateTime, Index
+from datetime import datetime
 from typing import Self
 
 from backend.models.StagedCheckoutRequest import StagedCheckoutRequest
@@ -10,6 +11,12 @@ from backend.models.StagedCheckoutRequest import StagedCheckoutRequest
 
 class StagedCheckoutRequestEntity(EntityBase):
     __tablename__ = "staged_checkout_requests"
+    # A user may only have one request for each type of equipment, which the unique
+    # index on (pid, model) enforces and also serves duplicate checks by user (see migration
+    # e5a1b7c3d9f2)
+    __table_args__ = (
+        Index("ix_staged_checkout_requests_pid_model", "pid", "model", unique=True),
+    )
 
     # The id of the staged checkout request.
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -23,6 +30,10 @@ class StagedCheckoutRequestEntity(EntityBase):
     id_choices: Mapped[list[int]] = mapped_column(
         ARRAY(Integer), nullable=True, default=[]
     )
+    # DateTime the staged request was created or last changed, for feeds of changes since a time
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, onupdate=datetime.now, index=True
+    )
 
     @classmethod
     def from_model(cls, model: StagedCheckoutRequest) -> Self:
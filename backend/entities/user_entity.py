@@ -1,7 +1,7 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Users."""
 
 
-from sqlalchemy import Integer, String, Boolean
+from sqlalchemy import Index, Integer, String, Boolean
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Self
 from .entity_base import EntityBase
@@ -20,6 +20,13 @@ class UserEntity(EntityBase):
 
     # Name for the user table in the PostgreSQL database
     __tablename__ = "user"
+    # Indexes serving keyset pagination of users ordered by name (see UserService.list)
+    __table_args__ = (
+        Index("ix_user_first_name_id", "first_name", "id"),
+        Index("ix_user_last_name_id", "last_name", "id"),
+    )
+    # Note: first_name, last_name, onyen, and email also have GIN trigram indexes for user search.
+    # They require the pg_trgm extension, so they are created by migration 6ab1c2e0f3d4 only.
 
     # Unique ID for the user entry
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
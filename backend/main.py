@@ -11,13 +11,19 @@ from .api import (
     static_files,
     profile,
     authentication,
+    snapshots,
     user,
 )
 from .api.equipment import checkout
 from .api.coworking import status, reservation, ambassador
 from .api.admin import users as admin_users
 from .api.admin import roles as admin_roles
+from .api.admin import exports as admin_exports
+from .database import async_engine
 from .services.exceptions import UserPermissionException, ResourceNotFoundException
+from .services.equipment_overdue import overdue_checkout_scanner
+from .services.github import github_link_jobs
+from .services.snapshot import snapshot_builder
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -42,7 +48,9 @@ app = FastAPI(
         health.openapi_tags,
         admin_users.openapi_tags,
         admin_roles.openapi_tags,
+        admin_exports.openapi_tags,
         checkout.openapi_tags,
+        snapshots.openapi_tags,
     ],
 )
 
@@ -59,12 +67,49 @@ feature_apis = [
     authentication,
     admin_users,
     admin_roles,
+    admin_exports,
     checkout,
+    snapshots,
 ]
 
 for feature_api in feature_apis:
     app.include_router(feature_api.api)
 
+
+# Scan for overdue equipment checkouts in the background while the application is running
+@app.on_event("startup")
+def start_overdue_checkout_scanner():
+    overdue_checkout_scanner().start()
+
+
+@app.on_event("shutdown")
+def stop_overdue_checkout_scanner():
+    overdue_checkout_scanner().stop()
+
+
+# Rebuild the static snapshots of public data in the background while the application is running
+@app.on_event("startup")
+def start_snapshot_builder():
+    snapshot_builder().start()
+
+
+@app.on_event("shutdown")
+def stop_snapshot_builder():
+    snapshot_builder().stop()
+
+
+# Wait for GitHub account linking jobs in progress to complete before shutting down
+@app.on_event("shutdown")
+def stop_github_link_jobs():
+    github_link_jobs().shutdown()
+
+
+# Close the async engine's connections, which belong to the application's event loop
+@app.on_event("shutdown")
+async def dispose_async_engine():
+    await async_engine.dispose()
+
+
 # Static file mount used for serving Angular front-end in production, as well as static assets
 app.mount("/", static_files.StaticFileMiddleware(directory="./static"))
 
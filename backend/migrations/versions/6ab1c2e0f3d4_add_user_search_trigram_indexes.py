@@ -0,0 +1,35 @@
+"""Add trigram indexes for user search
+
+Revision ID: 6ab1c2e0f3d4
+Revises: 63fc48273e15
+Create Date: 2023-10-30 10:12:41.208315
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "6ab1c2e0f3d4"
+down_revision = "63fc48273e15"
+branch_labels = None
+depends_on = None
+
+SEARCH_COLUMNS = ["first_name", "last_name", "onyen", "email"]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in SEARCH_COLUMNS:
+        op.create_index(
+            f"ix_user_{column}_trgm",
+            "user",
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for column in SEARCH_COLUMNS:
+        op.drop_index(f"ix_user_{column}_trgm", table_name="user")
@@ -0,0 +1,26 @@
+"""Add indexes for paginating users by name
+
+Revision ID: 9d2e7a41c5b8
+Revises: 6ab1c2e0f3d4
+Create Date: 2023-10-31 14:05:19.773210
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "9d2e7a41c5b8"
+down_revision = "6ab1c2e0f3d4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_user_first_name_id", "user", ["first_name", "id"])
+    op.create_index("ix_user_last_name_id", "user", ["last_name", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_last_name_id", table_name="user")
+    op.drop_index("ix_user_first_name_id", table_name="user")
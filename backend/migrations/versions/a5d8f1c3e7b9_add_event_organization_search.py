@@ -0,0 +1,65 @@
+"""Add full-text search vectors to events and organizations
+
+Revision ID: a5d8f1c3e7b9
+Revises: f2c6a8e4d9b1
+Create Date: 2023-11-08 11:20:37.640918
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "a5d8f1c3e7b9"
+down_revision = "f2c6a8e4d9b1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "event",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(location, '')), 'B') || "
+                "setweight(to_tsvector('english', coalesce(description, '')), 'C')",
+                persisted=True,
+            ),
+        ),
+    )
+    op.create_index(
+        "ix_event_search_vector",
+        "event",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    op.add_column(
+        "organization",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(shorthand, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(short_description, '')), 'B')",
+                persisted=True,
+            ),
+        ),
+    )
+    op.create_index(
+        "ix_organization_search_vector",
+        "organization",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_organization_search_vector", table_name="organization")
+    op.drop_column("organization", "search_vector")
+    op.drop_index("ix_event_search_vector", table_name="event")
+    op.drop_column("event", "search_vector")
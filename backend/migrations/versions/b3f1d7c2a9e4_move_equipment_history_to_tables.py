@@ -0,0 +1,133 @@
+"""Move equipment checkout history and condition notes out of arrays into tables
+
+The equipment tables were originally created outside of migrations, so this revision only
+migrates existing equipment data when the equipment table exists.
+
+Revision ID: b3f1d7c2a9e4
+Revises: 9d2e7a41c5b8
+Create Date: 2023-11-02 10:41:52.318940
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b3f1d7c2a9e4"
+down_revision = "9d2e7a41c5b8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("equipment"):
+        return
+
+    op.create_table(
+        "equipment_checkout_history",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("equipment_id", sa.Integer(), nullable=False),
+        sa.Column("pid", sa.Integer(), nullable=False),
+        sa.Column("checked_out_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["equipment_id"], ["equipment.equipment_id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_equipment_checkout_history_equipment_id_time",
+        "equipment_checkout_history",
+        ["equipment_id", "checked_out_at", "id"],
+    )
+    op.create_table(
+        "equipment_condition_notes",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("equipment_id", sa.Integer(), nullable=False),
+        sa.Column("note", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["equipment_id"], ["equipment.equipment_id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_equipment_condition_notes_equipment_id_time",
+        "equipment_condition_notes",
+        ["equipment_id", "created_at", "id"],
+    )
+
+    # The arrays do not record when entries were made, so backfilled entries are dated now and
+    # keep their order through their ids.
+    op.execute(
+        """
+        INSERT INTO equipment_checkout_history (equipment_id, pid, checked_out_at)
+        SELECT equipment.equipment_id, history.pid, now()
+        FROM equipment,
+             unnest(equipment.checkout_history) WITH ORDINALITY AS history(pid, position)
+        ORDER BY equipment.equipment_id, history.position
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO equipment_condition_notes (equipment_id, note, created_at)
+        SELECT equipment.equipment_id, notes.note, now()
+        FROM equipment,
+             unnest(equipment.condition_notes) WITH ORDINALITY AS notes(note, position)
+        ORDER BY equipment.equipment_id, notes.position
+        """
+    )
+
+    op.drop_column("equipment", "checkout_history")
+    op.drop_column("equipment", "condition_notes")
+
+    if sa.inspect(op.get_bind()).has_table("equipment_checkouts"):
+        op.create_index(
+            "ix_equipment_checkouts_equipment_id_started_at",
+            "equipment_checkouts",
+            ["equipment_id", "started_at"],
+        )
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("equipment"):
+        return
+
+    op.add_column(
+        "equipment",
+        sa.Column("condition_notes", sa.ARRAY(sa.String()), nullable=True),
+    )
+    op.add_column(
+        "equipment",
+        sa.Column("checkout_history", sa.ARRAY(sa.Integer()), nullable=True),
+    )
+    op.execute(
+        """
+        UPDATE equipment
+        SET checkout_history = (
+                SELECT array_agg(pid ORDER BY checked_out_at, id)
+                FROM equipment_checkout_history
+                WHERE equipment_checkout_history.equipment_id = equipment.equipment_id
+            ),
+            condition_notes = (
+                SELECT array_agg(note ORDER BY created_at, id)
+                FROM equipment_condition_notes
+                WHERE equipment_condition_notes.equipment_id = equipment.equipment_id
+            )
+        """
+    )
+
+    if sa.inspect(op.get_bind()).has_table("equipment_checkouts"):
+        op.drop_index(
+            "ix_equipment_checkouts_equipment_id_started_at",
+            table_name="equipment_checkouts",
+        )
+    op.drop_index(
+        "ix_equipment_condition_notes_equipment_id_time",
+        table_name="equipment_condition_notes",
+    )
+    op.drop_table("equipment_condition_notes")
+    op.drop_index(
+        "ix_equipment_checkout_history_equipment_id_time",
+        table_name="equipment_checkout_history",
+    )
+    op.drop_table("equipment_checkout_history")
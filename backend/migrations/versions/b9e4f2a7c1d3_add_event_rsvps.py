@@ -0,0 +1,41 @@
+"""Add RSVPs to events, with optional capacities and counts of RSVPs
+
+Revision ID: b9e4f2a7c1d3
+Revises: a5d8f1c3e7b9
+Create Date: 2023-11-09 10:04:51.218304
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b9e4f2a7c1d3"
+down_revision = "a5d8f1c3e7b9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("event", sa.Column("capacity", sa.Integer(), nullable=True))
+    op.add_column(
+        "event",
+        sa.Column("rsvp_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_table(
+        "event_rsvp",
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["event_id"], ["event.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("event_id", "user_id"),
+    )
+    op.create_index("ix_event_rsvp_user_id", "event_rsvp", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_rsvp_user_id", table_name="event_rsvp")
+    op.drop_table("event_rsvp")
+    op.drop_column("event", "rsvp_count")
+    op.drop_column("event", "capacity")
@@ -0,0 +1,68 @@
+"""Allow only one active checkout of each equipment item, and index active checkouts by user
+
+The unique partial index is what makes checking out an item atomic, so that two ambassadors
+cannot check out the same item at once. Any items already checked out more than once keep only
+their most recent active checkout, and the others are ended.
+
+Like b3f1d7c2a9e4, this revision only changes the equipment tables when they exist.
+
+Revision ID: c2f8d4a6e1b9
+Revises: b9e4f2a7c1d3
+Create Date: 2023-11-10 09:21:37.604518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c2f8d4a6e1b9"
+down_revision = "b9e4f2a7c1d3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("equipment_checkouts"):
+        return
+
+    op.execute(
+        """
+        UPDATE equipment_checkouts
+        SET is_active = false, end_at = LOCALTIMESTAMP, updated_at = LOCALTIMESTAMP
+        FROM (
+            SELECT id, row_number() OVER (
+                PARTITION BY equipment_id ORDER BY started_at DESC, id DESC
+            ) AS position
+            FROM equipment_checkouts
+            WHERE is_active
+        ) AS active
+        WHERE equipment_checkouts.id = active.id AND active.position > 1
+        """
+    )
+
+    op.create_index(
+        "ix_equipment_checkouts_active_equipment_id",
+        "equipment_checkouts",
+        ["equipment_id"],
+        unique=True,
+        postgresql_where=sa.text("is_active"),
+    )
+    op.create_index(
+        "ix_equipment_checkouts_active_pid_model",
+        "equipment_checkouts",
+        ["pid", "model"],
+        postgresql_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("equipment_checkouts"):
+        return
+
+    op.drop_index(
+        "ix_equipment_checkouts_active_pid_model", table_name="equipment_checkouts"
+    )
+    op.drop_index(
+        "ix_equipment_checkouts_active_equipment_id", table_name="equipment_checkouts"
+    )
@@ -0,0 +1,46 @@
+"""Add equipment loan policies and an index for scanning for overdue checkouts
+
+Like b3f1d7c2a9e4, this revision only changes the equipment tables when they exist.
+
+Revision ID: c8e4a1f6b2d7
+Revises: b3f1d7c2a9e4
+Create Date: 2023-11-03 09:12:40.552716
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c8e4a1f6b2d7"
+down_revision = "b3f1d7c2a9e4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("equipment_checkouts"):
+        return
+
+    op.create_table(
+        "equipment_loan_policies",
+        sa.Column("model", sa.String(length=64), nullable=False),
+        sa.Column("loan_period", sa.Interval(), nullable=False),
+        sa.PrimaryKeyConstraint("model"),
+    )
+    op.create_index(
+        "ix_equipment_checkouts_active_started_at",
+        "equipment_checkouts",
+        ["started_at"],
+        postgresql_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("equipment_checkouts"):
+        return
+
+    op.drop_index(
+        "ix_equipment_checkouts_active_started_at", table_name="equipment_checkouts"
+    )
+    op.drop_table("equipment_loan_policies")
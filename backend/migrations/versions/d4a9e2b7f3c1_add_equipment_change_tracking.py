@@ -0,0 +1,68 @@
+"""Track changes to equipment checkout requests, staged requests, and checkouts
+
+Like b3f1d7c2a9e4, this revision only changes the equipment tables when they exist.
+
+Revision ID: d4a9e2b7f3c1
+Revises: c8e4a1f6b2d7
+Create Date: 2023-11-06 15:27:03.904112
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d4a9e2b7f3c1"
+down_revision = "c8e4a1f6b2d7"
+branch_labels = None
+depends_on = None
+
+tables = [
+    "equipment_checkout_requests",
+    "staged_checkout_requests",
+    "equipment_checkouts",
+]
+
+
+def upgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("equipment_checkouts"):
+        return
+
+    for table in tables:
+        op.add_column(
+            table,
+            sa.Column(
+                "updated_at",
+                sa.DateTime(),
+                nullable=False,
+                server_default=sa.func.now(),
+            ),
+        )
+        op.alter_column(table, "updated_at", server_default=None)
+        op.create_index(f"ix_{table}_updated_at", table, ["updated_at"])
+
+    op.create_table(
+        "equipment_tombstones",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("table_name", sa.String(length=64), nullable=False),
+        sa.Column("pid", sa.Integer(), nullable=False),
+        sa.Column("model", sa.String(length=64), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_equipment_tombstones_deleted_at", "equipment_tombstones", ["deleted_at"]
+    )
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("equipment_checkouts"):
+        return
+
+    op.drop_index(
+        "ix_equipment_tombstones_deleted_at", table_name="equipment_tombstones"
+    )
+    op.drop_table("equipment_tombstones")
+    for table in reversed(tables):
+        op.drop_index(f"ix_{table}_updated_at", table_name=table)
+        op.drop_column(table, "updated_at")
@@ -0,0 +1,49 @@
+"""Allow each user only one checkout request and staged request for each type of equipment
+
+The unique indexes on (pid, model) are what make adding a request free of races, as a check
+for an existing request alone is not under READ COMMITTED. Any duplicate requests already made
+keep only their earliest request, and the others are deleted.
+
+Like b3f1d7c2a9e4, this revision only changes the equipment tables when they exist.
+
+Revision ID: e5a1b7c3d9f2
+Revises: c2f8d4a6e1b9
+Create Date: 2023-11-10 09:48:12.930271
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e5a1b7c3d9f2"
+down_revision = "c2f8d4a6e1b9"
+branch_labels = None
+depends_on = None
+
+tables = ["equipment_checkout_requests", "staged_checkout_requests"]
+
+
+def upgrade() -> None:
+    for table in tables:
+        if not sa.inspect(op.get_bind()).has_table(table):
+            continue
+
+        op.execute(
+            f"""
+            DELETE FROM {table} AS duplicate
+            USING {table} AS earliest
+            WHERE duplicate.pid = earliest.pid
+              AND duplicate.model = earliest.model
+              AND duplicate.id > earliest.id
+            """
+        )
+        op.create_index(f"ix_{table}_pid_model", table, ["pid", "model"], unique=True)
+
+
+def downgrade() -> None:
+    for table in reversed(tables):
+        if not sa.inspect(op.get_bind()).has_table(table):
+            continue
+
+        op.drop_index(f"ix_{table}_pid_model", table_name=table)
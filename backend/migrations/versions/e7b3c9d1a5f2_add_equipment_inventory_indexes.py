@@ -0,0 +1,36 @@
+"""Index equipment by model and checked out state for inventory queries
+
+Like b3f1d7c2a9e4, this revision only changes the equipment tables when they exist.
+
+Revision ID: e7b3c9d1a5f2
+Revises: d4a9e2b7f3c1
+Create Date: 2023-11-07 10:12:45.318207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e7b3c9d1a5f2"
+down_revision = "d4a9e2b7f3c1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("equipment"):
+        return
+
+    op.create_index(
+        "ix_equipment_model_equipment_id", "equipment", ["model", "equipment_id"]
+    )
+    op.create_index("ix_equipment_is_checked_out", "equipment", ["is_checked_out"])
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("equipment"):
+        return
+
+    op.drop_index("ix_equipment_is_checked_out", table_name="equipment")
+    op.drop_index("ix_equipment_model_equipment_id", table_name="equipment")
@@ -0,0 +1,24 @@
+"""Add index for feeds of events in order of time
+
+Revision ID: f2c6a8e4d9b1
+Revises: e7b3c9d1a5f2
+Create Date: 2023-11-07 16:41:08.502733
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "f2c6a8e4d9b1"
+down_revision = "e7b3c9d1a5f2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_event_time_id", "event", ["time", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_time_id", table_name="event")
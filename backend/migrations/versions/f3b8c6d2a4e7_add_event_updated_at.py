@@ -0,0 +1,36 @@
+"""Track when each event was created or its details last changed
+
+Calendar feeds derive their Last-Modified time, ETag, and DTSTAMPs from the newest of their
+events, so that rendering the same events again produces the same feed.
+
+Revision ID: f3b8c6d2a4e7
+Revises: e5a1b7c3d9f2
+Create Date: 2023-11-10 14:06:51.318447
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "f3b8c6d2a4e7"
+down_revision = "e5a1b7c3d9f2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "event",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.alter_column("event", "updated_at", server_default=None)
+
+
+def downgrade() -> None:
+    op.drop_column("event", "updated_at")
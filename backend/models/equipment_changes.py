@@ -0,0 +1,40 @@
+"""Models for feeds of changes to equipment checkout requests, staged requests, and checkouts."""
+
+from pydantic import BaseModel
+
+from .equipment_checkout import EquipmentCheckout
+from .equipment_checkout_request import EquipmentCheckoutRequest
+from .StagedCheckoutRequest import StagedCheckoutRequest
+
+__authors__ = ["Nicholas Mountain, Jacob Brown"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class EquipmentRequestKey(BaseModel):
+    """Pydantic model to identify a checkout request or staged request, which are unique by user and model."""
+
+    pid: int
+    model: str
+
+
+class EquipmentChanges(BaseModel):
+    """
+    Pydantic model to represent changes to the ambassador equipment queue since a cursor.
+
+    Clients should first remove the deleted requests, then insert or replace the requests,
+    staged requests, and checkouts given, identifying requests by `pid` and `model` and
+    checkouts by `equipment_id`. Checkouts which are no longer active have been returned.
+
+    When `reset` is true, the changes are instead a snapshot of every request, staged request,
+    and active checkout, which replaces what the client holds. Pass `cursor` to get the
+    changes following these.
+    """
+
+    requests: list[EquipmentCheckoutRequest] = []
+    staged_requests: list[StagedCheckoutRequest] = []
+    checkouts: list[EquipmentCheckout] = []
+    deleted_requests: list[EquipmentRequestKey] = []
+    deleted_staged_requests: list[EquipmentRequestKey] = []
+    reset: bool = False
+    cursor: str
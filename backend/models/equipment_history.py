@@ -0,0 +1,49 @@
+"""Models for the checkout history, condition notes, and utilization of equipment items."""
+
+from datetime import datetime
+from pydantic import BaseModel
+
+__authors__ = ["Nicholas Mountain, Jacob Brown"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class EquipmentCheckoutHistory(BaseModel):
+    """
+    Pydantic model to represent one checkout in the history of an equipment item.
+
+    This model is based on the `EquipmentCheckoutHistoryEntity` model.
+    """
+
+    equipment_id: int
+    pid: int
+    checked_out_at: datetime
+
+
+class EquipmentConditionNote(BaseModel):
+    """
+    Pydantic model to represent a note on the condition of an equipment item.
+
+    This model is based on the `EquipmentConditionNoteEntity` model.
+    """
+
+    equipment_id: int
+    note: str
+    created_at: datetime | None = None
+
+
+class EquipmentUtilization(BaseModel):
+    """
+    Pydantic model to represent how much an equipment item was checked out in a window of time.
+
+    `checkouts` counts the checkouts which overlap the window, `checked_out_seconds` is the time
+    within the window the item was checked out, and `utilization` is that time as a fraction of
+    the window.
+    """
+
+    equipment_id: int
+    start: datetime
+    end: datetime
+    checkouts: int
+    checked_out_seconds: float
+    utilization: float
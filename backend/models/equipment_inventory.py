@@ -0,0 +1,34 @@
+"""Models for querying the inventory of equipment a page and a few fields at a time."""
+
+from pydantic import BaseModel, Field
+
+__authors__ = ["Nicholas Mountain, Jacob Brown"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class EquipmentInventoryFilter(BaseModel):
+    """
+    Pydantic model to represent the criteria equipment in an inventory query must meet.
+
+    Criteria which are None are not applied.
+    """
+
+    model: str | None = None
+    is_checked_out: bool | None = None
+    min_condition: int | None = Field(default=None, ge=0, le=10)
+    max_condition: int | None = Field(default=None, ge=0, le=10)
+
+
+class EquipmentInventoryItem(BaseModel):
+    """
+    Pydantic model to represent the selected fields of an equipment item in an inventory query.
+
+    Fields which were not selected are None, and are left out of API responses.
+    """
+
+    equipment_id: int | None = None
+    model: str | None = None
+    equipment_image: str | None = None
+    condition: int | None = None
+    is_checked_out: bool | None = None
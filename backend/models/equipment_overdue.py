@@ -0,0 +1,50 @@
+"""Models for loan periods of equipment and checkouts which have overrun them."""
+
+from datetime import datetime, timedelta
+from pydantic import BaseModel, Field
+
+__authors__ = ["Nicholas Mountain, Jacob Brown"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class EquipmentLoanPolicy(BaseModel):
+    """
+    Pydantic model to represent how long each type of equipment may be checked out for.
+
+    This model is based on the `EquipmentLoanPolicyEntity` model.
+    """
+
+    model: str = Field(max_length=64)
+    loan_period: timedelta = Field(gt=timedelta(0))
+
+
+class OverdueCheckout(BaseModel):
+    """Pydantic model to represent an active checkout which was due to be returned in the past."""
+
+    user_name: str
+    pid: int
+    equipment_id: int
+    model: str
+    started_at: datetime
+    due_at: datetime
+
+
+class OverdueSummary(BaseModel):
+    """
+    Pydantic model to represent aggregate metrics of overdue checkouts as of a scan.
+
+    `by_model` counts the overdue checkouts of each type of equipment, and `oldest_due_at` is
+    when the longest overdue checkout was due, if any are overdue.
+    """
+
+    scanned_at: datetime
+    count: int
+    by_model: dict[str, int]
+    oldest_due_at: datetime | None = None
+
+
+class OverdueReport(OverdueSummary):
+    """Pydantic model to represent the overdue checkouts found by a scan, longest overdue first."""
+
+    checkouts: list[OverdueCheckout]
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 
 __authors__ = ["Ajay Gandecha", "Jade Keegan", "Brianna Ta", "Audrey Toney"]
@@ -21,3 +21,5 @@ class Event(BaseModel):
     description: str
     public: bool
     organization_id: int
+    capacity: int | None = Field(default=None, ge=0)
+    rsvp_count: int = 0
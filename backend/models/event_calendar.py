@@ -0,0 +1,20 @@
+from datetime import datetime
+from pydantic import BaseModel
+
+__authors__ = ["Ajay Gandecha", "Jade Keegan", "Brianna Ta", "Audrey Toney"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class EventCalendar(BaseModel):
+    """
+    Pydantic model to represent an iCalendar feed of public events rendered for serving over HTTP.
+
+    `content` is the `text/calendar` document, `etag` identifies it, and `last_modified` is when
+    the newest of the events it lists was created or changed, or None if it lists no events. Both
+    are derived from the events, so rendering the same events again gives the same validators.
+    """
+
+    content: bytes
+    etag: str
+    last_modified: datetime | None
@@ -0,0 +1,36 @@
+from pydantic import BaseModel
+
+from backend.models.event import Event
+
+__authors__ = ["Ajay Gandecha", "Jade Keegan", "Brianna Ta", "Audrey Toney"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class EventFeedOrganization(BaseModel):
+    """
+    Pydantic model to represent the `Organization` hosting events in an `EventFeed`.
+
+    Only the fields shown alongside an event are included, rather than the organization's
+    descriptions and links.
+    """
+
+    id: int
+    name: str
+    shorthand: str
+    slug: str
+    logo: str
+
+
+class EventFeed(BaseModel):
+    """
+    Pydantic model to represent a page of events in order of time.
+
+    Each organization hosting an event on the page is included once in `organizations`, keyed
+    by ID, rather than with every one of its events. Pass `next_cursor` to get the following
+    page; it is empty on the last page.
+    """
+
+    events: list[Event]
+    organizations: dict[int, EventFeedOrganization]
+    next_cursor: str = ""
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+
+__authors__ = ["Ajay Gandecha", "Jade Keegan", "Brianna Ta", "Audrey Toney"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class EventRsvp(BaseModel):
+    """
+    Pydantic model to represent whether a user has RSVP'd to an `Event`, and how many have.
+
+    `capacity` is None for events without a limit on RSVPs.
+    """
+
+    event_id: int
+    attending: bool
+    rsvp_count: int
+    capacity: int | None = None
@@ -0,0 +1,14 @@
+"""Models for exporting reports of application data."""
+
+from enum import Enum
+
+__authors__ = ["Kris Jordan", "Nicholas Mountain", "Jacob Brown"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class ExportFormat(str, Enum):
+    """File formats reports may be exported in."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
@@ -0,0 +1,39 @@
+"""Models for linking CSXL accounts with GitHub accounts and serving GitHub avatars."""
+
+from enum import Enum
+from pydantic import BaseModel
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class GitHubLinkJobStatus(str, Enum):
+    """Progress of a GitHub account linking job."""
+
+    PENDING = "pending"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class GitHubLinkJob(BaseModel):
+    """
+    Pydantic model to represent a GitHub account linking job running in the background.
+
+    Clients poll the job by its `id` until its status is no longer pending.
+    """
+
+    id: str
+    user_id: int
+    status: GitHubLinkJobStatus = GitHubLinkJobStatus.PENDING
+
+
+class GitHubAvatar(BaseModel):
+    """
+    Pydantic model to represent a GitHub avatar image fetched for serving from the CSXL.
+    """
+
+    url: str
+    content: bytes
+    media_type: str
+    etag: str
@@ -17,3 +17,28 @@ class OrganizationDetails(Organization):
     """
 
     events: list[Event]
+
+
+class OrganizationPage(OrganizationDetails):
+    """
+    Pydantic model to represent an `Organization` as shown on its page, with a bounded page of
+    its upcoming events rather than all of its events.
+
+    `events` are the organization's upcoming events in order of time. Pass `events_cursor` to
+    get the upcoming events following them, and `past_events_cursor` to get the organization's
+    past events, most recent first. Either is empty when there are no such events.
+    """
+
+    events_cursor: str = ""
+    past_events_cursor: str = ""
+
+
+class OrganizationEvents(BaseModel):
+    """
+    Pydantic model to represent a page of an organization's events.
+
+    Pass `next_cursor` to get the following page; it is empty on the last page.
+    """
+
+    events: list[Event]
+    next_cursor: str = ""
@@ -0,0 +1,38 @@
+from pydantic import BaseModel
+
+__authors__ = ["Ajay Gandecha", "Jade Keegan", "Brianna Ta", "Audrey Toney"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class OrganizationSummary(BaseModel):
+    """
+    Pydantic model to represent an `Organization` as listed in the organization directory.
+
+    Only the fields shown on the directory's cards are included, leaving out the
+    organization's long description and events.
+    """
+
+    id: int
+    name: str
+    shorthand: str
+    slug: str
+    logo: str
+    short_description: str
+    website: str
+    email: str
+    instagram: str
+    linked_in: str
+    youtube: str
+    public: bool
+
+
+class OrganizationDirectory(BaseModel):
+    """
+    Pydantic model to represent the organization directory serialized for serving over HTTP.
+
+    `content` is the JSON of the list of `OrganizationSummary`s, and `etag` identifies it.
+    """
+
+    content: bytes
+    etag: str
@@ -11,12 +11,16 @@ T = TypeVar("T")
 
 
 class PaginationParams(BaseModel):
-    """Parameters passed from the client to paginate results."""
+    """Parameters passed from the client to paginate results.
+
+    When `cursor` is the `next_cursor` of the previous page, the page following it is produced
+    without counting past the rows of earlier pages, and `page` is informational."""
 
     page: int = 0
     page_size: int = 10
     order_by: str = ""
     filter: str = ""
+    cursor: str = ""
 
 
 class Paginated(BaseModel, Generic[T]):
@@ -25,3 +29,4 @@ class Paginated(BaseModel, Generic[T]):
     items: list[T]
     length: int
     params: PaginationParams
+    next_cursor: str = ""
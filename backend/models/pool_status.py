@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class PoolStatus(BaseModel):
+    """
+    Pydantic model to represent the state of a process' pool of database connections.
+
+    A pool under pressure has no connections checked in and has overflowed; requests then wait
+    up to `timeout` seconds for a connection.
+    """
+
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    max_overflow: int
+    timeout: float
@@ -0,0 +1,54 @@
+"""Models for bulk importing rosters of users and their role memberships."""
+
+from enum import Enum
+from pydantic import BaseModel, Field
+
+__authors__ = ["Kris Jordan", "Ajay Gandecha"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class RosterFormat(str, Enum):
+    """File formats a roster may be imported from."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class RosterRow(BaseModel):
+    """
+    Pydantic model to represent one user in a roster being imported.
+
+    Users are matched to existing users by `pid`. `roles` names the roles the user should be
+    a member of, in addition to any they are already a member of. In CSV rosters, role names
+    are separated by semicolons.
+    """
+
+    pid: int = Field(ge=100000000, le=999999999)
+    onyen: str = Field(min_length=1, max_length=32)
+    email: str = Field(min_length=1, max_length=32)
+    first_name: str = Field(default="", max_length=64)
+    last_name: str = Field(default="", max_length=64)
+    pronouns: str = Field(default="", max_length=32)
+    roles: list[str] = []
+
+
+class RosterRowError(BaseModel):
+    """
+    Pydantic model to represent a roster row which could not be imported.
+
+    `row` is the 1-based number of the record in the roster, not counting a CSV header.
+    """
+
+    row: int
+    pid: int | None = None
+    message: str
+
+
+class RosterImportResult(BaseModel):
+    """Pydantic model to represent the outcome of importing a roster."""
+
+    created: int = 0
+    updated: int = 0
+    memberships_added: int = 0
+    errors: list[RosterRowError] = []
@@ -0,0 +1,35 @@
+"""Models for the results of full-text searches."""
+
+from pydantic import BaseModel
+
+from .event import Event
+from .event_feed import EventFeedOrganization
+from .organization import Organization
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class EventSearchResult(BaseModel):
+    """An event matching a search, with the organization hosting it.
+
+    `headline` is an excerpt of the event's description with the words matching the search
+    wrapped in `<mark>` tags, and `rank` is the relevance of the event to the search."""
+
+    event: Event
+    organization: EventFeedOrganization
+    headline: str
+    rank: float
+
+
+class OrganizationSearchResult(BaseModel):
+    """An organization matching a search.
+
+    `headline` is an excerpt of the organization's short description with the words matching
+    the search wrapped in `<mark>` tags, and `rank` is the relevance of the organization to the
+    search."""
+
+    organization: Organization
+    headline: str
+    rank: float
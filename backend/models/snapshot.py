@@ -0,0 +1,19 @@
+from datetime import datetime
+from pydantic import BaseModel
+
+__authors__ = ["Ajay Gandecha", "Jade Keegan", "Brianna Ta", "Audrey Toney"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class SnapshotManifest(BaseModel):
+    """
+    Pydantic model to represent the current versions of the static snapshots of public data.
+
+    Each field other than `built_at` is the URL path of a snapshot's JSON file, whose name is
+    versioned by a hash of its content so that it may be cached indefinitely.
+    """
+
+    built_at: datetime
+    organizations: str
+    events: str
@@ -0,0 +1,34 @@
+"""
+Build the static snapshots of the organization directory and upcoming events.
+
+The application rebuilds snapshots on its own while it is running. Run this script when
+deploying, before the application starts serving visitors, or from a scheduled job on hosts
+serving the static files directory without the application.
+
+Usage: python3 -m backend.script.build_snapshots [--static ./static]
+"""
+
+import argparse
+from pathlib import Path
+from sqlalchemy.orm import Session
+
+from ..database import engine
+from ..services.snapshot import STATIC_DIRECTORY, SnapshotService
+
+__authors__ = ["Ajay Gandecha", "Jade Keegan", "Brianna Ta", "Audrey Toney"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+parser.add_argument(
+    "--static",
+    type=Path,
+    default=STATIC_DIRECTORY,
+    help="the static files directory to write snapshots into",
+)
+args = parser.parse_args()
+
+with Session(engine) as session:
+    manifest = SnapshotService(session, args.static).build()
+
+print(f"Built snapshots {manifest.organizations} and {manifest.events}.")
@@ -0,0 +1,64 @@
+"""
+Bulk import a roster of users and their role memberships from a CSV or NDJSON file.
+
+CSV rosters have a header row with the columns pid, onyen, email, first_name, last_name,
+pronouns, and roles, where roles are separated by semicolons. NDJSON rosters have one JSON
+object per line with the same keys, where roles is a list. The import is performed on behalf of
+an existing user, whose permissions are enforced, and rows which fail are printed to stderr.
+
+Usage: python3 -m backend.script.import_roster roster.csv --as root
+"""
+
+import argparse
+import sys
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..database import engine
+from ..entities import UserEntity
+from ..models.roster import RosterFormat
+from ..services import PermissionService, UserPermissionException
+from ..services.roster import RosterService
+
+__authors__ = ["Kris Jordan", "Ajay Gandecha"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+parser.add_argument("roster", help="path to a .csv or .ndjson roster file")
+parser.add_argument(
+    "--as", dest="onyen", required=True, help="onyen of the user performing the import"
+)
+parser.add_argument(
+    "--format",
+    choices=[format.value for format in RosterFormat],
+    help="format of the roster, inferred from its extension by default",
+)
+args = parser.parse_args()
+
+format = RosterFormat(
+    args.format or ("csv" if args.roster.lower().endswith(".csv") else "ndjson")
+)
+with open(args.roster, encoding="utf-8-sig") as roster_file:
+    content = roster_file.read()
+
+with Session(engine) as session:
+    subject = session.scalar(select(UserEntity).where(UserEntity.onyen == args.onyen))
+    if subject is None:
+        print(f"No user with onyen {args.onyen} exists.", file=sys.stderr)
+        exit(1)
+
+    roster_service = RosterService(session, PermissionService(session))
+    try:
+        result = roster_service.import_roster(subject.to_model(), content, format)
+    except UserPermissionException as e:
+        print(e, file=sys.stderr)
+        exit(1)
+
+for error in result.errors:
+    print(f"Row {error.row} (PID {error.pid}): {error.message}", file=sys.stderr)
+print(
+    f"Created {result.created} users, updated {result.updated} users, "
+    f"and added {result.memberships_added} role memberships. "
+    f"{len(result.errors)} rows failed."
+)
@@ -0,0 +1,218 @@
+"""In-process caches shared by the service layer.
+
+The `TTLCache` class is a small, thread-safe, size-bounded cache whose entries expire after
+a fixed time-to-live. Every application server process holds its own caches, so the TTL bounds
+how long one process may serve data another process has since changed. Services which write
+the data backing a cache are responsible for invalidating it in their own process.
+"""
+
+import time
+import weakref
+from collections import OrderedDict
+from datetime import timedelta
+from threading import Lock
+from typing import Callable, Generic, Hashable, TypeVar
+from ..models import User, UserDetails
+from ..models.equipment_type import EquipmentType
+from ..models.equipment_overdue import OverdueReport
+from ..models.event_calendar import EventCalendar
+from ..models.organization_summary import OrganizationDirectory
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_caches: "weakref.WeakSet[TTLCache]" = weakref.WeakSet()
+"""All live caches, tracked so that `clear_all_caches` can reset them."""
+
+
+class TTLCache(Generic[K, V]):
+    """A thread-safe, least-recently-used cache whose entries expire after a time-to-live."""
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: timedelta,
+        timer: Callable[[], float] = time.monotonic,
+        weigher: Callable[[V], int] | None = None,
+    ):
+        """Initialize an empty cache.
+
+        Args:
+            maxsize (int): The maximum total weight of entries held before the least recently used is evicted.
+            ttl (timedelta): How long an entry is served before it expires.
+            timer (Callable[[], float], optional): Clock returning seconds, replaceable for testing.
+            weigher (Callable[[V], int], optional): Weight of a value, e.g. its size in bytes. Each entry
+                weighs 1 by default, making `maxsize` the maximum number of entries.
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl.total_seconds()
+        self._timer = timer
+        self._weigher = weigher or (lambda _: 1)
+        self._weight = 0
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = Lock()
+        _caches.add(self)
+
+    def get(self, key: K) -> V | None:
+        """Get the unexpired value cached for a key.
+
+        Args:
+            key (K): The key to look up.
+
+        Returns:
+            V | None: The cached value, or None if the key is absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._timer():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Cache a value for a key, evicting the least recently used entry if full.
+
+        Args:
+            key (K): The key to cache the value under.
+            value (V): The value to cache."""
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (self._timer() + self._ttl, value)
+            self._weight += self._weigher(value)
+            while self._weight > self._maxsize:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, key: K) -> None:
+        """Remove a key from the cache, if present.
+
+        Args:
+            key (K): The key to remove."""
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _remove(self, key: K) -> None:
+        """Remove a key and its weight; the caller must hold the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._weight -= self._weigher(entry[1])
+
+
+def clear_all_caches() -> None:
+    """Clear every cache in this process, e.g. after resetting the database."""
+    for cache in list(_caches):
+        cache.clear()
+
+
+registered_user_cache: TTLCache[int, UserDetails] = TTLCache(
+    maxsize=4096, ttl=timedelta(seconds=60)
+)
+"""Resolved `UserDetails` of authenticated users, keyed by PID.
+
+Populated by the `registered_user` dependency. Invalidated by changes to a user's profile,
+permissions, or role memberships via `invalidate_registered_user`."""
+
+registered_user_identity_cache: TTLCache[int, User] = TTLCache(
+    maxsize=4096, ttl=timedelta(seconds=60)
+)
+"""Resolved `User`s, without permissions, of authenticated users, keyed by PID.
+
+Populated by the `registered_user_identity` dependency and invalidated alongside
+`registered_user_cache`."""
+
+
+def invalidate_registered_user(pid: int | None = None) -> None:
+    """Invalidate a cached authenticated user.
+
+    Args:
+        pid (int | None): The PID of the user whose cached details are stale, or None to
+            invalidate every user (e.g. when a role's permissions change)."""
+    if pid is None:
+        registered_user_cache.clear()
+        registered_user_identity_cache.clear()
+    else:
+        registered_user_cache.invalidate(pid)
+        registered_user_identity_cache.invalidate(pid)
+
+
+user_list_length_cache: TTLCache[str, int] = TTLCache(
+    maxsize=1024, ttl=timedelta(minutes=1)
+)
+"""Number of users matching a `UserService.list` filter, keyed by filter, for estimated lengths.
+
+Cleared whenever users are created or updated."""
+
+
+EQUIPMENT_TYPES_KEY = "all"
+"""The key of the list of all equipment types in `equipment_type_cache`."""
+
+equipment_type_cache: TTLCache[str, list[EquipmentType]] = TTLCache(
+    maxsize=1, ttl=timedelta(seconds=60)
+)
+"""Equipment types and the number of each available, as listed on the equipment page.
+
+Populated by `EquipmentService.get_all_types` and cleared whenever equipment is changed."""
+
+
+OVERDUE_CHECKOUTS_KEY = "all"
+"""The key of the latest overdue checkout report in `overdue_checkout_cache`."""
+
+overdue_checkout_cache: TTLCache[str, OverdueReport] = TTLCache(
+    maxsize=1, ttl=timedelta(minutes=15)
+)
+"""The latest report of overdue checkouts, as shown to ambassadors.
+
+Populated by `OverdueCheckoutService.scan`, which `OverdueCheckoutScanner` runs periodically, and
+cleared whenever checkouts or loan policies change."""
+
+
+ORGANIZATION_DIRECTORY_KEY = "all"
+"""The key of the serialized organization directory in `organization_directory_cache`."""
+
+organization_directory_cache: TTLCache[str, OrganizationDirectory] = TTLCache(
+    maxsize=1, ttl=timedelta(minutes=5)
+)
+"""The JSON of the organization directory, as served to every visitor of the organizations page.
+
+Populated by `OrganizationService.directory` and cleared whenever organizations are created,
+updated, or deleted."""
+
+
+organization_slug_cache: TTLCache[str, int] = TTLCache(
+    maxsize=1024, ttl=timedelta(minutes=10)
+)
+"""IDs of organizations keyed by slug, so that organization pages look up events by ID.
+
+Populated by `OrganizationService` and cleared whenever organizations are updated or deleted."""
+
+
+ALL_EVENTS_CALENDAR_KEY = ""
+"""The key of the calendar of all public events in `event_calendar_cache`, which is otherwise
+keyed by organization slug."""
+
+event_calendar_cache: TTLCache[str, EventCalendar] = TTLCache(
+    maxsize=16 * 1024 * 1024,
+    ttl=timedelta(minutes=10),
+    weigher=lambda calendar: len(calendar.content),
+)
+"""Rendered iCalendar feeds of public events, weighed by their size in bytes, as polled by the
+calendar apps of subscribers.
+
+Populated by `EventService.calendar` and cleared whenever events are created, updated, or
+deleted, as well as when organizations are updated or deleted."""
@@ -2,7 +2,7 @@
 
 from fastapi import Depends
 from sqlalchemy.orm import Session
-from ...database import db_session
+from ...database import db_read_session, db_session
 from ...models.coworking import OperatingHours, TimeRange
 from ...entities.coworking import OperatingHoursEntity
 
@@ -41,3 +41,13 @@ class OperatingHoursService:
             .all()
         )
         return [entity.to_model() for entity in entities]
+
+
+def operating_hours_reader(
+    session: Session = Depends(db_read_session),
+) -> OperatingHoursService:
+    """Dependency injection function for an OperatingHoursService whose session reads from the replica.
+
+    Only routes which only read operating hours should use it.
+    """
+    return OperatingHoursService(session)
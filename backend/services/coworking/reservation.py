@@ -669,3 +669,17 @@ class ReservationService:
             if len(seat.availability) > 0:
                 available_seats.append(seat)
         return available_seats
+
+
+def reservation_service(session: Session) -> ReservationService:
+    """Construct a ReservationService, and the services it depends on, around one session.
+
+    Async routes use it to run the service through `AsyncSession.run_sync`, where FastAPI cannot
+    inject the session's dependents."""
+    return ReservationService(
+        session,
+        PermissionService(session),
+        PolicyService(),
+        OperatingHoursService(session),
+        SeatService(session),
+    )
@@ -2,7 +2,7 @@
 
 from fastapi import Depends
 from sqlalchemy.orm import Session
-from ...database import db_session
+from ...database import db_read_session, db_session
 from ...models.coworking import Seat, SeatDetails
 from ...entities.coworking import SeatEntity
 
@@ -30,3 +30,11 @@ class SeatService:
         """
         entities = self._session.query(SeatEntity).all()
         return [entity.to_model() for entity in entities]
+
+
+def seat_reader(session: Session = Depends(db_read_session)) -> SeatService:
+    """Dependency injection function for a SeatService whose session reads from the replica.
+
+    Only routes which only read seats should use it.
+    """
+    return SeatService(session)
@@ -4,7 +4,7 @@ from fastapi import Depends
 from datetime import datetime
 from sqlalchemy.orm import Session
 from ...database import db_session
-from .reservation import ReservationService
+from .reservation import ReservationService, reservation_service
 from .operating_hours import OperatingHoursService
 from .seat import SeatService
 from ...models.coworking import Status, TimeRange
@@ -63,3 +63,15 @@ class StatusService:
             seat_availability=seat_availability,
             operating_hours=operating_hours,
         )
+
+
+def status_service(session: Session) -> StatusService:
+    """Construct a StatusService, and the services it depends on, around one session.
+
+    Async routes use it to run the service through `AsyncSession.run_sync`."""
+    return StatusService(
+        PolicyService(),
+        OperatingHoursService(session),
+        SeatService(session),
+        reservation_service(session),
+    )
@@ -0,0 +1,164 @@
+"""
+Verification of delegated authentication tokens against the production authentication server.
+
+Development and staging servers cannot authenticate users via SSO directly. Instead, the production
+server issues them a token which must be verified by requesting the production server's `/verify`
+route (see `backend/api/authentication.py`). This module's client keeps that request from tying up
+application server workers: connections are pooled, requests have strict timeouts, verified claims
+are cached briefly, and a circuit breaker fails fast while the authentication server is unhealthy.
+"""
+
+import time
+import requests
+from datetime import timedelta
+from threading import Lock
+from typing import Callable
+from requests.adapters import HTTPAdapter
+from .cache import TTLCache
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class DelegatedAuthUnavailableException(Exception):
+    """DelegatedAuthUnavailableException is raised when the authentication server cannot be reached or is failing."""
+
+    def __init__(self, reason: str):
+        super().__init__(f"Authentication server unavailable: {reason}")
+
+
+class CircuitBreaker:
+    """Stops calls to an unhealthy upstream after consecutive failures, retrying after a cooldown.
+
+    The breaker is closed while calls succeed. After `failure_threshold` consecutive failures it opens
+    and `allow` returns False until `reset_timeout` has elapsed. Then a single trial call is allowed
+    (half-open); its success closes the breaker and its failure reopens it for another cooldown.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: timedelta,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout.total_seconds()
+        self._timer = timer
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+        self._lock = Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """True while calls are being rejected."""
+        with self._lock:
+            return self._opened_at is not None
+
+    def allow(self) -> bool:
+        """Returns whether a call to the upstream may be attempted now."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial_in_flight:
+                return False
+            if self._timer() - self._opened_at >= self._reset_timeout:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the breaker."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker once the threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self._failures >= self._failure_threshold:
+                self._opened_at = self._timer()
+
+
+class DelegatedAuthVerifier:
+    """Client for the authentication server's `/verify` route."""
+
+    def __init__(
+        self,
+        base_url: str,
+        connect_timeout: timedelta = timedelta(seconds=2),
+        read_timeout: timedelta = timedelta(seconds=3),
+        claims_ttl: timedelta = timedelta(minutes=5),
+        failure_threshold: int = 5,
+        reset_timeout: timedelta = timedelta(seconds=30),
+        pool_size: int = 10,
+    ):
+        """Initialize a verifier.
+
+        Args:
+            base_url (str): Scheme and host of the authentication server, e.g. `https://csxl.unc.edu`.
+            connect_timeout (timedelta, optional): Time allowed to establish a connection.
+            read_timeout (timedelta, optional): Time allowed between bytes of the response.
+            claims_ttl (timedelta, optional): How long verified claims of a token are cached.
+            failure_threshold (int, optional): Consecutive failures before the circuit breaker opens.
+            reset_timeout (timedelta, optional): How long the circuit breaker stays open before a retry.
+            pool_size (int, optional): Maximum number of pooled connections to the authentication server.
+        """
+        self._verify_url = f"{base_url.rstrip('/')}/verify"
+        self._timeout = (connect_timeout.total_seconds(), read_timeout.total_seconds())
+        self._claims: TTLCache[str, dict] = TTLCache(maxsize=1024, ttl=claims_ttl)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self._http = requests.Session()
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+
+    def verify(self, token: str) -> dict | None:
+        """Verify a token with the authentication server.
+
+        Args:
+            token (str): The token issued by the authentication server.
+
+        Returns:
+            dict | None: The verified claims of the token (including `uid` and `pid`), or None if the
+                authentication server rejected the token.
+
+        Raises:
+            DelegatedAuthUnavailableException: If the authentication server is unreachable, failing,
+                or the circuit breaker is open.
+        """
+        claims = self._claims.get(token)
+        if claims is not None:
+            return claims
+
+        if not self.breaker.allow():
+            raise DelegatedAuthUnavailableException("too many recent failures")
+
+        try:
+            response = self._http.get(
+                self._verify_url, params={"token": token}, timeout=self._timeout
+            )
+        except requests.RequestException as e:
+            self.breaker.record_failure()
+            raise DelegatedAuthUnavailableException(type(e).__name__)
+
+        if response.status_code >= 500:
+            self.breaker.record_failure()
+            raise DelegatedAuthUnavailableException(f"HTTP {response.status_code}")
+
+        self.breaker.record_success()
+        if response.status_code != requests.codes.ok:
+            return None
+
+        claims = response.json()
+        self._claims.set(token, claims)
+        return claims
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._http.close()
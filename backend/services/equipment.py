@@ -2,10 +2,26 @@
 The equipment service allows the API to manipulate equipment in the database.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from fastapi import Depends
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    ARRAY,
+    Integer,
+    Select,
+    String,
+    case,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import InstrumentedAttribute, Session
 from backend.entities.equipment_checkout_request_entity import (
     EquipmentCheckoutRequestEntity,
 )
@@ -17,11 +33,33 @@ from backend.models.equipment_checkout_request import EquipmentCheckoutRequest
 from backend.models.equipment_type import EquipmentType
 from backend.models.equipment_checkout import EquipmentCheckout
 from .permission import PermissionService
+from .pagination import after_cursor, decode_cursor, encode_cursor
+from .local_time import local_time
+from .cache import (
+    EQUIPMENT_TYPES_KEY,
+    equipment_type_cache,
+    invalidate_registered_user,
+    overdue_checkout_cache,
+)
 
 from ..database import db_session
 from ..models.equipment import Equipment
 from ..entities.equipment_entity import EquipmentEntity
 from ..entities.equipment_checkout_entity import EquipmentCheckoutEntity
+from ..entities.equipment_checkout_history_entity import EquipmentCheckoutHistoryEntity
+from ..entities.equipment_condition_note_entity import EquipmentConditionNoteEntity
+from ..entities.equipment_tombstone_entity import EquipmentTombstoneEntity
+from ..models.equipment_changes import EquipmentChanges, EquipmentRequestKey
+from ..models.equipment_history import (
+    EquipmentCheckoutHistory,
+    EquipmentConditionNote,
+    EquipmentUtilization,
+)
+from ..models.equipment_inventory import (
+    EquipmentInventoryFilter,
+    EquipmentInventoryItem,
+)
+from ..models.pagination import Paginated, PaginationParams
 from ..models import User
 
 # Excluding this import for now, however, we will need to use in later sprints for handling different types of users
@@ -90,6 +128,21 @@ class StagedCheckoutRequestNotFoundException(Exception):
 class EquipmentService:
     """Service that performs all of the actions on the equipment table."""
 
+    CHANGE_OVERLAP = timedelta(seconds=10)
+    """How far each feed of changes reaches back before its cursor, to include changes committed late."""
+
+    TOMBSTONE_RETENTION = timedelta(days=1)
+    """How long deletions are remembered, after which feeds of changes fall back to a snapshot."""
+
+    INVENTORY_SORT_KEYS: dict[str, tuple[InstrumentedAttribute, ...]] = {
+        "equipment_id": (EquipmentEntity.equipment_id,),
+        "model": (EquipmentEntity.model, EquipmentEntity.equipment_id),
+    }
+    """Columns the inventory may be listed in order of, mapped to the indexed, unique sort key used."""
+
+    INVENTORY_FIELDS = list(EquipmentInventoryItem.model_fields)
+    """Fields of equipment which inventory queries may select."""
+
     def __init__(
         self,
         session: Session = Depends(db_session),
@@ -99,7 +152,10 @@ class EquipmentService:
         self._permission = PermissionService(session=self._session)
 
     def get_all(self) -> list[Equipment]:
-        """Return a list of all equipment in the db."""
+        """Return a list of all equipment in the db.
+
+        Prefer `get_inventory`, which filters and pages equipment and selects only some fields.
+        """
         # Create the query for getting all equipment entities.
         query = select(EquipmentEntity)
         # execute the query grabbing each row from the equipment table
@@ -136,6 +192,7 @@ class EquipmentService:
             entity_item.update(item)
 
             self._session.commit()
+            equipment_type_cache.clear()
             return entity_item.to_model()
         # if no item was found, raise exception
         else:
@@ -173,48 +230,45 @@ class EquipmentService:
         """
         Converts equipment into list of EquipmentType models
 
+        The counts are aggregated by the database in a single `GROUP BY model` query, and the
+        result is cached until equipment is changed.
+
         Args:
             None.
 
         Returns:
             the unique names of all equipment and the number of each type of equipment.
         """
-
-        all_equipment = self.get_all()
-        equipment_types = []
-
-        for equipment in all_equipment:
-            # flag to keep track whether the equipment model was succesfully mapped to a equipment_type entry
-            caught = False
-            for equipment_type in equipment_types:
-                if equipment.model == equipment_type.model:
-                    # If equipment is currently checked out, not added to num_available
-                    if not equipment.is_checked_out:
-                        equipment_type.num_available += 1
-
-                    # equipment was successfully mapped to an existing equipment type in the return list
-                    caught = True
-                    break
-            if not caught:
-                # If equipment passed through type list without getting caught, this is the first time encountering its type
-
-                if equipment.is_checked_out:
-                    # If the equipment is checked out, add its type to the type list, but initialize num_available to 0
-                    new_type = EquipmentType(
-                        model=equipment.model,
-                        num_available=0,
-                        equipment_img_URL=equipment.equipment_image,
-                    )
-                else:
-                    # If the equipment is not checked out, add its type to the type list and initialize num_available to 1
-                    new_type = EquipmentType(
-                        model=equipment.model,
-                        num_available=1,
-                        equipment_img_URL=equipment.equipment_image,
-                    )
-                equipment_types.append(new_type)
-
-        return equipment_types
+        equipment_types = equipment_type_cache.get(EQUIPMENT_TYPES_KEY)
+        if equipment_types is None:
+            query = (
+                select(
+                    EquipmentEntity.model,
+                    func.count().filter(EquipmentEntity.is_checked_out == False),
+                    # The image of the first item of each model represents the type
+                    func.array_agg(
+                        aggregate_order_by(
+                            EquipmentEntity.equipment_image, EquipmentEntity.id
+                        ),
+                        type_=ARRAY(String),
+                    )[1],
+                )
+                .group_by(EquipmentEntity.model)
+                .order_by(func.min(EquipmentEntity.id))
+            )
+            equipment_types = [
+                EquipmentType(
+                    model=model,
+                    num_available=num_available,
+                    equipment_img_URL=equipment_image,
+                )
+                for model, num_available, equipment_image in self._session.execute(
+                    query
+                )
+            ]
+            equipment_type_cache.set(EQUIPMENT_TYPES_KEY, equipment_types)
+
+        return [equipment_type.model_copy() for equipment_type in equipment_types]
 
     def add_request(
         self, request: EquipmentCheckoutRequest, user: User
@@ -231,54 +285,56 @@ class EquipmentService:
 
         Raises:
             WaiverNotSignedException if the user has not signed the liability waiver.
+            DuplicateEquipmentCheckoutRequestException if the user already has a checkout request,
+            staged request, or active checkout for the same type of equipment.
         """
 
         # Check if the user has signed the liability waiver.
         if not user.signed_equipment_wavier:
             raise WaiverNotSignedException
 
-        # Check if the user has already submitted a checkout request for the same type of equipment.
-        priorCheckoutRequest = (
-            self._session.query(EquipmentCheckoutRequestEntity)
-            .filter(
-                EquipmentCheckoutRequestEntity.model == request.model,
+        # Insert the request only if the user has no checkout request, staged request, or
+        # active checkout for the same type of equipment, probing all three in one statement.
+        duplicates = union_all(
+            select(literal(1)).where(
                 EquipmentCheckoutRequestEntity.pid == request.pid,
-            )
-            .one_or_none()
-        )
-
-        # Check if the user has already submitted a staged request for the same type of equipment.
-        priorStagedRequest = (
-            self._session.query(StagedCheckoutRequestEntity)
-            .filter(
-                StagedCheckoutRequestEntity.model == request.model,
+                EquipmentCheckoutRequestEntity.model == request.model,
+            ),
+            select(literal(1)).where(
                 StagedCheckoutRequestEntity.pid == request.pid,
-            )
-            .one_or_none()
-        )
-
-        # Check if the user already has a checkout.
-        priorCheckout = (
-            self._session.query(EquipmentCheckoutEntity)
-            .filter(
-                EquipmentCheckoutEntity.model == request.model,
+                StagedCheckoutRequestEntity.model == request.model,
+            ),
+            select(literal(1)).where(
                 EquipmentCheckoutEntity.pid == request.pid,
-                EquipmentCheckoutEntity.is_active,
+                EquipmentCheckoutEntity.model == request.model,
+                EquipmentCheckoutEntity.is_active == True,
+            ),
+        )
+        statement = (
+            insert(EquipmentCheckoutRequestEntity)
+            .from_select(
+                ["user_name", "model", "pid"],
+                select(
+                    literal(request.user_name, String),
+                    literal(request.model, String),
+                    literal(request.pid, Integer),
+                ).where(~exists(duplicates)),
             )
-            .one_or_none()
+            .returning(EquipmentCheckoutRequestEntity)
         )
 
-        # if the user is trying to send a duplicate request, raise exception
-        if priorCheckoutRequest or priorStagedRequest or priorCheckout:
+        try:
+            equipment_checkout_request_entity = self._session.scalar(statement)
+        except IntegrityError:
+            # a concurrent request for the same type of equipment was inserted first
+            self._session.rollback()
             raise DuplicateEquipmentCheckoutRequestException(request.model)
 
-        # create new object
-        equipment_checkout_request_entity = EquipmentCheckoutRequestEntity.from_model(
-            request
-        )
+        # if the user is trying to send a duplicate request, raise exception
+        if equipment_checkout_request_entity is None:
+            self._session.rollback()
+            raise DuplicateEquipmentCheckoutRequestException(request.model)
 
-        # add new object to table and commit changes
-        self._session.add(equipment_checkout_request_entity)
         self._session.commit()
 
         # return added object
@@ -308,8 +364,9 @@ class EquipmentService:
 
         # ensure object exists
         if obj:
-            # delete object and commit
+            # delete object, leaving a tombstone for feeds of changes, and commit
             self._session.delete(obj)
+            self._add_tombstone(EquipmentCheckoutRequestEntity, obj.pid, obj.model)
             self._session.commit()
         else:
             # raise exception
@@ -328,17 +385,97 @@ class EquipmentService:
         # convert the query results into 'EquipmentReservationRequest' models and return as a list
         return [result.to_model() for result in query_result]
 
-    def get_equipment_for_request(self, subject: User, model: str) -> list[Equipment]:
-        """returns a list of all available equipment corresponding to the checkout request's model"""
+    def get_equipment_for_request(
+        self, subject: User, model: str
+    ) -> list[EquipmentInventoryItem]:
+        """returns the ids and conditions of all available equipment of the checkout request's model"""
+
+        # query for the equipment that matches the checkout request model type AND is not checked out,
+        # selecting only the fields an ambassador chooses an item by
+        query = self._inventory_query(
+            EquipmentInventoryFilter(model=model, is_checked_out=False),
+            ["equipment_id", "model", "condition"],
+        ).order_by(EquipmentEntity.equipment_id)
+
+        return [
+            EquipmentInventoryItem(**row._asdict())
+            for row in self._session.execute(query)
+        ]
 
-        # query for all equipment that matches the checkout request model type AND is not checked out
-        query = select(EquipmentEntity).where(
-            EquipmentEntity.model == model,
-            EquipmentEntity.is_checked_out == False,
+    def get_inventory(
+        self,
+        pagination_params: PaginationParams,
+        inventory_filter: EquipmentInventoryFilter | None = None,
+        fields: list[str] | None = None,
+    ) -> Paginated[EquipmentInventoryItem]:
+        """
+        Gets a page of the equipment meeting the criteria of a filter, with only the selected fields
+
+        Equipment is ordered by `order_by`, which must be one of `INVENTORY_SORT_KEYS`, and pages
+        after the first are best requested by passing the previous page's `next_cursor`.
+
+        Args:
+            pagination_params (PaginationParams): the page to get, of which `filter` is ignored
+            inventory_filter (EquipmentInventoryFilter, optional): the criteria equipment must meet
+            fields (list[str], optional): the fields of equipment to select, all by default
+
+        Returns:
+            Paginated[EquipmentInventoryItem]: the page of equipment, whose fields which were not
+            selected are None
+
+        Raises:
+            ValueError if a field or `order_by` is unknown, or the cursor is malformed
+        """
+        inventory_filter = inventory_filter or EquipmentInventoryFilter()
+        fields = fields or self.INVENTORY_FIELDS
+        unknown = [field for field in fields if field not in self.INVENTORY_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown equipment field(s): {', '.join(unknown)}")
+
+        order_by = pagination_params.order_by or "equipment_id"
+        if order_by not in self.INVENTORY_SORT_KEYS:
+            raise ValueError(f"Equipment cannot be ordered by '{order_by}'.")
+        key = self.INVENTORY_SORT_KEYS[order_by]
+
+        # the sort key is selected, even if not requested, to produce the next cursor
+        statement = (
+            self._inventory_query(inventory_filter, fields)
+            .add_columns(*[column.label(f"_{column.key}") for column in key])
+            .order_by(*key)
+            .limit(pagination_params.page_size)
         )
+        if pagination_params.cursor != "":
+            values = decode_cursor(pagination_params.cursor, len(key))
+            statement = statement.where(after_cursor(key, values))
+        else:
+            statement = statement.offset(
+                pagination_params.page * pagination_params.page_size
+            )
+        rows = self._session.execute(statement).all()
 
-        # return list of queried equipment entities as equipment models
-        return [result.to_model() for result in self._session.scalars(query).all()]
+        next_cursor = ""
+        if len(rows) == pagination_params.page_size:
+            last = rows[-1]._asdict()
+            next_cursor = encode_cursor([last[f"_{column.key}"] for column in key])
+
+        length = self._session.scalar(
+            self._inventory_query(inventory_filter, []).with_only_columns(func.count())
+        )
+        return Paginated(
+            items=[
+                EquipmentInventoryItem(
+                    **{
+                        field: value
+                        for field, value in row._asdict().items()
+                        if field in fields
+                    }
+                )
+                for row in rows
+            ],
+            length=length,
+            params=pagination_params,
+            next_cursor=next_cursor,
+        )
 
     def update_waiver_signed_field(self, user: User) -> User:
         """Updates the signed_equipment_waiver field of a user after they have signed a waiver"""
@@ -356,6 +493,7 @@ class EquipmentService:
             entity_item.update(updated_user)
 
             self._session.commit()
+            invalidate_registered_user(entity_item.pid)
             return entity_item.to_model()
 
         # if user not found, raise exception
@@ -388,10 +526,11 @@ class EquipmentService:
         )
 
         # set id_choices field to ids of available equipment
-        staged_request.id_choices = [
-            eq.equipment_id
-            for eq in self.get_equipment_for_request(subject, staged_request.model)
-        ]
+        query = self._inventory_query(
+            EquipmentInventoryFilter(model=staged_request.model, is_checked_out=False),
+            ["equipment_id"],
+        ).order_by(EquipmentEntity.equipment_id)
+        staged_request.id_choices = list(self._session.scalars(query))
 
         # create new object
         staged_checkout_request_entity = StagedCheckoutRequestEntity.from_model(
@@ -400,7 +539,12 @@ class EquipmentService:
 
         # add new object to table and commit changes
         self._session.add(staged_checkout_request_entity)
-        self._session.commit()
+        try:
+            self._session.commit()
+        except IntegrityError:
+            # the user already has a staged request for the same type of equipment
+            self._session.rollback()
+            raise DuplicateEquipmentCheckoutRequestException(staged_request.model)
 
         # return added object
         return staged_checkout_request_entity.to_model()
@@ -426,8 +570,11 @@ class EquipmentService:
         )
 
         if staged_entity:
-            # delete entity from db and commit changes
+            # delete entity from db, leaving a tombstone for feeds of changes, and commit changes
             self._session.delete(staged_entity)
+            self._add_tombstone(
+                StagedCheckoutRequestEntity, staged_entity.pid, staged_entity.model
+            )
             self._session.commit()
         else:
             # raise exception
@@ -450,12 +597,56 @@ class EquipmentService:
         # convert the query results into 'Equipment' models and return as a list
         return [result.to_model() for result in query_result]
 
+    def get_changes(self, subject: User, since: str = "") -> EquipmentChanges:
+        """
+        Gets the changes to checkout requests, staged requests, and checkouts since a cursor
+
+        Changes are found by the indexed `updated_at` times of rows and the tombstones of deleted
+        requests. Each feed overlaps the previous one by `CHANGE_OVERLAP`, so that changes which
+        were committed late are not missed, and so may repeat a few changes.
+
+        Args:
+            subject (User): the user requesting the changes
+            since (str, optional): the cursor of the previous changes, or empty for a snapshot
+
+        Returns:
+            EquipmentChanges: the changes, or a snapshot if there is no cursor or it is older
+            than `TOMBSTONE_RETENTION`
+
+        Raises:
+            ValueError if the cursor is malformed
+        """
+        self._permission.enforce(subject, "equipment.view.checkout", "equipment")
+        now = datetime.now()
+        cursor = encode_cursor([now])
+
+        if since != "":
+            (since_at,) = decode_cursor(since, 1)
+            try:
+                since_at = datetime.fromisoformat(since_at)
+            except (TypeError, ValueError):
+                raise ValueError("Malformed pagination cursor.")
+            if since_at > now - self.TOMBSTONE_RETENTION:
+                return self._changes_after(since_at - self.CHANGE_OVERLAP, cursor)
+
+        return EquipmentChanges(
+            requests=self.get_all_requests(subject),
+            staged_requests=self.get_all_staged_requests(subject),
+            checkouts=self.get_all_active_checkouts(subject),
+            reset=True,
+            cursor=cursor,
+        )
+
     def create_checkout(
         self, checkout: EquipmentCheckout, subject: User
     ) -> EquipmentCheckout:
         """
         Creates a new checkout entity and adds it to the database
         Updates the is_checked_out field of the equipment item being checked out to be True
+        and appends the PID of the user checking it out to the item's checkout history
+
+        The item is claimed with a conditional update, so that of concurrent checkouts of the
+        same item only one succeeds, and everything is committed in a single transaction.
 
         Args:
             Request (EquipmentCheckout): the checkout to add.
@@ -467,28 +658,43 @@ class EquipmentService:
         Raises:
             EquipmentAlreadyCheckedOutException if the equipment already has an active
             checkout associated with it
+            EquipmentNotFoundException if there is no equipment item with the checkout's
+            equipment id
         """
         self._permission.enforce(subject, "equipment.crud.checkout", "equipment")
 
-        equipment_checkout_entity = EquipmentCheckoutEntity.from_model(checkout)
+        # claim the equipment item only if it is not already checked out
+        claim = (
+            update(EquipmentEntity)
+            .where(
+                EquipmentEntity.equipment_id == checkout.equipment_id,
+                EquipmentEntity.is_checked_out == False,
+            )
+            .values(is_checked_out=True)
+            .returning(EquipmentEntity.id)
+        )
+        if self._session.execute(claim).first() is None:
+            self._session.rollback()
+            self._raise_unavailable(checkout.equipment_id)
 
-        # add new object to table
+        equipment_checkout_entity = EquipmentCheckoutEntity.from_model(checkout)
         self._session.add(equipment_checkout_entity)
-
-        # get equipment model to be updated
-        equipment_item: Equipment = self.get_equipment_by_id(
-            checkout.equipment_id, subject
+        self._session.add(
+            EquipmentCheckoutHistoryEntity(
+                equipment_id=checkout.equipment_id,
+                pid=checkout.pid,
+                checked_out_at=checkout.started_at,
+            )
         )
-        # if item is already checked out, raise exception
-        if equipment_item.is_checked_out:
+        try:
+            self._session.commit()
+        except IntegrityError:
+            # another active checkout of the item exists (see EquipmentCheckoutEntity)
+            self._session.rollback()
             raise EquipmentAlreadyCheckedOutException(checkout.equipment_id)
-        # change is_checked_out field to true
-        equipment_item.is_checked_out = True
-        # update equipment entity to be checked out
-        self.update(equipment_item, subject)
-
-        self._session.commit()
 
+        equipment_type_cache.clear()
+        overdue_checkout_cache.clear()
         return equipment_checkout_entity.to_model()
 
     def return_checkout(
@@ -499,6 +705,8 @@ class EquipmentService:
         Changes the end_at field of the checkout to the time of the return
         Changes the is_checked_out field of the equipment item being returned to be False
 
+        Both changes are committed in a single transaction.
+
         Args:
             checkout (EquipmentCheckout): the checkout being returned
             subject (User): the user confirming the checkout return
@@ -517,38 +725,294 @@ class EquipmentService:
         if not checkout.is_active:
             raise Exception("The equipment you are trying to return is not checked out")
 
-        # get equipment model to be updated
-        equipment_item: Equipment = self.get_equipment_by_id(
-            checkout.equipment_id, subject
+        # end the active checkout of the item, of which there can only be one
+        end_checkout = (
+            update(EquipmentCheckoutEntity)
+            .where(
+                EquipmentCheckoutEntity.equipment_id == checkout.equipment_id,
+                EquipmentCheckoutEntity.is_active == True,
+            )
+            .values(is_active=False, end_at=datetime.now())
+            .returning(EquipmentCheckoutEntity)
         )
-        # change is_checked_out field to false
-        equipment_item.is_checked_out = False
-        # update equipment entity to be checked out
-        self.update(equipment_item, subject)
+        entity_item: EquipmentCheckoutEntity | None = self._session.scalar(end_checkout)
+        if entity_item is None:
+            self._session.rollback()
+            raise EquipmentCheckoutNotFoundException(checkout.equipment_id)
 
-        # get matching checkout from the db
-        # matching equipment_id and is_active will ensure it is the same
-        # checkout, there can only be one active checkout at once for a given item
-        query = select(EquipmentCheckoutEntity).where(
-            EquipmentCheckoutEntity.equipment_id == checkout.equipment_id,
-            EquipmentCheckoutEntity.is_active == checkout.is_active,
+        self._session.execute(
+            update(EquipmentEntity)
+            .where(EquipmentEntity.equipment_id == checkout.equipment_id)
+            .values(is_checked_out=False)
         )
-        entity_item: EquipmentCheckoutEntity | None = self._session.scalar(query)
+        self._session.commit()
 
-        # set time that the return happened
-        checkout.end_at = datetime.now()
-        # set is_active to false
-        checkout.is_active = False
+        equipment_type_cache.clear()
+        overdue_checkout_cache.clear()
+        return entity_item.to_model()
 
-        # if matching checkout exists, update it
-        if entity_item:
-            entity_item.update(checkout)
+    def get_checkout_history(
+        self, equipment_id: int, subject: User, pagination_params: PaginationParams
+    ) -> Paginated[EquipmentCheckoutHistory]:
+        """
+        Gets a page of the checkout history of an equipment item, newest first
 
-            self._session.commit()
-            return entity_item.to_model()
-        # if no checkout was found, raise exception
+        Pages after the first are best requested by passing the previous page's `next_cursor`.
+
+        Args:
+            equipment_id (int): the equipment id of the item
+            subject (User): the user requesting the history
+            pagination_params (PaginationParams): the page to get, of which `order_by` and
+            `filter` are ignored
+
+        Returns:
+            Paginated[EquipmentCheckoutHistory]: the page of the item's checkout history
+
+        Raises:
+            EquipmentNotFoundException if there is no equipment item with the given id
+            ValueError if the cursor is malformed
+        """
+        self._permission.enforce(subject, "equipment.view.checkout", "equipment")
+        return self._page_by_item(
+            EquipmentCheckoutHistoryEntity,
+            EquipmentCheckoutHistoryEntity.checked_out_at,
+            equipment_id,
+            pagination_params,
+        )
+
+    def get_condition_notes(
+        self, equipment_id: int, subject: User, pagination_params: PaginationParams
+    ) -> Paginated[EquipmentConditionNote]:
+        """
+        Gets a page of the notes on the condition of an equipment item, newest first
+
+        Args:
+            equipment_id (int): the equipment id of the item
+            subject (User): the user requesting the notes
+            pagination_params (PaginationParams): the page to get, of which `order_by` and
+            `filter` are ignored
+
+        Returns:
+            Paginated[EquipmentConditionNote]: the page of the item's condition notes
+
+        Raises:
+            EquipmentNotFoundException if there is no equipment item with the given id
+            ValueError if the cursor is malformed
+        """
+        self._permission.enforce(subject, "equipment.view.checkout", "equipment")
+        return self._page_by_item(
+            EquipmentConditionNoteEntity,
+            EquipmentConditionNoteEntity.created_at,
+            equipment_id,
+            pagination_params,
+        )
+
+    def add_condition_note(
+        self, note: EquipmentConditionNote, subject: User
+    ) -> EquipmentConditionNote:
+        """
+        Adds a note on the condition of an equipment item
+
+        Args:
+            note (EquipmentConditionNote): the note to add, made now if it has no time
+            subject (User): the user adding the note
+
+        Returns:
+            EquipmentConditionNote: the note that was added
+
+        Raises:
+            EquipmentNotFoundException if there is no equipment item with the note's equipment id
+        """
+        self._permission.enforce(subject, "equipment.crud.checkout", "equipment")
+        self._ensure_equipment_exists(note.equipment_id)
+
+        entity = EquipmentConditionNoteEntity.from_model(note)
+        self._session.add(entity)
+        self._session.commit()
+        return entity.to_model()
+
+    def get_utilization(
+        self,
+        equipment_id: int,
+        subject: User,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> EquipmentUtilization:
+        """
+        Gets how much an equipment item was checked out within a window of time
+
+        Args:
+            equipment_id (int): the equipment id of the item
+            subject (User): the user requesting the utilization
+            start (datetime, optional): the start of the window, 30 days before its end by default
+            end (datetime, optional): the end of the window, now by default
+
+        Returns:
+            EquipmentUtilization: the number of checkouts overlapping the window and the time
+            within the window the item was checked out
+
+        Raises:
+            EquipmentNotFoundException if there is no equipment item with the given id
+            ValueError if the window ends before it starts
+        """
+        self._permission.enforce(subject, "equipment.view.checkout", "equipment")
+        now = datetime.now()
+        end = now if end is None else local_time(end)
+        start = end - timedelta(days=30) if start is None else local_time(start)
+        if end <= start:
+            raise ValueError("The utilization window must end after it starts.")
+        self._ensure_equipment_exists(equipment_id)
+
+        # time each checkout overlaps the window, where active checkouts have not yet ended
+        returned_at = case(
+            (EquipmentCheckoutEntity.is_active, now),
+            else_=EquipmentCheckoutEntity.end_at,
+        )
+        overlap = func.least(returned_at, end) - func.greatest(
+            EquipmentCheckoutEntity.started_at, start
+        )
+        query = select(
+            func.count(),
+            func.coalesce(
+                func.sum(func.greatest(func.extract("epoch", overlap), 0)), 0
+            ),
+        ).where(
+            EquipmentCheckoutEntity.equipment_id == equipment_id,
+            EquipmentCheckoutEntity.started_at < end,
+            returned_at > start,
+        )
+        checkouts, seconds = self._session.execute(query).one()
+
+        return EquipmentUtilization(
+            equipment_id=equipment_id,
+            start=start,
+            end=end,
+            checkouts=checkouts,
+            checked_out_seconds=float(seconds),
+            utilization=float(seconds) / (end - start).total_seconds(),
+        )
+
+    def _page_by_item(
+        self,
+        entity: type[EquipmentCheckoutHistoryEntity | EquipmentConditionNoteEntity],
+        time: InstrumentedAttribute,
+        equipment_id: int,
+        pagination_params: PaginationParams,
+    ) -> Paginated:
+        """Page through the rows of an append-only table about an item, newest first."""
+        self._ensure_equipment_exists(equipment_id)
+
+        key = (time, entity.id)
+        statement = (
+            select(entity)
+            .where(entity.equipment_id == equipment_id)
+            .order_by(time.desc(), entity.id.desc())
+            .limit(pagination_params.page_size)
+        )
+        if pagination_params.cursor != "":
+            values = decode_cursor(pagination_params.cursor, len(key))
+            statement = statement.where(after_cursor(key, values, descending=True))
         else:
-            raise EquipmentCheckoutNotFoundException(checkout.equipment_id)
+            statement = statement.offset(
+                pagination_params.page * pagination_params.page_size
+            )
+        entities = self._session.scalars(statement).all()
+
+        next_cursor = ""
+        if len(entities) == pagination_params.page_size:
+            next_cursor = encode_cursor(
+                [getattr(entities[-1], column.key) for column in key]
+            )
+
+        length = self._session.scalar(
+            select(func.count())
+            .select_from(entity)
+            .where(entity.equipment_id == equipment_id)
+        )
+        return Paginated(
+            items=[item.to_model() for item in entities],
+            length=length,
+            params=pagination_params,
+            next_cursor=next_cursor,
+        )
+
+    def _changes_after(self, after: datetime, cursor: str) -> EquipmentChanges:
+        """Collect rows changed and requests deleted after a time."""
+
+        def changed(entity):
+            query = select(entity).where(entity.updated_at > after)
+            return [row.to_model() for row in self._session.scalars(query)]
+
+        deleted: dict[str, list[EquipmentRequestKey]] = {
+            EquipmentCheckoutRequestEntity.__tablename__: [],
+            StagedCheckoutRequestEntity.__tablename__: [],
+        }
+        query = select(EquipmentTombstoneEntity).where(
+            EquipmentTombstoneEntity.deleted_at > after
+        )
+        for tombstone in self._session.scalars(query):
+            deleted[tombstone.table_name].append(
+                EquipmentRequestKey(pid=tombstone.pid, model=tombstone.model)
+            )
+
+        return EquipmentChanges(
+            requests=changed(EquipmentCheckoutRequestEntity),
+            staged_requests=changed(StagedCheckoutRequestEntity),
+            checkouts=changed(EquipmentCheckoutEntity),
+            deleted_requests=deleted[EquipmentCheckoutRequestEntity.__tablename__],
+            deleted_staged_requests=deleted[StagedCheckoutRequestEntity.__tablename__],
+            cursor=cursor,
+        )
+
+    def _add_tombstone(self, entity: type, pid: int, model: str) -> None:
+        """Record the deletion of a request, and forget deletions older than the retention."""
+        self._session.execute(
+            delete(EquipmentTombstoneEntity).where(
+                EquipmentTombstoneEntity.deleted_at
+                < datetime.now() - self.TOMBSTONE_RETENTION
+            )
+        )
+        self._session.add(
+            EquipmentTombstoneEntity(
+                table_name=entity.__tablename__, pid=pid, model=model
+            )
+        )
+
+    def _inventory_query(
+        self, inventory_filter: EquipmentInventoryFilter, fields: list[str]
+    ) -> Select:
+        """Select the given fields of the equipment meeting the criteria of a filter."""
+        query = select(
+            *[getattr(EquipmentEntity, field) for field in fields]
+        ).select_from(EquipmentEntity)
+        if inventory_filter.model is not None:
+            query = query.where(EquipmentEntity.model == inventory_filter.model)
+        if inventory_filter.is_checked_out is not None:
+            query = query.where(
+                EquipmentEntity.is_checked_out == inventory_filter.is_checked_out
+            )
+        if inventory_filter.min_condition is not None:
+            query = query.where(
+                EquipmentEntity.condition >= inventory_filter.min_condition
+            )
+        if inventory_filter.max_condition is not None:
+            query = query.where(
+                EquipmentEntity.condition <= inventory_filter.max_condition
+            )
+        return query
+
+    def _ensure_equipment_exists(self, equipment_id: int) -> None:
+        """Raise EquipmentNotFoundException if there is no item with the given equipment id."""
+        query = select(EquipmentEntity.id).where(
+            EquipmentEntity.equipment_id == equipment_id
+        )
+        if self._session.scalar(query) is None:
+            raise EquipmentNotFoundException(equipment_id)
+
+    def _raise_unavailable(self, equipment_id: int) -> None:
+        """Raise the reason an equipment item could not be claimed for a checkout."""
+        self._ensure_equipment_exists(equipment_id)
+        raise EquipmentAlreadyCheckedOutException(equipment_id)
 
     # TODO: Uncomment during sp02 if we decide to add admin functions for adding/deleting equipment.
     # def add_item(self, item: Equipment) -> Equipment:
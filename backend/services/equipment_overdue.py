@@ -0,0 +1,268 @@
+"""
+Overdue Checkout Service finds active equipment checkouts which have overrun their loan period.
+
+Each type of equipment may have a loan policy, and otherwise is loaned for a default period.
+Rather than every ambassador dashboard load comparing all active checkouts against their loan
+periods, `OverdueCheckoutScanner` periodically scans for overdue checkouts in a background
+thread and caches the report, which ambassadors are then served. The scan is served by a partial
+index on the start times of active checkouts.
+"""
+
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from threading import Event, Thread
+from typing import Callable
+from fastapi import Depends
+from sqlalchemy import Interval, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from ..database import db_session, engine
+from ..models import User
+from ..models.equipment_overdue import (
+    EquipmentLoanPolicy,
+    OverdueCheckout,
+    OverdueReport,
+    OverdueSummary,
+)
+from ..entities.equipment_checkout_entity import EquipmentCheckoutEntity
+from ..entities.equipment_loan_policy_entity import EquipmentLoanPolicyEntity
+from .cache import OVERDUE_CHECKOUTS_KEY, overdue_checkout_cache
+from .permission import PermissionService
+
+__authors__ = ["Nicholas Mountain, Jacob Brown"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+logger = logging.getLogger(__name__)
+
+
+class OverdueCheckoutService:
+    """OverdueCheckoutService reports overdue checkouts and manages equipment loan policies."""
+
+    DEFAULT_LOAN_PERIOD = timedelta(days=7)
+    """How long equipment of a model without a loan policy may be checked out for."""
+
+    def __init__(
+        self,
+        session: Session = Depends(db_session),
+        permission: PermissionService = Depends(),
+    ):
+        """Initialize a new OverdueCheckoutService instance.
+
+        Both arguments are optional and will be typically be injected.
+
+        Args:
+            session (Session, optional): The SQLAlchemy session to use.
+            permission (PermissionService, optional): The PermissionService contains the logic for User and Role permission granting and checking.
+        """
+        self._session = session
+        self._permission = permission
+
+    def get_report(self, subject: User) -> OverdueReport:
+        """Get the latest report of overdue checkouts, scanning for them if there is none.
+
+        The subject must have the `equipment.view.checkout` permission on `equipment`.
+
+        Args:
+            subject (User): The user making the request.
+
+        Returns:
+            OverdueReport: The overdue checkouts, as of the report's `scanned_at` time.
+
+        Raises:
+            UserPermissionException: If the subject does not have permission to view checkouts.
+        """
+        self._permission.enforce(subject, "equipment.view.checkout", "equipment")
+        report = overdue_checkout_cache.get(OVERDUE_CHECKOUTS_KEY)
+        if report is None:
+            report = self.scan()
+        return report.model_copy()
+
+    def get_summary(self, subject: User) -> OverdueSummary:
+        """Get aggregate metrics of the latest report of overdue checkouts.
+
+        The subject must have the `equipment.view.checkout` permission on `equipment`.
+
+        Args:
+            subject (User): The user making the request.
+
+        Returns:
+            OverdueSummary: The number of overdue checkouts, in total and of each model.
+
+        Raises:
+            UserPermissionException: If the subject does not have permission to view checkouts.
+        """
+        report = self.get_report(subject)
+        return OverdueSummary.model_validate(report.model_dump(exclude={"checkouts"}))
+
+    def scan(self, now: datetime | None = None) -> OverdueReport:
+        """Scan active checkouts for those which are overdue and cache the report.
+
+        This method does not enforce permissions, as it is run by `OverdueCheckoutScanner`.
+
+        Args:
+            now (datetime, optional): The time to find checkouts overdue as of, now by default.
+
+        Returns:
+            OverdueReport: The overdue checkouts, longest overdue first.
+        """
+        now = now or datetime.now()
+        default_period = literal(self.DEFAULT_LOAN_PERIOD, Interval)
+        loan_period = func.coalesce(
+            EquipmentLoanPolicyEntity.loan_period, default_period
+        )
+        due_at = (EquipmentCheckoutEntity.started_at + loan_period).label("due_at")
+
+        # No checkout is overdue before the shortest loan period has passed, so only active
+        # checkouts started before then need to be read from the partial index.
+        shortest = self._session.scalar(
+            select(func.min(EquipmentLoanPolicyEntity.loan_period))
+        )
+        shortest = min(shortest or self.DEFAULT_LOAN_PERIOD, self.DEFAULT_LOAN_PERIOD)
+
+        query = (
+            select(EquipmentCheckoutEntity, due_at)
+            .outerjoin(
+                EquipmentLoanPolicyEntity,
+                EquipmentLoanPolicyEntity.model == EquipmentCheckoutEntity.model,
+            )
+            .where(
+                EquipmentCheckoutEntity.is_active == True,
+                EquipmentCheckoutEntity.started_at < now - shortest,
+                due_at < now,
+            )
+            .order_by(due_at, EquipmentCheckoutEntity.id)
+        )
+        checkouts = [
+            OverdueCheckout(
+                user_name=checkout.user_name,
+                pid=checkout.pid,
+                equipment_id=checkout.equipment_id,
+                model=checkout.model,
+                started_at=checkout.started_at,
+                due_at=due_at,
+            )
+            for checkout, due_at in self._session.execute(query)
+        ]
+
+        report = OverdueReport(
+            scanned_at=now,
+            count=len(checkouts),
+            by_model=Counter(checkout.model for checkout in checkouts),
+            oldest_due_at=checkouts[0].due_at if checkouts else None,
+            checkouts=checkouts,
+        )
+        overdue_checkout_cache.set(OVERDUE_CHECKOUTS_KEY, report)
+        return report
+
+    def get_loan_policies(self, subject: User) -> list[EquipmentLoanPolicy]:
+        """Get the loan policies of all models of equipment which have one.
+
+        The subject must have the `equipment.view.checkout` permission on `equipment`.
+
+        Args:
+            subject (User): The user making the request.
+
+        Returns:
+            list[EquipmentLoanPolicy]: The loan policies, ordered by model.
+
+        Raises:
+            UserPermissionException: If the subject does not have permission to view checkouts.
+        """
+        self._permission.enforce(subject, "equipment.view.checkout", "equipment")
+        query = select(EquipmentLoanPolicyEntity).order_by(
+            EquipmentLoanPolicyEntity.model
+        )
+        return [entity.to_model() for entity in self._session.scalars(query)]
+
+    def set_loan_policy(
+        self, subject: User, policy: EquipmentLoanPolicy
+    ) -> EquipmentLoanPolicy:
+        """Create or replace the loan policy of a model of equipment.
+
+        The subject must have the `equipment.crud.checkout` permission on `equipment`.
+
+        Args:
+            subject (User): The user making the request.
+            policy (EquipmentLoanPolicy): The loan policy.
+
+        Returns:
+            EquipmentLoanPolicy: The loan policy.
+
+        Raises:
+            UserPermissionException: If the subject does not have permission to manage checkouts.
+        """
+        self._permission.enforce(subject, "equipment.crud.checkout", "equipment")
+        statement = insert(EquipmentLoanPolicyEntity).values(
+            model=policy.model, loan_period=policy.loan_period
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[EquipmentLoanPolicyEntity.model],
+            set_={"loan_period": statement.excluded.loan_period},
+        )
+        self._session.execute(statement)
+        self._session.commit()
+        overdue_checkout_cache.clear()
+        return policy
+
+
+class OverdueCheckoutScanner:
+    """Runs `OverdueCheckoutService.scan` periodically in a background thread."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        interval: timedelta = timedelta(minutes=5),
+    ):
+        """Initialize the scanner.
+
+        Args:
+            session_factory (Callable[[], Session]): Opens a database session for each scan.
+            interval (timedelta, optional): How long to wait between scans.
+        """
+        self._session_factory = session_factory
+        self._interval = interval
+        self._stopped = Event()
+        self._thread: Thread | None = None
+
+    def start(self) -> None:
+        """Start scanning, if not already started."""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = Thread(
+            target=self._run, name="overdue-checkout-scanner", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop scanning and wait for a scan in progress to complete."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def scan(self) -> OverdueReport:
+        """Scan for overdue checkouts now.
+
+        Returns:
+            OverdueReport: The overdue checkouts."""
+        with self._session_factory() as session:
+            return OverdueCheckoutService(session, PermissionService(session)).scan()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.scan()
+            except Exception:
+                logger.exception("Scanning for overdue equipment checkouts failed")
+            self._stopped.wait(self._interval.total_seconds())
+
+
+_overdue_checkout_scanner = OverdueCheckoutScanner(lambda: Session(engine))
+
+
+def overdue_checkout_scanner() -> OverdueCheckoutScanner:
+    """Dependency injection function for the application's OverdueCheckoutScanner."""
+    return _overdue_checkout_scanner
@@ -2,26 +2,53 @@
 The Event Service allows the API to manipulate event data in the database.
 """
 
+import hashlib
+from datetime import datetime, timedelta, timezone
 from fastapi import Depends
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, exists, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, contains_eager, selectinload
 
 from backend.models.user import User
-from ..database import db_session
+from ..database import db_read_session, db_session
 from backend.models.event import Event
 from backend.models.event_details import EventDetails
-from ..entities import EventEntity, OrganizationEntity
+from backend.models.event_calendar import EventCalendar
+from backend.models.event_rsvp import EventRsvp
+from backend.models.event_feed import EventFeed, EventFeedOrganization
+from backend.models.pagination import Paginated, PaginationParams
+from backend.models.search import EventSearchResult
+from ..entities import EventEntity, EventRsvpEntity, OrganizationEntity
 from .permission import PermissionService
-from .exceptions import ResourceNotFoundException
+from .cache import ALL_EVENTS_CALENDAR_KEY, event_calendar_cache
+from .exceptions import OrganizationNotFoundException, ResourceNotFoundException
+from .icalendar import render_calendar
+from .local_time import LOCAL_TIME_ZONE, local_time
+from .pagination import after_cursor, decode_cursor, encode_cursor
+from .search import headline, text_query
 
 __authors__ = ["Ajay Gandecha", "Jade Keegan", "Brianna Ta", "Audrey Toney"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
 
+class EventFullException(Exception):
+    """EventFullException is raised when a user tries to RSVP to an event which has reached its capacity"""
+
+    def __init__(self, id: int):
+        super().__init__(f"Event with id: {id} has reached its capacity")
+
+
 class EventService:
     """Service that performs all of the actions on the `Event` table"""
 
+    CALENDAR_HISTORY = timedelta(days=180)
+    """How long past events remain listed in calendars."""
+
+    CALENDAR_CHUNK_ROWS = 500
+    """Number of events read from the database cursor at a time when rendering a calendar."""
+
     def __init__(
         self,
         session: Session = Depends(db_session),
@@ -38,13 +65,210 @@ class EventService:
         Returns:
             list[EventDetails]: List of all `EventDetails`
         """
-        # Select all entries in `Event` table
-        query = select(EventEntity)
+        # Select all entries in `Event` table, loading their organizations in one more query
+        query = select(EventEntity).options(selectinload(EventEntity.organization))
         entities = self._session.scalars(query).all()
 
         # Convert entities to details models and return
         return [entity.to_details_model() for entity in entities]
 
+    def feed(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        cursor: str = "",
+        limit: int = 50,
+    ) -> EventFeed:
+        """
+        Retrieves a page of events within a window of time, in order of time
+
+        The page costs two queries however many events there are: one for the events, served by
+        the index on (`time`, `id`), and one for the organizations hosting them.
+
+        Parameters:
+            start: only include events at or after this time
+            end: only include events before this time
+            cursor: the `next_cursor` of the previous page, or empty for the first page
+            limit: the maximum number of events on the page
+
+        Returns:
+            EventFeed: the page of events and the organizations hosting them
+
+        Raises:
+            ValueError: if the cursor is malformed
+        """
+        key = (EventEntity.time, EventEntity.id)
+        query = select(EventEntity).order_by(*key).limit(limit)
+        if start is not None:
+            query = query.where(EventEntity.time >= local_time(start))
+        if end is not None:
+            query = query.where(EventEntity.time < local_time(end))
+        if cursor != "":
+            query = query.where(after_cursor(key, decode_cursor(cursor, len(key))))
+        entities = self._session.scalars(query).all()
+
+        organizations: dict[int, EventFeedOrganization] = {}
+        organization_ids = {entity.organization_id for entity in entities}
+        if organization_ids:
+            organization_query = select(
+                OrganizationEntity.id,
+                OrganizationEntity.name,
+                OrganizationEntity.shorthand,
+                OrganizationEntity.slug,
+                OrganizationEntity.logo,
+            ).where(OrganizationEntity.id.in_(organization_ids))
+            for row in self._session.execute(organization_query):
+                organizations[row.id] = EventFeedOrganization(**row._asdict())
+
+        next_cursor = ""
+        if len(entities) == limit:
+            next_cursor = encode_cursor([entities[-1].time, entities[-1].id])
+
+        return EventFeed(
+            events=[entity.to_model() for entity in entities],
+            organizations=organizations,
+            next_cursor=next_cursor,
+        )
+
+    def search(
+        self, pagination_params: PaginationParams
+    ) -> Paginated[EventSearchResult]:
+        """
+        Searches events by their name, location, and description, most relevant first
+
+        Matches in an event's name rank above matches in its location, which rank above matches
+        in its description. Only the page of matching events is read, through the index of the
+        events' search vectors, and excerpts are only made of the events on the page.
+
+        Parameters:
+            pagination_params: the page to get, of which `filter` is the search query and
+                `order_by` and `cursor` are ignored
+
+        Returns:
+            Paginated[EventSearchResult]: the page of matching events, with their organizations
+        """
+        tsquery = text_query(pagination_params.filter)
+        match = EventEntity.search_vector.op("@@")(tsquery)
+        rank = func.ts_rank_cd(EventEntity.search_vector, tsquery)
+
+        page = (
+            select(EventEntity.id, rank.label("rank"))
+            .where(match)
+            .order_by(rank.desc(), EventEntity.time, EventEntity.id)
+            .offset(pagination_params.page * pagination_params.page_size)
+            .limit(pagination_params.page_size)
+            .subquery()
+        )
+        query = (
+            select(
+                EventEntity,
+                OrganizationEntity.id,
+                OrganizationEntity.name,
+                OrganizationEntity.shorthand,
+                OrganizationEntity.slug,
+                OrganizationEntity.logo,
+                headline(EventEntity.description, tsquery),
+                page.c.rank,
+            )
+            .join(page, page.c.id == EventEntity.id)
+            .join(OrganizationEntity)
+            .order_by(page.c.rank.desc(), EventEntity.time, EventEntity.id)
+        )
+        items = [
+            EventSearchResult(
+                event=entity.to_model(),
+                organization=EventFeedOrganization(
+                    id=id, name=name, shorthand=shorthand, slug=slug, logo=logo
+                ),
+                headline=excerpt,
+                rank=rank,
+            )
+            for entity, id, name, shorthand, slug, logo, excerpt, rank in self._session.execute(
+                query
+            )
+        ]
+
+        length = self._session.scalar(
+            select(func.count()).select_from(EventEntity).where(match)
+        )
+        return Paginated(items=items, length=length, params=pagination_params)
+
+    def calendar(self, slug: str | None = None) -> EventCalendar:
+        """
+        Get the iCalendar feed of public events, or of those hosted by an organization
+
+        Feeds are polled hourly by the calendar apps of every subscriber, so rendered feeds are
+        cached until an event changes. On a miss, only the columns of the feed's events are read,
+        through a server-side cursor, and rendered as they are read.
+
+        Feeds are stamped with when the newest of their events was created or changed, so that
+        rendering the same events again produces the same feed, with the same ETag.
+
+        Parameters:
+            slug: the slug of the organization hosting the events, or None for all public events
+
+        Returns:
+            EventCalendar: the rendered feed
+
+        Raises:
+            OrganizationNotFoundException: if no organization has the slug
+        """
+        key = ALL_EVENTS_CALENDAR_KEY if slug is None else slug
+        calendar = event_calendar_cache.get(key)
+        if calendar is not None:
+            return calendar
+
+        now = datetime.now(timezone.utc)
+        criteria = [
+            EventEntity.public == True,
+            EventEntity.time >= local_time(now - self.CALENDAR_HISTORY),
+        ]
+        name = "CSXL Events"
+        if slug is not None:
+            organization = self._session.execute(
+                select(OrganizationEntity.id, OrganizationEntity.name).where(
+                    OrganizationEntity.slug == slug
+                )
+            ).one_or_none()
+            if organization is None:
+                raise OrganizationNotFoundException(slug)
+            criteria.append(EventEntity.organization_id == organization.id)
+            name = f"{organization.name} Events"
+
+        updated_at = self._session.scalar(
+            select(func.max(EventEntity.updated_at)).where(*criteria)
+        )
+        last_modified = (
+            None
+            if updated_at is None
+            else updated_at.replace(microsecond=0, tzinfo=LOCAL_TIME_ZONE)
+        )
+
+        query = (
+            select(
+                EventEntity.id,
+                EventEntity.name,
+                EventEntity.time,
+                EventEntity.location,
+                EventEntity.description,
+            )
+            .where(*criteria)
+            .order_by(EventEntity.time, EventEntity.id)
+        )
+        result = self._session.execute(
+            query.execution_options(yield_per=self.CALENDAR_CHUNK_ROWS)
+        )
+        content = "".join(render_calendar(name, result, last_modified)).encode()
+        result.close()
+
+        calendar = EventCalendar(
+            content=content,
+            etag=f'"{hashlib.sha256(content).hexdigest()[:32]}"',
+            last_modified=last_modified,
+        )
+        event_calendar_cache.set(key, calendar)
+        return calendar
+
     def create(self, subject: User, event: Event) -> EventDetails:
         """
         Creates a event based on the input object and adds it to the table.
@@ -75,6 +299,7 @@ class EventService:
         # Add new object to table and commit changes
         self._session.add(event_entity)
         self._session.commit()
+        event_calendar_cache.clear()
 
         # Return added object
         return event_entity.to_details_model()
@@ -112,21 +337,13 @@ class EventService:
             list[EventDetail]: a list of valid EventDetails models
         """
 
-        # Query the organization with the matching slug
-        organization = (
-            self._session.query(OrganizationEntity)
-            .filter(OrganizationEntity.slug == slug)
-            .one_or_none()
-        )
-
-        # Ensure that the organization exists
-        if organization is None:
-            return []
-
-        # Query the event with matching organization slug
+        # Query the events of the organization with the matching slug, joining the organization
+        # rather than querying it first
         events = (
             self._session.query(EventEntity)
-            .filter(EventEntity.organization_id == organization.id)
+            .join(EventEntity.organization)
+            .filter(OrganizationEntity.slug == slug)
+            .options(contains_eager(EventEntity.organization))
             .all()
         )
 
@@ -164,9 +381,12 @@ class EventService:
         event_entity.description = event.description
         event_entity.location = event.location
         event_entity.public = event.public
+        event_entity.capacity = event.capacity
+        event_entity.updated_at = datetime.now()
 
         # Save changes
         self._session.commit()
+        event_calendar_cache.clear()
 
         # Return updated object
         return event_entity.to_details_model()
@@ -199,3 +419,140 @@ class EventService:
 
         # Save changes
         self._session.commit()
+        event_calendar_cache.clear()
+
+    def get_rsvp(self, subject: User, id: int) -> EventRsvp:
+        """
+        Get whether the subject has RSVP'd to an event, and how many have
+
+        Parameters:
+            subject: a valid User model representing the currently logged in User
+            id: an int representing a unique event ID
+
+        Returns:
+            EventRsvp: the subject's RSVP to the event
+
+        Raises:
+            ResourceNotFoundException: if no event has the ID
+        """
+        attending = exists().where(
+            EventRsvpEntity.event_id == EventEntity.id,
+            EventRsvpEntity.user_id == subject.id,
+        )
+        row = self._session.execute(
+            select(EventEntity.rsvp_count, EventEntity.capacity, attending).where(
+                EventEntity.id == id
+            )
+        ).one_or_none()
+        if row is None:
+            raise ResourceNotFoundException(f"No event found with matching ID: {id}")
+        rsvp_count, capacity, attending = row
+        return EventRsvp(
+            event_id=id, attending=attending, rsvp_count=rsvp_count, capacity=capacity
+        )
+
+    def rsvp(self, subject: User, id: int) -> EventRsvp:
+        """
+        RSVP the subject to an event, if it has not reached its capacity
+
+        RSVPs are counted on the event's `rsvp_count`, which is incremented only if it is below
+        the event's capacity, in the same statement that checks it. So bursts of RSVPs neither
+        exceed the capacity nor recount the event's RSVPs. The subject's RSVP is inserted before
+        the count is incremented, so repeated RSVPs are settled by the unique key of the RSVP
+        without locking the event.
+
+        Parameters:
+            subject: a valid User model representing the currently logged in User
+            id: an int representing a unique event ID
+
+        Returns:
+            EventRsvp: the subject's RSVP to the event
+
+        Raises:
+            ResourceNotFoundException: if no event has the ID
+            EventFullException: if the event has reached its capacity
+        """
+        try:
+            inserted = self._session.scalar(
+                insert(EventRsvpEntity)
+                .values(event_id=id, user_id=subject.id, created_at=datetime.now())
+                .on_conflict_do_nothing()
+                .returning(EventRsvpEntity.event_id)
+            )
+        except IntegrityError:
+            self._session.rollback()
+            raise ResourceNotFoundException(f"No event found with matching ID: {id}")
+
+        if inserted is None:
+            # The subject has already RSVP'd
+            self._session.rollback()
+            return self.get_rsvp(subject, id)
+
+        counted = self._session.execute(
+            update(EventEntity)
+            .where(
+                EventEntity.id == id,
+                or_(
+                    EventEntity.capacity == None,
+                    EventEntity.rsvp_count < EventEntity.capacity,
+                ),
+            )
+            .values(rsvp_count=EventEntity.rsvp_count + 1)
+            .returning(EventEntity.rsvp_count, EventEntity.capacity)
+            .execution_options(synchronize_session=False)
+        ).one_or_none()
+        if counted is None:
+            self._session.rollback()
+            raise EventFullException(id)
+
+        self._session.commit()
+        rsvp_count, capacity = counted
+        return EventRsvp(
+            event_id=id, attending=True, rsvp_count=rsvp_count, capacity=capacity
+        )
+
+    def cancel_rsvp(self, subject: User, id: int) -> EventRsvp:
+        """
+        Cancel the subject's RSVP to an event, if they have RSVP'd
+
+        Parameters:
+            subject: a valid User model representing the currently logged in User
+            id: an int representing a unique event ID
+
+        Returns:
+            EventRsvp: the subject's RSVP to the event, which is no longer attending
+
+        Raises:
+            ResourceNotFoundException: if no event has the ID
+        """
+        deleted = self._session.scalar(
+            delete(EventRsvpEntity)
+            .where(
+                EventRsvpEntity.event_id == id, EventRsvpEntity.user_id == subject.id
+            )
+            .returning(EventRsvpEntity.event_id)
+            .execution_options(synchronize_session=False)
+        )
+        if deleted is None:
+            self._session.rollback()
+            return self.get_rsvp(subject, id)
+
+        rsvp_count, capacity = self._session.execute(
+            update(EventEntity)
+            .where(EventEntity.id == id)
+            .values(rsvp_count=EventEntity.rsvp_count - 1)
+            .returning(EventEntity.rsvp_count, EventEntity.capacity)
+            .execution_options(synchronize_session=False)
+        ).one()
+        self._session.commit()
+        return EventRsvp(
+            event_id=id, attending=False, rsvp_count=rsvp_count, capacity=capacity
+        )
+
+
+def event_reader(session: Session = Depends(db_read_session)) -> EventService:
+    """Dependency injection function for an EventService whose session reads from the replica.
+
+    Only routes which list or search events, and do not cache the results, should use it.
+    """
+    return EventService(session, PermissionService(session))
@@ -0,0 +1,197 @@
+"""
+Export Service streams reports of users, coworking reservations, and equipment checkouts.
+
+Reports are read through server-side cursors (`yield_per`) and encoded as CSV or NDJSON chunk by
+chunk, so memory use does not grow with the number of rows exported. Only the columns of a report
+are selected, rather than entities and their relationships.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Iterator
+from fastapi import Depends
+from sqlalchemy import Select, String, cast, func, select
+from sqlalchemy.orm import Session
+from ..database import db_session
+from ..models import User
+from ..models.export import ExportFormat
+from ..entities import UserEntity
+from ..entities.coworking import ReservationEntity, reservation_seat_table
+from ..entities.coworking.reservation_user_table import reservation_user_table
+from ..entities.equipment_checkout_entity import EquipmentCheckoutEntity
+from .permission import PermissionService
+
+__authors__ = ["Kris Jordan", "Nicholas Mountain", "Jacob Brown"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class ExportService:
+    """ExportService streams administrative reports."""
+
+    CHUNK_ROWS = 500
+    """Number of rows fetched from the database cursor, and encoded into each chunk, at a time."""
+
+    def __init__(
+        self,
+        session: Session = Depends(db_session),
+        permission: PermissionService = Depends(),
+    ):
+        """Initialize a new ExportService instance.
+
+        Both arguments are optional and will be typically be injected.
+
+        Args:
+            session (Session, optional): The SQLAlchemy session to use.
+            permission (PermissionService, optional): The PermissionService contains the logic for User and Role permission granting and checking.
+        """
+        self._session = session
+        self._permission = permission
+
+    def users(self, subject: User, format: ExportFormat) -> Iterator[str]:
+        """Export all users.
+
+        The subject must have the `user.list` permission on `user/`. The permission is checked
+        when this method is called, before any of the report is produced.
+
+        Args:
+            subject (User): The user making the request.
+            format (ExportFormat): The format to encode the report in.
+
+        Returns:
+            Iterator[str]: Chunks of the encoded report.
+
+        Raises:
+            UserPermissionException: If the subject does not have permission to list users.
+        """
+        self._permission.enforce(subject, "user.list", "user/")
+        query = select(
+            UserEntity.id,
+            UserEntity.pid,
+            UserEntity.onyen,
+            UserEntity.email,
+            UserEntity.first_name,
+            UserEntity.last_name,
+            UserEntity.pronouns,
+            UserEntity.github,
+        ).order_by(UserEntity.id)
+        return self._stream(query, format)
+
+    def reservations(
+        self,
+        subject: User,
+        format: ExportFormat,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Iterator[str]:
+        """Export coworking reservations, including past reservations.
+
+        The subject must have the `coworking.reservation.read` permission on `user/*`.
+
+        Args:
+            subject (User): The user making the request.
+            format (ExportFormat): The format to encode the report in.
+            start (datetime, optional): Only export reservations starting at or after this time.
+            end (datetime, optional): Only export reservations starting before this time.
+
+        Returns:
+            Iterator[str]: Chunks of the encoded report.
+
+        Raises:
+            UserPermissionException: If the subject does not have permission to read reservations.
+        """
+        self._permission.enforce(subject, "coworking.reservation.read", "user/*")
+        users = (
+            select(func.string_agg(UserEntity.onyen, ";"))
+            .join(reservation_user_table)
+            .where(reservation_user_table.c.reservation_id == ReservationEntity.id)
+            .scalar_subquery()
+        )
+        seats = (
+            select(func.string_agg(cast(reservation_seat_table.c.seat_id, String), ";"))
+            .where(reservation_seat_table.c.reservation_id == ReservationEntity.id)
+            .scalar_subquery()
+        )
+        query = select(
+            ReservationEntity.id,
+            ReservationEntity.start,
+            ReservationEntity.end,
+            ReservationEntity.state,
+            ReservationEntity.walkin,
+            ReservationEntity.room_id,
+            users.label("users"),
+            seats.label("seats"),
+            ReservationEntity.created_at,
+            ReservationEntity.updated_at,
+        ).order_by(ReservationEntity.start, ReservationEntity.id)
+        if start is not None:
+            query = query.where(ReservationEntity.start >= start)
+        if end is not None:
+            query = query.where(ReservationEntity.start < end)
+        return self._stream(query, format)
+
+    def checkouts(
+        self, subject: User, format: ExportFormat, active_only: bool = False
+    ) -> Iterator[str]:
+        """Export equipment checkouts.
+
+        The subject must have the `equipment.view.checkout` permission on `equipment`.
+
+        Args:
+            subject (User): The user making the request.
+            format (ExportFormat): The format to encode the report in.
+            active_only (bool, optional): Only export checkouts of equipment not yet returned.
+
+        Returns:
+            Iterator[str]: Chunks of the encoded report.
+
+        Raises:
+            UserPermissionException: If the subject does not have permission to view checkouts.
+        """
+        self._permission.enforce(subject, "equipment.view.checkout", "equipment")
+        query = select(
+            EquipmentCheckoutEntity.id,
+            EquipmentCheckoutEntity.user_name,
+            EquipmentCheckoutEntity.pid,
+            EquipmentCheckoutEntity.equipment_id,
+            EquipmentCheckoutEntity.model,
+            EquipmentCheckoutEntity.is_active,
+            EquipmentCheckoutEntity.started_at,
+            EquipmentCheckoutEntity.end_at,
+        ).order_by(EquipmentCheckoutEntity.id)
+        if active_only:
+            query = query.where(EquipmentCheckoutEntity.is_active == True)
+        return self._stream(query, format)
+
+    def _stream(self, query: Select, format: ExportFormat) -> Iterator[str]:
+        """Execute a query through a server-side cursor, encoding its rows chunk by chunk."""
+        result = self._session.execute(
+            query.execution_options(yield_per=self.CHUNK_ROWS)
+        )
+        columns = list(result.keys())
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        if format == ExportFormat.CSV:
+            writer.writerow(columns)
+
+        for rows in result.partitions():
+            for row in rows:
+                values = [
+                    value.isoformat() if isinstance(value, datetime) else value
+                    for value in row
+                ]
+                if format == ExportFormat.CSV:
+                    writer.writerow(values)
+                else:
+                    buffer.write(json.dumps(dict(zip(columns, values))))
+                    buffer.write("\n")
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+        if buffer.tell() > 0:
+            yield buffer.getvalue()
+        result.close()
@@ -1,12 +1,26 @@
 """
 GitHub user authentication service.
+
+Requests to GitHub are made through a `GitHubClient`, which pools connections and applies strict
+timeouts. Linking an account takes several round trips to GitHub, so `GitHubLinkJobs` runs linking
+in a small background thread pool rather than in an API worker, and clients poll for its outcome.
+GitHub avatars are fetched once and served from a size-bounded in-process cache.
 """
 
+import hashlib
 import requests
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from fastapi import Depends
-from github import Github
+from requests.adapters import HTTPAdapter
+from sqlalchemy.orm import Session
+from typing import Callable
+from ..database import engine
 from ..models import User
+from ..models.github import GitHubAvatar, GitHubLinkJob, GitHubLinkJobStatus
+from .cache import TTLCache
+from .permission import PermissionService
 from .user import UserService
 from ..env import getenv
 
@@ -15,24 +29,133 @@ __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
 
+class GitHubClient:
+    """Pooled HTTP client for the GitHub OAuth2 and REST APIs."""
+
+    def __init__(
+        self,
+        oauth_url: str = "https://github.com",
+        api_url: str = "https://api.github.com",
+        connect_timeout: timedelta = timedelta(seconds=3),
+        read_timeout: timedelta = timedelta(seconds=5),
+        pool_size: int = 10,
+    ):
+        """Initialize a GitHubClient.
+
+        Args:
+            oauth_url (str, optional): Base URL of GitHub's OAuth2 endpoints.
+            api_url (str, optional): Base URL of GitHub's REST API.
+            connect_timeout (timedelta, optional): Time allowed to establish a connection.
+            read_timeout (timedelta, optional): Time allowed between bytes of a response.
+            pool_size (int, optional): Maximum number of pooled connections per host.
+        """
+        self._oauth_url = oauth_url.rstrip("/")
+        self._api_url = api_url.rstrip("/")
+        self._timeout = (connect_timeout.total_seconds(), read_timeout.total_seconds())
+        adapter = HTTPAdapter(pool_maxsize=pool_size)
+        self._http = requests.Session()
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+
+    def get_oauth_token(self, oauth_code: str, redirect_uri: str) -> str:
+        """Exchange an OAuth2 code for an access token.
+
+        Raises:
+            requests.RequestException: If GitHub cannot be reached or responds with an error.
+            KeyError: If GitHub did not issue a token for the code."""
+        response = self._http.post(
+            f"{self._oauth_url}/login/oauth/access_token",
+            data={
+                "client_id": getenv("GITHUB_CLIENT_ID"),
+                "client_secret": getenv("GITHUB_CLIENT_SECRET"),
+                "code": oauth_code,
+                "redirect_uri": redirect_uri,
+            },
+            headers={"Accept": "application/json"},
+            timeout=self._timeout,
+        )
+        response.raise_for_status()
+        return response.json()["access_token"]
+
+    def get_user(self, token: str) -> dict:
+        """Get the GitHub user an access token was issued for.
+
+        Raises:
+            requests.RequestException: If GitHub cannot be reached or responds with an error.
+        """
+        response = self._http.get(
+            f"{self._api_url}/user",
+            headers={
+                "Accept": "application/vnd.github+json",
+                "Authorization": f"Bearer {token}",
+            },
+            timeout=self._timeout,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def get_avatar(self, url: str) -> GitHubAvatar:
+        """Download an avatar image.
+
+        Raises:
+            requests.RequestException: If the image cannot be fetched."""
+        response = self._http.get(url, timeout=self._timeout)
+        response.raise_for_status()
+        return GitHubAvatar(
+            url=url,
+            content=response.content,
+            media_type=response.headers.get("Content-Type", "image/png"),
+            etag=f'"{hashlib.sha256(response.content).hexdigest()[:32]}"',
+        )
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._http.close()
+
+
+_github_client = GitHubClient()
+
+_avatar_cache: TTLCache[int, GitHubAvatar] = TTLCache(
+    maxsize=32 * 1024 * 1024,
+    ttl=timedelta(days=1),
+    weigher=lambda avatar: len(avatar.content),
+)
+"""GitHub avatars of users keyed by user ID, bounded by their total size in bytes."""
+
+
+def github_client() -> GitHubClient:
+    """Dependency injection function for the application's GitHubClient."""
+    return _github_client
+
+
 class GitHubService:
     """GitHubService is the access layer to the GitHub OAuth2 API."""
 
     _user_svc: UserService
+    _client: GitHubClient
 
-    def __init__(self, user_svc: UserService = Depends(UserService)):
+    def __init__(
+        self,
+        user_svc: UserService = Depends(UserService),
+        client: GitHubClient = Depends(github_client),
+    ):
         """Initialize a new GitHubService instance.
 
         Both arguments are optional and will be typically be injected.
 
         Args:
             user_svc (UserService): The UserService contains the logic for User management.
+            client (GitHubClient): The client used to make requests of GitHub.
         """
         self._user_svc = user_svc
+        self._client = client
 
     def link_with_user(self, subject: User, oauth_code: str, redirect_uri: str) -> bool:
         """Authenticate a user via GitHub OAuth2.
 
+        This method makes several requests of GitHub. API routes should prefer running it in the
+        background via `GitHubLinkJobs`.
+
         Args:
             subject (User): The user making the GitHub link request.
             oauth_code (str): The OAuth2 code from GitHub.
@@ -41,13 +164,13 @@ class GitHubService:
         Returns:
             bool: True if the user was successfully authenticated, False otherwise."""
         try:
-            token = self._get_github_oauth_token(oauth_code, redirect_uri)
-            github = Github(token)
-            github_user = github.get_user()
-            subject.github = github_user.login
-            subject.github_id = github_user.id
-            subject.github_avatar = github_user.avatar_url
+            token = self._client.get_oauth_token(oauth_code, redirect_uri)
+            github_user = self._client.get_user(token)
+            subject.github = github_user["login"]
+            subject.github_id = github_user["id"]
+            subject.github_avatar = github_user["avatar_url"]
             self._user_svc.update(subject, subject)
+            _avatar_cache.invalidate(subject.id)
             return True
         except:
             return False
@@ -62,6 +185,31 @@ class GitHubService:
             None"""
         subject.github = ""
         self._user_svc.update(subject, subject)
+        _avatar_cache.invalidate(subject.id)
+
+    def get_avatar(self, user_id: int) -> GitHubAvatar | None:
+        """Get the GitHub avatar of a user, fetching it from GitHub only if it is not cached.
+
+        Args:
+            user_id (int): The ID of the user whose avatar to get.
+
+        Returns:
+            GitHubAvatar | None: The avatar, or None if the user has none or it could not be fetched.
+        """
+        avatar = _avatar_cache.get(user_id)
+        if avatar is not None:
+            return avatar
+
+        user = self._user_svc.get_by_id(user_id)
+        if user is None or not user.github or not user.github_avatar:
+            return None
+
+        try:
+            avatar = self._client.get_avatar(user.github_avatar)
+        except requests.RequestException:
+            return None
+        _avatar_cache.set(user_id, avatar)
+        return avatar
 
     def get_oauth_login_url(self, redirect_uri: str) -> str:
         """Get the GitHub OAuth2 link for a user.
@@ -76,18 +224,82 @@ class GitHubService:
         uri = f"https://github.com/login/oauth/authorize?client_id={client_id}&redirect_uri={redirect_uri}&state={random_string}"
         return uri
 
-    def _get_github_oauth_token(self, oauth_code: str, redirect_uri: str) -> str:
-        result = requests.post(
-            "https://github.com/login/oauth/access_token",
-            data={
-                "client_id": getenv("GITHUB_CLIENT_ID"),
-                "client_secret": getenv("GITHUB_CLIENT_SECRET"),
-                "code": oauth_code,
-                "redirect_uri": redirect_uri,
-            },
-            headers={"Accept": "application/json"},
+
+class GitHubLinkJobs:
+    """Runs GitHub account linking jobs in a background thread pool and tracks their status."""
+
+    def __init__(
+        self,
+        client: GitHubClient,
+        session_factory: Callable[[], Session],
+        max_workers: int = 4,
+        job_ttl: timedelta = timedelta(minutes=10),
+    ):
+        """Initialize the job runner.
+
+        Args:
+            client (GitHubClient): The client used to make requests of GitHub.
+            session_factory (Callable[[], Session]): Opens a database session for each job.
+            max_workers (int, optional): The number of jobs that may run concurrently.
+            job_ttl (timedelta, optional): How long a job's status can be polled.
+        """
+        self._client = client
+        self._session_factory = session_factory
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="github-link"
         )
+        self._jobs: TTLCache[str, GitHubLinkJob] = TTLCache(maxsize=4096, ttl=job_ttl)
+
+    def submit(
+        self, subject: User, oauth_code: str, redirect_uri: str
+    ) -> GitHubLinkJob:
+        """Start linking a user's GitHub account in the background.
+
+        Args:
+            subject (User): The user making the GitHub link request.
+            oauth_code (str): The OAuth2 code from GitHub.
+            redirect_uri (str): The URI to redirect the user to after authenticating with GitHub.
+
+        Returns:
+            GitHubLinkJob: The pending job."""
+        job = GitHubLinkJob(id=uuid.uuid4().hex, user_id=subject.id)
+        self._jobs.set(job.id, job)
+        self._executor.submit(self._run, job, subject, oauth_code, redirect_uri)
+        return job
+
+    def get(self, subject: User, job_id: str) -> GitHubLinkJob | None:
+        """Get the status of one of the subject's linking jobs.
+
+        Args:
+            subject (User): The user who submitted the job.
+            job_id (str): The ID of the job.
+
+        Returns:
+            GitHubLinkJob | None: The job, or None if it is unknown, expired, or not the subject's.
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.user_id != subject.id:
+            return None
+        return job.model_copy()
+
+    def shutdown(self) -> None:
+        """Wait for running jobs to complete and stop accepting new jobs."""
+        self._executor.shutdown(wait=True)
+
+    def _run(
+        self, job: GitHubLinkJob, subject: User, oauth_code: str, redirect_uri: str
+    ) -> None:
+        with self._session_factory() as session:
+            user_svc = UserService(session, PermissionService(session))
+            github_svc = GitHubService(user_svc, self._client)
+            linked = github_svc.link_with_user(subject, oauth_code, redirect_uri)
+        status = GitHubLinkJobStatus.SUCCEEDED if linked else GitHubLinkJobStatus.FAILED
+        self._jobs.set(job.id, job.model_copy(update={"status": status}))
+
+
+_github_link_jobs = GitHubLinkJobs(_github_client, lambda: Session(engine))
+
 
-        json = result.json()
-        token = json["access_token"]
-        return token
+def github_link_jobs() -> GitHubLinkJobs:
+    """Dependency injection function for the application's GitHubLinkJobs."""
+    return _github_link_jobs
@@ -10,8 +10,11 @@ In this context health does not refer to correctness as much as running, connect
 """
 
 from fastapi import Depends
-from sqlalchemy import text
-from ..database import Session, db_session
+from sqlalchemy import QueuePool, text
+from ..database import Session, _engine_options, db_session
+from ..models import User
+from ..models.pool_status import PoolStatus
+from .permission import PermissionService
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -20,12 +23,43 @@ __license__ = "MIT"
 
 class HealthService:
     _session: Session
+    _permission: PermissionService
 
-    def __init__(self, session: Session = Depends(db_session)):
+    def __init__(
+        self,
+        session: Session = Depends(db_session),
+        permission: PermissionService = Depends(),
+    ):
         self._session = session
+        self._permission = permission
 
     def check(self):
         stmt = text("SELECT 'OK', NOW()")
         result = self._session.execute(stmt)
         row = result.all()[0]
         return str(f"{row[0]} @ {row[1]}")
+
+    def pool_status(self, subject: User) -> PoolStatus:
+        """Report the state of this process' pool of database connections.
+
+        Args:
+            subject: The user requesting the pool's state.
+
+        Returns:
+            PoolStatus: The pool's size, and how many connections are checked in and out.
+
+        Raises:
+            UserPermissionException: If the subject may not read the pool's state.
+        """
+        self._permission.enforce(subject, "health.pool.read", "health")
+        pool = self._session.get_bind().pool
+        if not isinstance(pool, QueuePool):
+            raise TypeError(f"Unsupported connection pool: {type(pool).__name__}")
+        return PoolStatus(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=_engine_options()["max_overflow"],
+            timeout=pool.timeout(),
+        )
@@ -0,0 +1,105 @@
+"""Helpers for rendering events as iCalendar (RFC 5545) feeds.
+
+Feeds are rendered line by line, so that the events of a feed can be read from a database cursor
+and written out without first being loaded into models.
+"""
+
+from datetime import datetime, timezone
+from typing import Iterable, Iterator
+from .local_time import LOCAL_TIME_ZONE
+
+__authors__ = ["Ajay Gandecha", "Jade Keegan", "Brianna Ta", "Audrey Toney"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+PRODUCT_ID = "-//UNC Computer Science Experience Labs//CSXL Events//EN"
+"""Identifies the CSXL as the producer of its calendars."""
+
+UID_DOMAIN = "csxl.unc.edu"
+"""Domain qualifying the globally unique IDs of events."""
+
+REFRESH_INTERVAL = "PT1H"
+"""How often calendar clients are asked to poll feeds, as an iCalendar duration."""
+
+
+def escape(text: str) -> str:
+    """Escape a text value, which may not contain unescaped commas, semicolons, or newlines."""
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold(line: str) -> str:
+    """Fold a content line into lines of at most 75 octets, each continuation indented a space."""
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    parts = []
+    start, limit = 0, 75
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # Do not split a multi-byte character between lines
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(encoded[start:end].decode())
+        start, limit = end, 74
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def utc_timestamp(time: datetime) -> str:
+    """Format a time as an iCalendar UTC date-time, assuming naive times are local times."""
+    if time.tzinfo is None:
+        time = time.replace(tzinfo=LOCAL_TIME_ZONE)
+    return time.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def render_calendar(
+    name: str,
+    events: Iterable[tuple[int, str, datetime, str, str]],
+    stamp: datetime | None,
+) -> Iterator[str]:
+    """Render a calendar of events, in chunks of one event each.
+
+    Args:
+        name (str): The name calendar clients display for the calendar.
+        events (Iterable[tuple[int, str, datetime, str, str]]): The ID, name, time, location,
+            and description of each event.
+        stamp (datetime | None): When the newest of the events was created or changed, which
+            events are stamped with so that the same events are always rendered the same. It is
+            only None when there are no events.
+
+    Returns:
+        Iterator[str]: Chunks of the calendar."""
+    yield "".join(
+        fold(line)
+        for line in [
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{PRODUCT_ID}",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+            f"X-WR-CALNAME:{escape(name)}",
+            f"REFRESH-INTERVAL;VALUE=DURATION:{REFRESH_INTERVAL}",
+            f"X-PUBLISHED-TTL:{REFRESH_INTERVAL}",
+        ]
+    )
+    dtstamp = None if stamp is None else utc_timestamp(stamp)
+    for id, summary, time, location, description in events:
+        yield "".join(
+            fold(line)
+            for line in [
+                "BEGIN:VEVENT",
+                f"UID:event-{id}@{UID_DOMAIN}",
+                f"DTSTAMP:{dtstamp}",
+                f"DTSTART:{utc_timestamp(time)}",
+                f"SUMMARY:{escape(summary)}",
+                f"LOCATION:{escape(location)}",
+                f"DESCRIPTION:{escape(description)}",
+                "END:VEVENT",
+            ]
+        )
+    yield "END:VCALENDAR\r\n"
@@ -0,0 +1,29 @@
+"""Conversion of times to the local time the database stores them in.
+
+Event and equipment checkout times are stored without a time zone, as local times of the CSXL,
+so times given with a time zone must be converted before being compared with them.
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+__authors__ = ["Jacob Brown, Ayden Franklin"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+LOCAL_TIME_ZONE = ZoneInfo("America/New_York")
+"""The time zone of the times stored in the database."""
+
+
+def local_time(time: datetime) -> datetime:
+    """Convert a time to the local time times are stored in, if it has a time zone.
+
+    Args:
+        time: The time to convert. Times without a time zone are assumed to be local already.
+
+    Returns:
+        datetime: The local time, without a time zone.
+    """
+    if time.tzinfo is None:
+        return time
+    return time.astimezone(LOCAL_TIME_ZONE).replace(tzinfo=None)
@@ -2,16 +2,31 @@
 The Organizations Service allows the API to manipulate organizations data in the database.
 """
 
+import hashlib
+from datetime import datetime
 from fastapi import Depends
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from pydantic import TypeAdapter
+from sqlalchemy import exists, func, select, true
+from sqlalchemy.orm import Session, aliased
 
-from ..database import db_session
+from ..database import db_read_session, db_session
 from ..models.organization import Organization
-from ..models.organization_details import OrganizationDetails
+from ..models.organization_details import OrganizationEvents, OrganizationPage
+from ..models.organization_summary import OrganizationDirectory, OrganizationSummary
 from ..entities.organization_entity import OrganizationEntity
+from ..entities.event_entity import EventEntity
 from ..models import User
+from ..models.pagination import Paginated, PaginationParams
+from ..models.search import OrganizationSearchResult
 from .permission import PermissionService
+from .search import headline, text_query
+from .cache import (
+    ORGANIZATION_DIRECTORY_KEY,
+    event_calendar_cache,
+    organization_directory_cache,
+    organization_slug_cache,
+)
+from .pagination import after_cursor, decode_cursor, encode_cursor
 
 from .exceptions import OrganizationNotFoundException
 from .exceptions import UserPermissionException
@@ -48,6 +63,96 @@ class OrganizationService:
         # Convert entries to a model and return
         return [entity.to_model() for entity in entities]
 
+    def summaries(self) -> list[OrganizationSummary]:
+        """
+        Retrieves the summaries of all organizations listed in the directory, in order of name
+
+        Only the columns of the summaries are selected, rather than whole organizations.
+
+        Returns:
+            list[OrganizationSummary]: List of all `OrganizationSummary`
+        """
+        query = select(
+            *[
+                getattr(OrganizationEntity, field)
+                for field in OrganizationSummary.model_fields
+            ]
+        ).order_by(OrganizationEntity.name, OrganizationEntity.id)
+        return [
+            OrganizationSummary(**row._asdict()) for row in self._session.execute(query)
+        ]
+
+    def directory(self) -> OrganizationDirectory:
+        """
+        Retrieves the organization directory serialized as JSON, with an ETag identifying it
+
+        The directory is cached in memory until an organization is created, updated, or deleted,
+        so it is usually served without querying the database or serializing it again.
+
+        Returns:
+            OrganizationDirectory: The JSON of `summaries()` and its ETag
+        """
+        directory = organization_directory_cache.get(ORGANIZATION_DIRECTORY_KEY)
+        if directory is None:
+            content = TypeAdapter(list[OrganizationSummary]).dump_json(self.summaries())
+            directory = OrganizationDirectory(
+                content=content,
+                etag=f'"{hashlib.sha256(content).hexdigest()[:32]}"',
+            )
+            organization_directory_cache.set(ORGANIZATION_DIRECTORY_KEY, directory)
+        return directory
+
+    def search(
+        self, pagination_params: PaginationParams
+    ) -> Paginated[OrganizationSearchResult]:
+        """
+        Searches organizations by their name, shorthand, and short description, most relevant first
+
+        Matches in an organization's names rank above matches in its short description. Only the
+        page of matching organizations is read, through the index of their search vectors.
+
+        Parameters:
+            pagination_params: the page to get, of which `filter` is the search query and
+                `order_by` and `cursor` are ignored
+
+        Returns:
+            Paginated[OrganizationSearchResult]: the page of matching organizations
+        """
+        tsquery = text_query(pagination_params.filter)
+        match = OrganizationEntity.search_vector.op("@@")(tsquery)
+        rank = func.ts_rank_cd(OrganizationEntity.search_vector, tsquery)
+
+        page = (
+            select(OrganizationEntity.id, rank.label("rank"))
+            .where(match)
+            .order_by(rank.desc(), OrganizationEntity.name, OrganizationEntity.id)
+            .offset(pagination_params.page * pagination_params.page_size)
+            .limit(pagination_params.page_size)
+            .subquery()
+        )
+        query = (
+            select(
+                OrganizationEntity,
+                headline(OrganizationEntity.short_description, tsquery),
+                page.c.rank,
+            )
+            .join(page, page.c.id == OrganizationEntity.id)
+            .order_by(
+                page.c.rank.desc(), OrganizationEntity.name, OrganizationEntity.id
+            )
+        )
+        items = [
+            OrganizationSearchResult(
+                organization=entity.to_model(), headline=excerpt, rank=rank
+            )
+            for entity, excerpt, rank in self._session.execute(query)
+        ]
+
+        length = self._session.scalar(
+            select(func.count()).select_from(OrganizationEntity).where(match)
+        )
+        return Paginated(items=items, length=length, params=pagination_params)
+
     def create(self, subject: User, organization: Organization) -> Organization:
         """
         Creates a organization based on the input object and adds it to the table.
@@ -77,39 +182,142 @@ class OrganizationService:
             # Add new object to table and commit changes
             self._session.add(organization_entity)
             self._session.commit()
+            organization_directory_cache.clear()
 
             # Return added object
             return organization_entity.to_model()
 
-    def get_from_slug(self, slug: str) -> OrganizationDetails:
+    def get_from_slug(
+        self, slug: str, limit: int = 10, now: datetime | None = None
+    ) -> OrganizationPage:
         """
-        Get the organization from a slug
+        Get the organization from a slug, with a page of its upcoming events
         If none retrieved, a debug description is displayed.
 
+        The organization, its next `limit` events, and whether it has past events are read in a
+        single query, so the page does not grow heavier as the organization posts more events.
+
         Parameters:
             slug: a string representing a unique organization slug
+            limit: the maximum number of upcoming events to include
+            now: the time events are upcoming after, now by default
 
         Returns:
-            Organization: Object with corresponding slug
+            OrganizationPage: Object with corresponding slug, and its upcoming events
 
         Raises:
             OrganizationNotFoundException if no organization is found with the corresponding slug
         """
+        now = now or datetime.now()
+        rows = self._session.execute(
+            self._page_query(self._organization_id(slug), slug, limit, now)
+        ).all()
+        if not rows:
+            # The cached ID is stale, as the organization's slug was changed by another process
+            organization_slug_cache.invalidate(slug)
+            rows = self._session.execute(
+                self._page_query(self._organization_id(slug), slug, limit, now)
+            ).all()
+
+        organization, _, has_past_events = rows[0]
+        events = [event for _, event, _ in rows if event is not None]
+
+        events_cursor = ""
+        if len(events) > limit:
+            events = events[:limit]
+            events_cursor = encode_cursor([events[-1].time, events[-1].id])
+
+        return OrganizationPage(
+            **organization.to_model().model_dump(),
+            events=[event.to_model() for event in events],
+            events_cursor=events_cursor,
+            # Past events are those before the upcoming events, sorted descending by (time, id)
+            past_events_cursor=encode_cursor([now, 0]) if has_past_events else "",
+        )
 
-        # Query the organization with matching slug
-        organization = (
-            self._session.query(OrganizationEntity)
-            .filter(OrganizationEntity.slug == slug)
-            .one_or_none()
+    def get_events(
+        self, slug: str, cursor: str, past: bool = False, limit: int = 10
+    ) -> OrganizationEvents:
+        """
+        Get a page of an organization's events following a cursor from its page
+
+        Parameters:
+            slug: a string representing a unique organization slug
+            cursor: the `events_cursor` or `past_events_cursor` of the organization's page, or
+                the `next_cursor` of the previous page of events
+            past: whether the cursor is of past events, which are ordered most recent first
+            limit: the maximum number of events to get
+
+        Returns:
+            OrganizationEvents: the page of events
+
+        Raises:
+            OrganizationNotFoundException if no organization is found with the corresponding slug
+            ValueError if the cursor is malformed
+        """
+        organization_id = self._organization_id(slug)
+        key = (EventEntity.time, EventEntity.id)
+        values = decode_cursor(cursor, len(key))
+        query = (
+            select(EventEntity)
+            .where(
+                EventEntity.organization_id == organization_id,
+                after_cursor(key, values, descending=past),
+            )
+            .order_by(*[column.desc() if past else column for column in key])
+            .limit(limit + 1)
+        )
+        events = self._session.scalars(query).all()
+
+        next_cursor = ""
+        if len(events) > limit:
+            events = events[:limit]
+            next_cursor = encode_cursor([events[-1].time, events[-1].id])
+        return OrganizationEvents(
+            events=[event.to_model() for event in events], next_cursor=next_cursor
         )
 
-        # Check if result is null
-        if organization:
-            # Convert entry to a model and return
-            return organization.to_details_model()
-        else:
-            # Raise exception
-            raise OrganizationNotFoundException(slug)
+    def _organization_id(self, slug: str) -> int:
+        """Look up the ID of the organization with a slug, through the slug cache."""
+        organization_id = organization_slug_cache.get(slug)
+        if organization_id is None:
+            organization_id = self._session.scalar(
+                select(OrganizationEntity.id).where(OrganizationEntity.slug == slug)
+            )
+            if organization_id is None:
+                raise OrganizationNotFoundException(slug)
+            organization_slug_cache.set(slug, organization_id)
+        return organization_id
+
+    def _page_query(self, organization_id: int, slug: str, limit: int, now: datetime):
+        """Select an organization with each of its next events, and whether it has past events.
+
+        The events are selected by a lateral subquery, one more than the limit to tell whether
+        there are more, and the organization is repeated on the row of each."""
+        upcoming = (
+            select(EventEntity)
+            .where(
+                EventEntity.organization_id == OrganizationEntity.id,
+                EventEntity.time >= now,
+            )
+            .order_by(EventEntity.time, EventEntity.id)
+            .limit(limit + 1)
+            .lateral()
+        )
+        event = aliased(EventEntity, upcoming)
+        has_past_events = exists().where(
+            EventEntity.organization_id == OrganizationEntity.id,
+            EventEntity.time < now,
+        )
+        return (
+            select(OrganizationEntity, event, has_past_events)
+            .outerjoin(upcoming, true())
+            .where(
+                OrganizationEntity.id == organization_id,
+                OrganizationEntity.slug == slug,
+            )
+            .order_by(event.time, event.id)
+        )
 
     def update(self, subject: User, organization: Organization) -> Organization:
         """
@@ -152,6 +360,9 @@ class OrganizationService:
 
             # Save changes
             self._session.commit()
+            organization_directory_cache.clear()
+            organization_slug_cache.clear()
+            event_calendar_cache.clear()
 
             # Return updated object
             return obj.to_model()
@@ -187,6 +398,19 @@ class OrganizationService:
             self._session.delete(obj)
             # Save changes
             self._session.commit()
+            organization_directory_cache.clear()
+            organization_slug_cache.invalidate(slug)
+            event_calendar_cache.clear()
         else:
             # Raise exception
             raise OrganizationNotFoundException(slug)
+
+
+def organization_reader(
+    session: Session = Depends(db_read_session),
+) -> OrganizationService:
+    """Dependency injection function for an OrganizationService whose session reads from the replica.
+
+    Only routes which list or search organizations, and do not cache the results, should use it.
+    """
+    return OrganizationService(session, PermissionService(session))
@@ -0,0 +1,115 @@
+"""Helpers for keyset pagination and cheap row counts shared by the service layer.
+
+Keyset pagination continues from the sort key of the last row of the previous page, rather than
+skipping `OFFSET` rows, so every page costs the same given an index on the sort key. The position
+is handed to the client as an opaque cursor string.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from sqlalchemy import ColumnElement, DateTime, literal, text, tuple_
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+def encode_cursor(values: list) -> str:
+    """Encode the sort key values of a row as an opaque cursor.
+
+    Args:
+        values (list): Values of the sort key columns of the last row of a page, which are JSON
+            serializable or datetimes.
+
+    Returns:
+        str: The URL-safe cursor."""
+    encoded = json.dumps(
+        [
+            value.isoformat() if isinstance(value, datetime) else value
+            for value in values
+        ]
+    )
+    return base64.urlsafe_b64encode(encoded.encode()).decode()
+
+
+def decode_cursor(cursor: str, length: int) -> list:
+    """Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (str): The cursor.
+        length (int): The number of sort key values the cursor is expected to hold.
+
+    Returns:
+        list: The sort key values.
+
+    Raises:
+        ValueError: If the cursor is malformed."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError):
+        raise ValueError("Malformed pagination cursor.")
+    if not isinstance(values, list) or len(values) != length:
+        raise ValueError("Malformed pagination cursor.")
+    return values
+
+
+def after_cursor(
+    key: tuple[InstrumentedAttribute, ...], values: list, descending: bool = False
+) -> ColumnElement[bool]:
+    """Criteria for rows whose sort key comes after the given values, in ascending order.
+
+    The row value comparison `(a, b) > (x, y)` is served by a btree index on `(a, b)`, which
+    PostgreSQL can also scan backwards for keys sorted in descending order.
+
+    Args:
+        key (tuple[InstrumentedAttribute, ...]): The sort key columns, ending with a unique column.
+        values (list): The sort key values decoded from a cursor.
+        descending (bool, optional): Whether rows are sorted by the key in descending order, so
+            that rows after the cursor have smaller keys.
+
+    Returns:
+        ColumnElement[bool]: The criteria.
+
+    Raises:
+        ValueError: If a datetime value of the cursor is malformed."""
+    literals = [_literal(column, value) for column, value in zip(key, values)]
+    if len(key) == 1:
+        return key[0] < literals[0] if descending else key[0] > literals[0]
+    if descending:
+        return tuple_(*key) < tuple_(*literals)
+    return tuple_(*key) > tuple_(*literals)
+
+
+def _literal(column: InstrumentedAttribute, value) -> ColumnElement:
+    """Bind a cursor value as a literal of its column's type, parsing encoded datetimes."""
+    if isinstance(column.type, DateTime) and isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            raise ValueError("Malformed pagination cursor.")
+    return literal(value, column.type)
+
+
+def estimated_row_count(session: Session, table_name: str) -> int | None:
+    """Estimate the number of rows in a table from PostgreSQL's planner statistics.
+
+    The estimate is as fresh as the table's last `ANALYZE` or autovacuum, and costs a catalog
+    lookup rather than a scan of the table.
+
+    Args:
+        session (Session): The database session.
+        table_name (str): The name of the table.
+
+    Returns:
+        int | None: The estimated row count, or None if the table has never been analyzed.
+    """
+    reltuples = session.execute(
+        text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table_name)"),
+        {"table_name": f'"{table_name}"'},
+    ).scalar()
+    if reltuples is None or reltuples < 0:
+        return None
+    return int(reltuples)
@@ -14,6 +14,7 @@ from ..database import db_session
 from ..models import User, Permission, Role, RoleDetails
 from ..entities import UserEntity, PermissionEntity, RoleEntity
 from ..services.exceptions import UserPermissionException
+from .cache import invalidate_registered_user
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -83,6 +84,7 @@ class PermissionService:
 
         self._session.add(permission_entity)
         self._session.commit()
+        self._invalidate_grantees(permission_entity)
         return True
 
     def revoke(self, revoker: User, permission: Permission) -> bool:
@@ -108,6 +110,7 @@ class PermissionService:
         self.enforce(revoker, "permission.revoke", f"permission/{permission_entity.id}")
         self.enforce(revoker, permission_entity.action, permission_entity.resource)
 
+        self._invalidate_grantees(permission_entity)
         self._session.delete(permission_entity)
         self._session.commit()
         return True
@@ -147,6 +150,17 @@ class PermissionService:
         role_permissions = self._get_user_roles_permissions(subject)
         return self._has_permission(role_permissions, action, resource)
 
+    def _invalidate_grantees(self, permission: PermissionEntity) -> None:
+        """Invalidate cached authenticated users affected by a change to a permission.
+
+        Args:
+            permission (PermissionEntity): The permission granted or revoked."""
+        if permission.user is not None:
+            invalidate_registered_user(permission.user.pid)
+        else:
+            # Role permissions affect every member of the role
+            invalidate_registered_user()
+
     def _get_user_permissions(self, subject: User) -> list[PermissionEntity]:
         """Get the permissions for a user.
 
@@ -9,6 +9,7 @@ from ..database import db_session
 from ..models import User, Role, RoleDetails, Permission
 from ..entities import RoleEntity, PermissionEntity, UserEntity
 from .permission import PermissionService
+from .cache import invalidate_registered_user
 
 
 class RoleService:
@@ -120,6 +121,7 @@ class RoleService:
         if user:
             role.users.append(user)
             self._session.commit()
+            invalidate_registered_user(user.pid)
         return self.details(subject, id)
 
     def is_member(self, subject: User, id: int, userId: int) -> bool:
@@ -152,4 +154,5 @@ class RoleService:
         user = self._session.get(UserEntity, userId)
         role.users.remove(user)
         self._session.commit()
+        invalidate_registered_user(user.pid)
         return True
@@ -0,0 +1,238 @@
+"""
+Roster Service bulk imports users and their role memberships, e.g. at the start of a semester.
+
+Rather than creating users and adding role members one commit at a time, rows are validated up
+front and then written in batches of `INSERT ... ON CONFLICT` statements within one transaction.
+Rows which cannot be imported are reported individually and do not prevent the others.
+"""
+
+import csv
+import io
+import json
+from fastapi import Depends
+from pydantic import ValidationError
+from sqlalchemy import select, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from ..database import db_session
+from ..models import User
+from ..models.roster import (
+    RosterFormat,
+    RosterImportResult,
+    RosterRow,
+    RosterRowError,
+)
+from ..entities import RoleEntity, UserEntity
+from ..entities.user_role_table import user_role_table
+from .permission import PermissionService
+from .cache import invalidate_registered_user, user_list_length_cache
+
+__authors__ = ["Kris Jordan", "Ajay Gandecha"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class RosterService:
+    """RosterService bulk imports rosters of users and role memberships."""
+
+    def __init__(
+        self,
+        session: Session = Depends(db_session),
+        permission: PermissionService = Depends(),
+    ):
+        """Initialize a new RosterService instance.
+
+        Both arguments are optional and will be typically be injected.
+
+        Args:
+            session (Session, optional): The SQLAlchemy session to use.
+            permission (PermissionService, optional): The PermissionService contains the logic for User and Role permission granting and checking.
+        """
+        self._session = session
+        self._permission = permission
+
+    def import_roster(
+        self,
+        subject: User,
+        content: str,
+        format: RosterFormat,
+        batch_size: int = 500,
+    ) -> RosterImportResult:
+        """Create or update the users of a roster and add them to the roles it names.
+
+        Users are matched by PID; a matched user's onyen, email, name, and pronouns are updated.
+        Role memberships are only ever added. All rows are written in a single transaction.
+
+        The subject must have the `user.create` and `user.update` permissions on `user/`, and the
+        `role.add_member` permission on each role named in the roster.
+
+        Args:
+            subject (User): The user making the request.
+            content (str): The roster, as CSV with a header row or as newline-delimited JSON.
+            format (RosterFormat): The format of the roster.
+            batch_size (int, optional): The number of rows written per statement.
+
+        Returns:
+            RosterImportResult: Counts of changes made and errors of rows which were skipped.
+
+        Raises:
+            UserPermissionException: If the subject lacks a required permission.
+        """
+        self._permission.enforce(subject, "user.create", "user/")
+        self._permission.enforce(subject, "user.update", "user/")
+
+        rows, errors = self._parse(content, format)
+        role_ids = self._role_ids({name for _, row in rows for name in row.roles})
+        for role_id in role_ids.values():
+            self._permission.enforce(subject, "role.add_member", f"role/{role_id}")
+
+        rows = self._reject_invalid_rows(rows, role_ids, errors)
+
+        result = RosterImportResult(errors=errors)
+        for start in range(0, len(rows), batch_size):
+            self._write_batch(
+                [row for _, row in rows[start : start + batch_size]], role_ids, result
+            )
+        self._session.commit()
+
+        result.errors.sort(key=lambda error: error.row)
+        if rows:
+            user_list_length_cache.clear()
+            invalidate_registered_user()
+        return result
+
+    def _parse(
+        self, content: str, format: RosterFormat
+    ) -> tuple[list[tuple[int, RosterRow]], list[RosterRowError]]:
+        """Parse a roster into numbered rows, collecting errors of rows which are malformed."""
+        if format == RosterFormat.CSV:
+            records = list(csv.DictReader(io.StringIO(content)))
+        else:
+            records = [line for line in content.splitlines() if line.strip()]
+
+        rows: list[tuple[int, RosterRow]] = []
+        errors: list[RosterRowError] = []
+        for number, record in enumerate(records, start=1):
+            try:
+                if format == RosterFormat.CSV:
+                    record = {k: v.strip() for k, v in record.items() if k and v}
+                    roles = record.pop("roles", "").split(";")
+                    record["roles"] = [name.strip() for name in roles if name.strip()]
+                else:
+                    record = json.loads(record)
+                rows.append((number, RosterRow.model_validate(record)))
+            except json.JSONDecodeError as e:
+                errors.append(RosterRowError(row=number, message=f"Invalid JSON: {e}"))
+            except ValidationError as e:
+                pid = record.get("pid") if isinstance(record, dict) else None
+                message = "; ".join(
+                    f"{'.'.join(map(str, error['loc'])) or 'row'}: {error['msg']}"
+                    for error in e.errors()
+                )
+                errors.append(
+                    RosterRowError(
+                        row=number,
+                        pid=int(pid) if str(pid).isdigit() else None,
+                        message=message,
+                    )
+                )
+        return rows, errors
+
+    def _role_ids(self, names: set[str]) -> dict[str, int]:
+        """Map the names of existing roles to their IDs."""
+        if not names:
+            return {}
+        query = select(RoleEntity.name, RoleEntity.id).where(RoleEntity.name.in_(names))
+        return {name: id for name, id in self._session.execute(query)}
+
+    def _reject_invalid_rows(
+        self,
+        rows: list[tuple[int, RosterRow]],
+        role_ids: dict[str, int],
+        errors: list[RosterRowError],
+    ) -> list[tuple[int, RosterRow]]:
+        """Remove rows which would violate a constraint, recording an error for each.
+
+        A row is rejected if it names an unknown role, if an earlier row shares its PID, onyen,
+        or email, or if its onyen or email belongs to an existing user with another PID.
+        """
+        existing: dict[str, dict[str, int]] = {"onyen": {}, "email": {}}
+        onyens = [row.onyen for _, row in rows]
+        emails = [row.email for _, row in rows]
+        for start in range(0, len(rows), 1000):
+            query = select(UserEntity.pid, UserEntity.onyen, UserEntity.email).where(
+                or_(
+                    UserEntity.onyen.in_(onyens[start : start + 1000]),
+                    UserEntity.email.in_(emails[start : start + 1000]),
+                )
+            )
+            for pid, onyen, email in self._session.execute(query):
+                existing["onyen"][onyen] = pid
+                existing["email"][email] = pid
+
+        seen: dict[str, set] = {"pid": set(), "onyen": set(), "email": set()}
+        valid: list[tuple[int, RosterRow]] = []
+        for number, row in rows:
+            message = None
+            unknown_roles = [name for name in row.roles if name not in role_ids]
+            if unknown_roles:
+                message = f"Unknown role(s): {', '.join(unknown_roles)}"
+            for field in ("pid", "onyen", "email"):
+                value = getattr(row, field)
+                if message is None and value in seen[field]:
+                    message = f"Duplicate {field} {value} in roster"
+                if (
+                    message is None
+                    and existing.get(field, {}).get(value, row.pid) != row.pid
+                ):
+                    message = f"The {field} {value} belongs to another user"
+            if message is None:
+                for field in seen:
+                    seen[field].add(getattr(row, field))
+                valid.append((number, row))
+            else:
+                errors.append(RosterRowError(row=number, pid=row.pid, message=message))
+        return valid
+
+    def _write_batch(
+        self,
+        rows: list[RosterRow],
+        role_ids: dict[str, int],
+        result: RosterImportResult,
+    ) -> None:
+        """Upsert a batch of users and insert their role memberships."""
+        pids = [row.pid for row in rows]
+        existing_pids = set(
+            self._session.scalars(
+                select(UserEntity.pid).where(UserEntity.pid.in_(pids))
+            )
+        )
+
+        statement = insert(UserEntity).values(
+            [row.model_dump(exclude={"roles"}) for row in rows]
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[UserEntity.pid],
+            set_={
+                column: statement.excluded[column]
+                for column in ("onyen", "email", "first_name", "last_name", "pronouns")
+            },
+        ).returning(UserEntity.pid, UserEntity.id)
+        user_ids = {pid: id for pid, id in self._session.execute(statement)}
+
+        result.created += len(rows) - len(existing_pids)
+        result.updated += len(existing_pids)
+
+        memberships = [
+            {"user_id": user_ids[row.pid], "role_id": role_ids[name]}
+            for row in rows
+            for name in row.roles
+        ]
+        if memberships:
+            statement = (
+                insert(user_role_table)
+                .values(memberships)
+                .on_conflict_do_nothing()
+                .returning(user_role_table.c.user_id)
+            )
+            result.memberships_added += len(self._session.execute(statement).all())
@@ -0,0 +1,42 @@
+"""Helpers for ranked full-text search shared by the service layer.
+
+Searchable tables keep a `search_vector` column generated by PostgreSQL from their text columns,
+indexed with GIN, so matching a query reads the index rather than every row's text. Queries are
+parsed with `websearch_to_tsquery`, which accepts what people type into a search bar (quoted
+phrases, `or`, and `-` to exclude words) without raising syntax errors.
+"""
+
+from sqlalchemy import ColumnElement, func
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+SEARCH_CONFIG = "english"
+"""The text search configuration queries are parsed with, which search vectors are generated with."""
+
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15"
+"""Options of `ts_headline`, which marks the words matching a query in an excerpt of text."""
+
+
+def text_query(query: str) -> ColumnElement:
+    """Parse a search query as typed by a person.
+
+    Args:
+        query (str): The query.
+
+    Returns:
+        ColumnElement: The `tsquery`."""
+    return func.websearch_to_tsquery(SEARCH_CONFIG, query)
+
+
+def headline(column: ColumnElement, tsquery: ColumnElement) -> ColumnElement[str]:
+    """An excerpt of a text column with the words matching a query marked with `<mark>` tags.
+
+    Args:
+        column (ColumnElement): The text column.
+        tsquery (ColumnElement): The query, from `text_query`.
+
+    Returns:
+        ColumnElement[str]: The excerpt."""
+    return func.ts_headline(SEARCH_CONFIG, column, tsquery, HEADLINE_OPTIONS)
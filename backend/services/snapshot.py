@@ -0,0 +1,229 @@
+"""
+Snapshot Service pre-renders public directory data as static JSON files.
+
+The organization directory and the list of upcoming events are read constantly by anonymous
+visitors but change only a few times a day. Rather than every visitor's request being handled by
+the API, `SnapshotService.build` writes each as a JSON file, and a gzipped copy of it, into the
+static files directory. File names are versioned by a hash of their content, so the files are
+served with immutable caching, and the current versions are listed in a manifest the API serves.
+
+`SnapshotBuilder` rebuilds the snapshots periodically in a background thread, and promptly after
+the API writes organizations or events.
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+from threading import Event, Thread
+from typing import Callable
+from zoneinfo import ZoneInfo
+from sqlalchemy.orm import Session
+from ..database import engine
+from ..models.snapshot import SnapshotManifest
+from .event import EventService
+from .organization import OrganizationService
+from .permission import PermissionService
+
+__authors__ = ["Ajay Gandecha", "Jade Keegan", "Brianna Ta", "Audrey Toney"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+logger = logging.getLogger(__name__)
+
+STATIC_DIRECTORY = Path("./static")
+"""The directory static files are served from, as mounted by the application."""
+
+SNAPSHOTS_PATH = "snapshots"
+"""The path, relative to the static files directory, snapshots are written to and served from."""
+
+MANIFEST_NAME = "manifest.json"
+"""The name of the manifest of the current snapshots in the snapshots directory."""
+
+
+class SnapshotService:
+    """SnapshotService writes and reads static snapshots of public directory data."""
+
+    UPCOMING_EVENTS_LIMIT = 200
+    """The maximum number of events in the upcoming events snapshot."""
+
+    VERSIONS_KEPT = 2
+    """How many versions of each snapshot are kept, so that visitors holding the previous
+    manifest may still load the snapshots it lists."""
+
+    def __init__(self, session: Session, directory: Path = STATIC_DIRECTORY):
+        """Initialize a new SnapshotService instance.
+
+        Args:
+            session (Session): The SQLAlchemy session to read the snapshotted data with.
+            directory (Path, optional): The static files directory.
+        """
+        self._session = session
+        self._directory = directory / SNAPSHOTS_PATH
+
+    def build(self) -> SnapshotManifest:
+        """Write the current snapshots, and then a manifest listing them.
+
+        This method does not enforce permissions, as the snapshotted data is public.
+
+        Returns:
+            SnapshotManifest: The manifest of the snapshots written.
+        """
+        permission = PermissionService(self._session)
+        organizations = OrganizationService(self._session, permission).directory()
+
+        # Events from the start of today, as listed on the events page
+        today = datetime.now(ZoneInfo("America/New_York")).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        events = EventService(self._session, permission).feed(
+            start=today, limit=self.UPCOMING_EVENTS_LIMIT
+        )
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        manifest = SnapshotManifest(
+            built_at=datetime.now(),
+            organizations=self._write("organizations", organizations.content),
+            events=self._write("events", events.model_dump_json().encode()),
+        )
+        self._write_file(
+            self._directory / MANIFEST_NAME, manifest.model_dump_json().encode()
+        )
+        for name in ["organizations", "events"]:
+            self._prune(name)
+        return manifest
+
+    def _write(self, name: str, content: bytes) -> str:
+        """Write a version of a snapshot, and a gzipped copy, returning its URL path."""
+        version = hashlib.sha256(content).hexdigest()[:16]
+        file_name = f"{name}.{version}.json"
+        path = self._directory / file_name
+        if not path.exists():
+            self._write_file(
+                path.with_name(f"{file_name}.gz"), gzip.compress(content, mtime=0)
+            )
+            self._write_file(path, content)
+        else:
+            # Mark the version as the latest, so it is not pruned
+            os.utime(path)
+        return f"/{SNAPSHOTS_PATH}/{file_name}"
+
+    def _write_file(self, path: Path, content: bytes) -> None:
+        """Write a file atomically, so it is never served partially written."""
+        temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temporary.write_bytes(content)
+        os.replace(temporary, path)
+
+    def _prune(self, name: str) -> None:
+        """Delete all but the latest versions of a snapshot."""
+        pattern = re.compile(rf"{re.escape(name)}\.[0-9a-f]{{16}}\.json")
+        versions = sorted(
+            (
+                path
+                for path in self._directory.iterdir()
+                if pattern.fullmatch(path.name)
+            ),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+        for path in versions[self.VERSIONS_KEPT :]:
+            path.unlink(missing_ok=True)
+            path.with_name(f"{path.name}.gz").unlink(missing_ok=True)
+
+
+def read_manifest(directory: Path = STATIC_DIRECTORY) -> SnapshotManifest | None:
+    """Read the manifest of the current snapshots.
+
+    Args:
+        directory (Path, optional): The static files directory.
+
+    Returns:
+        SnapshotManifest | None: The manifest, or None if no snapshots have been built.
+    """
+    try:
+        content = (directory / SNAPSHOTS_PATH / MANIFEST_NAME).read_bytes()
+    except FileNotFoundError:
+        return None
+    return SnapshotManifest.model_validate_json(content)
+
+
+class SnapshotBuilder:
+    """Runs `SnapshotService.build` periodically, and on request, in a background thread."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        directory: Path = STATIC_DIRECTORY,
+        interval: timedelta = timedelta(minutes=15),
+    ):
+        """Initialize the builder.
+
+        Args:
+            session_factory (Callable[[], Session]): Opens a database session for each build.
+            directory (Path, optional): The static files directory.
+            interval (timedelta, optional): How long to wait between builds.
+        """
+        self._session_factory = session_factory
+        self._directory = directory
+        self._interval = interval
+        self._stopped = Event()
+        self._requested = Event()
+        self._thread: Thread | None = None
+
+    def start(self) -> None:
+        """Start building, if not already started."""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = Thread(target=self._run, name="snapshot-builder", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop building and wait for a build in progress to complete."""
+        self._stopped.set()
+        self._requested.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def request_rebuild(self) -> None:
+        """Rebuild the snapshots soon, e.g. after the data they hold has been written.
+
+        Requests made while a build is pending are served by that one build."""
+        self._requested.set()
+
+    def manifest(self) -> SnapshotManifest | None:
+        """Read the manifest of the current snapshots.
+
+        Returns:
+            SnapshotManifest | None: The manifest, or None if no snapshots have been built.
+        """
+        return read_manifest(self._directory)
+
+    def build(self) -> SnapshotManifest:
+        """Build the snapshots now.
+
+        Returns:
+            SnapshotManifest: The manifest of the snapshots built."""
+        with self._session_factory() as session:
+            return SnapshotService(session, self._directory).build()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._requested.clear()
+            try:
+                self.build()
+            except Exception:
+                logger.exception("Building static snapshots failed")
+            self._requested.wait(self._interval.total_seconds())
+
+
+_snapshot_builder = SnapshotBuilder(lambda: Session(engine))
+
+
+def snapshot_builder() -> SnapshotBuilder:
+    """Dependency injection function for the application's SnapshotBuilder."""
+    return _snapshot_builder
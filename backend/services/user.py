@@ -4,12 +4,19 @@ The User Service provides access to the User model and its associated database o
 """
 
 from fastapi import Depends
-from sqlalchemy import select, or_, func
-from sqlalchemy.orm import Session
-from ..database import db_session
+from sqlalchemy import ColumnElement, and_, case, select, or_, func, true
+from sqlalchemy.orm import InstrumentedAttribute, Session
+from ..database import db_read_session, db_session
 from ..models import User, UserDetails, Paginated, PaginationParams
 from ..entities import UserEntity
 from .permission import PermissionService
+from .cache import invalidate_registered_user, user_list_length_cache
+from .pagination import (
+    after_cursor,
+    decode_cursor,
+    encode_cursor,
+    estimated_row_count,
+)
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -49,8 +56,46 @@ class UserService:
             user_details = UserDetails(**user_fields)
             return user_details
 
+    def get_identity(self, pid: int) -> User | None:
+        """Get a User by PID without loading their permissions.
+
+        Most routes only need to know who the subject is, and permission checks are
+        made by the PermissionService, so this avoids the permission queries of `get`.
+
+        Args:
+            pid: The PID of the user.
+
+        Returns:
+            User | None: The user or None if not found.
+        """
+        query = select(UserEntity).where(UserEntity.pid == pid)
+        user_entity: UserEntity | None = self._session.scalar(query)
+        if user_entity is None:
+            return None
+        else:
+            return user_entity.to_model()
+
+    def get_by_id(self, id: int) -> User | None:
+        """Get a User by their ID without loading their permissions.
+
+        Args:
+            id: The ID of the user.
+
+        Returns:
+            User | None: The user or None if not found.
+        """
+        user_entity: UserEntity | None = self._session.get(UserEntity, id)
+        if user_entity is None:
+            return None
+        else:
+            return user_entity.to_model()
+
     def search(self, _subject: User, query: str) -> list[User]:
-        """Search for users by their name, onyen, email.
+        """Search for users by their name, onyen, email, or PID.
+
+        Every whitespace-separated term of the query must match part of one of the user's fields.
+        Results are ranked so that exact onyen, email, or PID matches come first, followed by users
+        with a field beginning with each term (as when typing a name), then all other matches.
 
         Args:
             subject: The user performing the action.
@@ -59,65 +104,81 @@ class UserService:
         Returns:
             list[User]: The list of users matching the query.
         """
-        statement = select(UserEntity)
-        criteria = or_(
-            UserEntity.first_name.ilike(f"%{query}%"),
-            UserEntity.last_name.ilike(f"%{query}%"),
-            UserEntity.onyen.ilike(f"%{query}%"),
-            UserEntity.email.ilike(f"%{query}%"),
+        statement = (
+            select(UserEntity)
+            .where(self._search_criteria(query))
+            .order_by(*self._search_ranking(query))
+            .limit(10)
         )
-        statement = statement.where(criteria).limit(10)
         entities = self._session.execute(statement).scalars()
         return [entity.to_model() for entity in entities]
 
     def list(
-        self, subject: User, pagination_params: PaginationParams
+        self,
+        subject: User,
+        pagination_params: PaginationParams,
+        estimate_length: bool = False,
     ) -> Paginated[User]:
         """List Users.
 
         The subject must have the 'user.list' permission on the 'user/' resource.
 
+        Users are ordered by `order_by`, which must be one of the indexed columns in
+        `UserService.SORTABLE_COLUMNS`, and pages after the first are best requested by passing
+        the previous page's `next_cursor`. When `order_by` is empty and a filter is given, users
+        are instead ranked by relevance to the filter, as in `search`, and paged by offset.
+
         Args:
             subject: The user performing the action.
             pagination_params: The pagination parameters.
+            estimate_length: Whether the length may be estimated rather than counted exactly.
 
         Returns:
             Paginated[User]: The paginated list of users.
 
         Raises:
             PermissionException: If the subject does not have the required permission.
+            ValueError: If `order_by` is not sortable or the cursor is malformed.
         """
         self._permission.enforce(subject, "user.list", "user/")
 
         statement = select(UserEntity)
-        length_statement = select(func.count()).select_from(UserEntity)
         if pagination_params.filter != "":
-            query = pagination_params.filter
-            criteria = or_(
-                UserEntity.first_name.ilike(f"%{query}%"),
-                UserEntity.last_name.ilike(f"%{query}%"),
-                UserEntity.onyen.ilike(f"%{query}%"),
-            )
-            statement = statement.where(criteria)
-            length_statement = length_statement.where(criteria)
+            statement = statement.where(self._search_criteria(pagination_params.filter))
 
         offset = pagination_params.page * pagination_params.page_size
         limit = pagination_params.page_size
 
-        if pagination_params.order_by != "":
+        key: tuple[InstrumentedAttribute, ...] | None = None
+        if pagination_params.order_by == "" and pagination_params.filter != "":
             statement = statement.order_by(
-                getattr(UserEntity, pagination_params.order_by)
+                *self._search_ranking(pagination_params.filter)
+            ).offset(offset)
+        else:
+            order_by = pagination_params.order_by or "id"
+            if order_by not in self.SORTABLE_COLUMNS:
+                raise ValueError(f"Users cannot be ordered by '{order_by}'.")
+            key = self.SORTABLE_COLUMNS[order_by]
+            statement = statement.order_by(*key)
+            if pagination_params.cursor != "":
+                values = decode_cursor(pagination_params.cursor, len(key))
+                statement = statement.where(after_cursor(key, values))
+            else:
+                statement = statement.offset(offset)
+
+        entities = self._session.execute(statement.limit(limit)).scalars().all()
+
+        next_cursor = ""
+        if key is not None and len(entities) == limit:
+            next_cursor = encode_cursor(
+                [getattr(entities[-1], column.key) for column in key]
             )
 
-        statement = statement.offset(offset).limit(limit)
-
-        length = self._session.execute(length_statement).scalar()
-        entities = self._session.execute(statement).scalars()
-
         return Paginated(
             items=[entity.to_model() for entity in entities],
-            length=length,
+            length=self._length(pagination_params.filter, estimate_length),
             params=pagination_params,
+            next_cursor=next_cursor,
         )
 
     def create(self, subject: User, user: User) -> User:
@@ -140,6 +201,8 @@ class UserService:
         entity = UserEntity.from_model(user)
         self._session.add(entity)
         self._session.commit()
+        user_list_length_cache.clear()
+        invalidate_registered_user(entity.pid)
         return entity.to_model()
 
     def update(self, subject: User, user: User) -> User:
@@ -162,4 +225,119 @@ class UserService:
         entity = self._session.get(UserEntity, user.id)
         entity.update(user)
         self._session.commit()
+        user_list_length_cache.clear()
+        invalidate_registered_user(entity.pid)
         return entity.to_model()
+
+    SORTABLE_COLUMNS: dict[str, tuple[InstrumentedAttribute, ...]] = {
+        "id": (UserEntity.id,),
+        "pid": (UserEntity.pid,),
+        "onyen": (UserEntity.onyen,),
+        "email": (UserEntity.email,),
+        "first_name": (UserEntity.first_name, UserEntity.id),
+        "last_name": (UserEntity.last_name, UserEntity.id),
+    }
+    """Columns users may be listed in order of, mapped to the indexed, unique sort key used."""
+
+    def _length(self, filter: str, estimate: bool) -> int:
+        """Count the users matching a filter.
+
+        When estimating, the unfiltered length comes from the planner's statistics on the user
+        table, and filtered lengths are cached briefly per filter.
+
+        Args:
+            filter: The filter users must match, if not empty.
+            estimate: Whether the length may be estimated.
+
+        Returns:
+            int: The number of users matching the filter."""
+        if estimate:
+            if filter == "":
+                length = estimated_row_count(self._session, UserEntity.__tablename__)
+            else:
+                length = user_list_length_cache.get(filter)
+            if length is not None:
+                return length
+
+        statement = select(func.count()).select_from(UserEntity)
+        if filter != "":
+            statement = statement.where(self._search_criteria(filter))
+        length = self._session.execute(statement).scalar()
+        if estimate and filter != "":
+            user_list_length_cache.set(filter, length)
+        return length
+
+    _SEARCH_FIELDS = (
+        UserEntity.first_name,
+        UserEntity.last_name,
+        UserEntity.onyen,
+        UserEntity.email,
+    )
+    """Columns matched by searches, each backed by a trigram index (see migration 6ab1c2e0f3d4)."""
+
+    def _search_criteria(self, query: str) -> ColumnElement[bool]:
+        """Criteria matching users with every term of a query in one of their fields, or whose
+        PID is exactly the query.
+
+        Substring matches use ILIKE, which PostgreSQL serves from the fields' trigram indexes, and
+        the PID match is served by its unique index, so the arms are combined with a BitmapOr.
+        Exact onyen and email matches are also substring matches, so they only affect ranking.
+        """
+        return or_(self._search_terms_match(query, "%{}%"), *self._search_pid(query))
+
+    def _search_ranking(self, query: str) -> tuple[ColumnElement, ...]:
+        """Order by clauses ranking exact matches, then prefix matches, then substring matches."""
+        rank = case(
+            (or_(*self._search_exact(query)), 0),
+            (self._search_terms_match(query, "{}%"), 1),
+            else_=2,
+        )
+        return rank, UserEntity.last_name, UserEntity.first_name, UserEntity.id
+
+    def _search_exact(self, query: str) -> tuple[ColumnElement[bool], ...]:
+        """Criteria for a query exactly matching a user's onyen, email, or PID."""
+        query = query.strip().lower()
+        return (
+            func.lower(UserEntity.onyen) == query,
+            func.lower(UserEntity.email) == query,
+            *self._search_pid(query),
+        )
+
+    def _search_pid(self, query: str) -> tuple[ColumnElement[bool], ...]:
+        """Criteria for a query exactly matching a user's PID, if the query could be a PID."""
+        query = query.strip()
+        if query.isdigit() and len(query) <= 9:
+            return (UserEntity.pid == int(query),)
+        return ()
+
+    def _search_terms_match(self, query: str, pattern: str) -> ColumnElement[bool]:
+        """Criteria for every term of a query matching a LIKE pattern in one of the search fields.
+
+        Args:
+            query: The search query, split into terms on whitespace.
+            pattern: Format string placing a term in a LIKE pattern, e.g. `{}%` for a prefix match.
+        """
+        terms = [
+            term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            for term in query.split()
+        ]
+        return and_(
+            true(),
+            *[
+                or_(
+                    *[
+                        field.ilike(pattern.format(term), escape="\\")
+                        for field in self._SEARCH_FIELDS
+                    ]
+                )
+                for term in terms
+            ],
+        )
+
+
+def user_reader(session: Session = Depends(db_read_session)) -> UserService:
+    """Dependency injection function for an UserService whose session reads from the replica.
+
+    Only routes which list or search users, and do not cache the results, should use it.
+    """
+    return UserService(session, PermissionService(session))
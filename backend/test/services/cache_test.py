@@ -0,0 +1,104 @@
+"""Tests for the in-process caches of the service layer."""
+
+from datetime import timedelta
+
+from ...models import User, UserDetails
+from ...services.cache import (
+    TTLCache,
+    clear_all_caches,
+    registered_user_cache,
+    registered_user_identity_cache,
+    invalidate_registered_user,
+)
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class FakeTimer:
+    """Manually advanced clock for testing expiration."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_missing():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=timedelta(seconds=10))
+    assert cache.get("a") is None
+
+
+def test_set_and_get():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=timedelta(seconds=10))
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+
+def test_expires_after_ttl():
+    timer = FakeTimer()
+    cache: TTLCache[str, int] = TTLCache(
+        maxsize=2, ttl=timedelta(seconds=10), timer=timer
+    )
+    cache.set("a", 1)
+    timer.now = 9.9
+    assert cache.get("a") == 1
+    timer.now = 10
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=timedelta(seconds=10))
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_evicts_by_weight():
+    cache: TTLCache[str, bytes] = TTLCache(
+        maxsize=10, ttl=timedelta(seconds=10), weigher=len
+    )
+    cache.set("a", b"12345")
+    cache.set("b", b"1234")
+    cache.set("c", b"12")
+    assert cache.get("a") is None
+    assert cache.get("b") == b"1234"
+    assert cache.get("c") == b"12"
+    cache.set("b", b"1")
+    cache.set("d", b"12345678")
+    assert cache.get("b") == b"1"
+    assert cache.get("c") is None
+
+
+def test_invalidate():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=timedelta(seconds=10))
+    cache.set("a", 1)
+    cache.invalidate("a")
+    cache.invalidate("missing")
+    assert cache.get("a") is None
+
+
+def test_clear_all_caches():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=timedelta(seconds=10))
+    cache.set("a", 1)
+    clear_all_caches()
+    assert cache.get("a") is None
+
+
+def test_invalidate_registered_user():
+    registered_user_cache.set(1, UserDetails(id=1, pid=1))
+    registered_user_cache.set(2, UserDetails(id=2, pid=2))
+    registered_user_identity_cache.set(1, User(id=1, pid=1))
+    invalidate_registered_user(1)
+    assert registered_user_cache.get(1) is None
+    assert registered_user_identity_cache.get(1) is None
+    assert registered_user_cache.get(2) is not None
+    invalidate_registered_user()
+    assert registered_user_cache.get(2) is None
@@ -9,6 +9,7 @@ from sqlalchemy.exc import OperationalError, ProgrammingError
 from ...database import _engine_str
 from ...env import getenv
 from ... import entities
+from ...services.cache import clear_all_caches
 
 POSTGRES_DATABASE = f'{getenv("POSTGRES_DATABASE")}_test'
 POSTGRES_USER = getenv("POSTGRES_USER")
@@ -18,13 +19,13 @@ __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
 
-def reset_database():
+def reset_database(database: str = POSTGRES_DATABASE):
     engine = create_engine(_engine_str(""))
     with engine.connect() as connection:
         try:
             conn = connection.execution_options(autocommit=False)
             conn.execute(text("ROLLBACK"))  # Get out of transactional mode...
-            conn.execute(text(f"DROP DATABASE {POSTGRES_DATABASE}"))
+            conn.execute(text(f"DROP DATABASE {database}"))
         except ProgrammingError:
             ...
         except OperationalError:
@@ -33,11 +34,9 @@ def reset_database():
             )
             exit(1)
 
-        conn.execute(text(f"CREATE DATABASE {POSTGRES_DATABASE}"))
+        conn.execute(text(f"CREATE DATABASE {database}"))
         conn.execute(
-            text(
-                f"GRANT ALL PRIVILEGES ON DATABASE {POSTGRES_DATABASE} TO {POSTGRES_USER}"
-            )
+            text(f"GRANT ALL PRIVILEGES ON DATABASE {database} TO {POSTGRES_USER}")
         )
 
 
@@ -51,6 +50,7 @@ def test_engine() -> Engine:
 def session(test_engine: Engine):
     entities.EntityBase.metadata.drop_all(test_engine)
     entities.EntityBase.metadata.create_all(test_engine)
+    clear_all_caches()
     session = Session(test_engine)
     try:
         yield session
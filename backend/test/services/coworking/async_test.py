@@ -0,0 +1,123 @@
+"""Tests for running services through an AsyncSession, as async routes do"""
+
+import asyncio
+import pytest
+from typing import Any, Awaitable, Callable
+from fastapi import HTTPException
+from fastapi.security.http import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from ....api.authentication import _generate_token, registered_user_identity_async
+from ....database import _async_engine_options, _engine_str
+from ....models.coworking import ReservationState
+from ....services import PermissionService
+from ....services.coworking.reservation import reservation_service
+from ....services.coworking.status import status_service
+from ....services.event import EventService
+from ....entities.coworking import ReservationEntity
+from ..conftest import POSTGRES_DATABASE
+
+# Since there are relationship dependencies between the entities, order matters.
+from .time import *
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from .operating_hours_data import fake_data_fixture as insert_order_1
+from .room_data import fake_data_fixture as insert_order_2
+from .seat_data import fake_data_fixture as insert_order_3
+from .reservation.reservation_data import fake_data_fixture as insert_order_4
+
+# Import the fake model data in a namespace for test assertions
+from ..core_data import user_data
+from .reservation import reservation_data
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+def run_async(function: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+    """Run a coroutine function with an AsyncSession on the test database, in a new event loop."""
+
+    async def run():
+        engine = create_async_engine(
+            _engine_str(POSTGRES_DATABASE, "postgresql+asyncpg")
+        )
+        try:
+            async with AsyncSession(engine) as session:
+                return await function(session)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+def test_async_engine_options():
+    """Tests that async engines pass the database timeouts as asyncpg server settings"""
+    options = _async_engine_options()
+    settings = options["connect_args"]["server_settings"]
+    assert settings["statement_timeout"].isdigit()
+    assert settings["idle_in_transaction_session_timeout"].isdigit()
+    assert "options" not in options["connect_args"]
+
+
+def test_registered_user_identity_async():
+    """Tests that the async identity dependency resolves the token's user"""
+    token = HTTPAuthorizationCredentials(
+        scheme="Bearer",
+        credentials=_generate_token(user_data.user.onyen, user_data.user.pid),
+    )
+    user = run_async(lambda session: registered_user_identity_async(session, token))
+    assert user.id == user_data.user.id
+    assert not hasattr(user, "permissions")
+
+
+def test_registered_user_identity_async_unregistered():
+    """Tests that the async identity dependency rejects tokens of unregistered users"""
+    token = HTTPAuthorizationCredentials(
+        scheme="Bearer", credentials=_generate_token("nobody", 123456789)
+    )
+    with pytest.raises(HTTPException) as e:
+        run_async(lambda session: registered_user_identity_async(session, token))
+    assert e.value.status_code == 401
+
+
+def test_coworking_status_async(session: Session):
+    """Tests that the status is the same through an AsyncSession"""
+    status = run_async(
+        lambda session: session.run_sync(
+            lambda session: status_service(session).get_coworking_status(user_data.user)
+        )
+    )
+    expected = status_service(session).get_coworking_status(user_data.user)
+    assert status.my_reservations == expected.my_reservations
+    assert status.operating_hours == expected.operating_hours
+    # Seats of equal availability are shuffled, so only which seats are available is compared
+    assert {seat.id for seat in status.seat_availability} == {
+        seat.id for seat in expected.seat_availability
+    }
+
+
+def test_draft_reservation_async(session: Session, time: dict[str, datetime]):
+    """Tests that a reservation drafted through an AsyncSession is committed"""
+    reservation = run_async(
+        lambda session: session.run_sync(
+            lambda session: reservation_service(session).draft_reservation(
+                user_data.ambassador, reservation_data.test_request()
+            )
+        )
+    )
+    assert reservation.state == ReservationState.DRAFT
+    assert_equal_times(time[NOW], reservation.start)
+    entity = session.get(ReservationEntity, reservation.id)
+    assert entity is not None
+    assert entity.state == ReservationState.DRAFT
+
+
+def test_feed_async(session: Session):
+    """Tests that the events feed is the same through an AsyncSession"""
+    feed = run_async(
+        lambda session: session.run_sync(
+            lambda session: EventService(session, PermissionService(session)).feed()
+        )
+    )
+    assert feed == EventService(session, PermissionService(session)).feed()
@@ -0,0 +1,124 @@
+"""Tests for reading database engine settings from the environment."""
+
+import pytest
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.exc import InternalError
+from sqlalchemy.orm import Session
+
+# Tested Dependencies
+from ... import database
+from ...database import (
+    _engine_options,
+    _engine_str,
+    _read_engine,
+    _replica_engine_str,
+    db_read_session,
+)
+from ...entities import EntityBase, UserEntity
+from ...services.user import user_reader
+
+# Data Models for Fake Data Inserted in Setup
+from .conftest import POSTGRES_DATABASE, reset_database
+from .user_data import root, user
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+REPLICA_DATABASE = f"{POSTGRES_DATABASE}_replica"
+
+
+@pytest.fixture(scope="module")
+def replica_engine():
+    """A second database on the test server, standing in for a read replica."""
+    reset_database(REPLICA_DATABASE)
+    engine = create_engine(_engine_str(REPLICA_DATABASE))
+    EntityBase.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def replica(
+    replica_engine: Engine, monkeypatch: pytest.MonkeyPatch, session: Session
+) -> Engine:
+    """Routes read sessions to the replica, which holds a user the primary does not."""
+    with Session(replica_engine) as replica_session:
+        replica_session.query(UserEntity).delete()
+        replica_session.add(UserEntity.from_model(user))
+        replica_session.commit()
+    monkeypatch.setattr(
+        database, "read_engine", _read_engine(_engine_str(REPLICA_DATABASE))
+    )
+    return replica_engine
+
+
+def test_engine_options_defaults(monkeypatch: pytest.MonkeyPatch):
+    """Tests that unset settings have production defaults, and statements are not logged"""
+    for variable in ["POSTGRES_POOL_SIZE", "POSTGRES_STATEMENT_TIMEOUT"]:
+        monkeypatch.delenv(variable, raising=False)
+    monkeypatch.setenv("MODE", "production")
+    options = _engine_options()
+    assert options["pool_size"] == 5
+    assert options["pool_pre_ping"] is True
+    assert options["echo"] is False
+    assert "statement_timeout=30000" in options["connect_args"]["options"]
+
+
+def test_engine_options_from_environment(monkeypatch: pytest.MonkeyPatch):
+    """Tests that settings are read from the environment"""
+    monkeypatch.setenv("MODE", "development")
+    monkeypatch.setenv("POSTGRES_POOL_SIZE", "20")
+    monkeypatch.setenv("POSTGRES_POOL_PRE_PING", "false")
+    monkeypatch.setenv("POSTGRES_STATEMENT_TIMEOUT", "0")
+    monkeypatch.setenv("POSTGRES_ECHO", "false")
+    options = _engine_options()
+    assert options["pool_size"] == 20
+    assert options["pool_pre_ping"] is False
+    assert options["echo"] is False
+    assert "statement_timeout=0" in options["connect_args"]["options"]
+
+
+def test_engine_options_echo_in_development(monkeypatch: pytest.MonkeyPatch):
+    """Tests that statements are logged in development unless disabled"""
+    monkeypatch.setenv("MODE", "development")
+    monkeypatch.delenv("POSTGRES_ECHO", raising=False)
+    assert _engine_options()["echo"] is True
+
+
+def test_replica_falls_back_to_primary(monkeypatch: pytest.MonkeyPatch):
+    """Tests that reads are served by the primary's pool when no replica is configured"""
+    monkeypatch.delenv("POSTGRES_REPLICA_URL", raising=False)
+    assert _replica_engine_str() == _engine_str()
+    assert _read_engine(_replica_engine_str()).pool is database.engine.pool
+
+
+def test_replica_from_environment(monkeypatch: pytest.MonkeyPatch):
+    """Tests that the replica's connection string is read from the environment"""
+    url = _engine_str(REPLICA_DATABASE)
+    monkeypatch.setenv("POSTGRES_REPLICA_URL", url)
+    assert _replica_engine_str() == url
+    assert _read_engine(url).pool is not database.engine.pool
+
+
+def test_read_session_reads_replica(replica: Engine, session: Session):
+    """Tests that services injected with a read session query the replica"""
+    sessions = db_read_session()
+    user_svc = user_reader(next(sessions))
+    try:
+        assert user_svc.search(root, "sally") == [user]
+    finally:
+        sessions.close()
+    assert session.query(UserEntity).count() == 0
+
+
+def test_read_session_is_read_only(replica: Engine):
+    """Tests that writing through a read session fails"""
+    sessions = db_read_session()
+    read_session = next(sessions)
+    try:
+        read_session.add(UserEntity.from_model(root))
+        with pytest.raises(InternalError):
+            read_session.commit()
+    finally:
+        sessions.close()
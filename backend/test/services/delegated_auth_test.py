@@ -0,0 +1,139 @@
+"""Tests for the delegated authentication verification client.
+
+A local stand-in for the production authentication server's `/verify` route is served from a
+background thread for the verifier to make real HTTP requests against."""
+
+import json
+import time
+import pytest
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from urllib.parse import urlparse, parse_qs
+
+from ...services.delegated_auth import (
+    CircuitBreaker,
+    DelegatedAuthVerifier,
+    DelegatedAuthUnavailableException,
+)
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class StandInVerifyHandler(BaseHTTPRequestHandler):
+    """Responds to /verify based on the token: good, bad, error, or slow."""
+
+    requests_received: list[str] = []
+
+    def do_GET(self):
+        token = parse_qs(urlparse(self.path).query)["token"][0]
+        StandInVerifyHandler.requests_received.append(token)
+        if token == "slow":
+            time.sleep(0.5)
+        if token == "good" or token == "slow":
+            self._respond(200, {"uid": "root", "pid": 999999999})
+        elif token == "bad":
+            self._respond(401, {"detail": "Invalid token"})
+        else:
+            self._respond(500, {"detail": "Internal Server Error"})
+
+    def _respond(self, status: int, body: dict):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        ...
+
+
+@pytest.fixture(scope="module")
+def verify_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInVerifyHandler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture()
+def verifier(verify_server: str):
+    StandInVerifyHandler.requests_received = []
+    verifier = DelegatedAuthVerifier(
+        verify_server,
+        read_timeout=timedelta(seconds=0.1),
+        failure_threshold=2,
+        reset_timeout=timedelta(minutes=1),
+    )
+    yield verifier
+    verifier.close()
+
+
+def test_verify_valid_token(verifier: DelegatedAuthVerifier):
+    claims = verifier.verify("good")
+    assert claims == {"uid": "root", "pid": 999999999}
+
+
+def test_verify_invalid_token(verifier: DelegatedAuthVerifier):
+    assert verifier.verify("bad") is None
+
+
+def test_verify_caches_claims(verifier: DelegatedAuthVerifier):
+    verifier.verify("good")
+    verifier.verify("good")
+    assert StandInVerifyHandler.requests_received == ["good"]
+
+
+def test_verify_does_not_cache_rejections(verifier: DelegatedAuthVerifier):
+    verifier.verify("bad")
+    verifier.verify("bad")
+    assert StandInVerifyHandler.requests_received == ["bad", "bad"]
+
+
+def test_verify_times_out(verifier: DelegatedAuthVerifier):
+    with pytest.raises(DelegatedAuthUnavailableException):
+        verifier.verify("slow")
+
+
+def test_verify_server_error(verifier: DelegatedAuthVerifier):
+    with pytest.raises(DelegatedAuthUnavailableException):
+        verifier.verify("error")
+
+
+def test_verify_opens_circuit_after_failures(verifier: DelegatedAuthVerifier):
+    for _ in range(2):
+        with pytest.raises(DelegatedAuthUnavailableException):
+            verifier.verify("error")
+    assert verifier.breaker.is_open
+    with pytest.raises(DelegatedAuthUnavailableException):
+        verifier.verify("good")
+    assert StandInVerifyHandler.requests_received == ["error", "error"]
+
+
+def test_verify_unreachable_server():
+    verifier = DelegatedAuthVerifier(
+        "http://127.0.0.1:9", connect_timeout=timedelta(seconds=0.1)
+    )
+    with pytest.raises(DelegatedAuthUnavailableException):
+        verifier.verify("good")
+
+
+def test_circuit_breaker_half_open_trial():
+    now = [0.0]
+    breaker = CircuitBreaker(1, timedelta(seconds=10), timer=lambda: now[0])
+    breaker.record_failure()
+    assert not breaker.allow()
+    now[0] = 10
+    assert breaker.allow()
+    assert not breaker.allow()  # Only one trial call while half-open
+    breaker.record_failure()
+    assert not breaker.allow()
+    now[0] = 20
+    assert breaker.allow()
+    breaker.record_success()
+    assert not breaker.is_open
+    assert breaker.allow()
@@ -0,0 +1,153 @@
+"""Tests for the overdue checkout service"""
+
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import create_autospec
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+from ....entities.role_entity import RoleEntity
+from ....entities.user_entity import UserEntity
+from ....models.equipment_overdue import EquipmentLoanPolicy
+from ....models.role import Role
+from ....services.equipment import EquipmentService
+from ....services.equipment_overdue import (
+    OverdueCheckoutScanner,
+    OverdueCheckoutService,
+)
+from ....services.exceptions import UserPermissionException
+from ....services.permission import PermissionService
+from ..reset_table_id_seq import reset_table_id_seq
+from ..user_data import user, ambassador
+from .user_equipment_data import checkouts, insert_fake_data
+
+__authors__ = ["Nicholas Mountain, Jacob Brown"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+@pytest.fixture()
+def overdue_service(session: Session):
+    """OverdueCheckoutService with permissions granted."""
+    return OverdueCheckoutService(session, create_autospec(PermissionService))
+
+
+@pytest.fixture(autouse=True)
+def fake_data_fixture(session: Session):
+    """Inserts fake equipment data to the test session."""
+    session.add(UserEntity.from_model(user))
+    session.add(RoleEntity.from_model(Role(id=2, name="ambassadors")))
+    session.commit()
+    reset_table_id_seq(session, RoleEntity, RoleEntity.id, 3)
+    insert_fake_data(session)
+    session.commit()
+    yield
+
+
+active_checkouts = [checkout for checkout in checkouts if checkout.is_active]
+
+
+def test_scan_finds_nothing_within_loan_period(overdue_service: OverdueCheckoutService):
+    """Tests that checkouts within the default loan period are not overdue"""
+    report = overdue_service.scan()
+
+    assert report.count == 0
+    assert report.checkouts == []
+    assert report.oldest_due_at is None
+
+
+def test_scan_finds_checkouts_past_default_loan_period(
+    overdue_service: OverdueCheckoutService,
+):
+    """Tests that active checkouts past the default loan period are overdue"""
+    report = overdue_service.scan(datetime.now() + timedelta(days=8))
+
+    assert report.count == len(active_checkouts)
+    assert {checkout.equipment_id for checkout in report.checkouts} == {
+        checkout.equipment_id for checkout in active_checkouts
+    }
+    assert report.by_model == {"Arduino Uno": 4, "Meta Quest 3": 1}
+    assert report.oldest_due_at == report.checkouts[0].due_at
+
+
+def test_scan_applies_loan_policies(overdue_service: OverdueCheckoutService):
+    """Tests that a model's loan policy overrides the default loan period"""
+    overdue_service.set_loan_policy(
+        ambassador,
+        EquipmentLoanPolicy(model="Meta Quest 3", loan_period=timedelta(days=1)),
+    )
+    overdue_service.set_loan_policy(
+        ambassador,
+        EquipmentLoanPolicy(model="Arduino Uno", loan_period=timedelta(days=30)),
+    )
+
+    report = overdue_service.scan(datetime.now() + timedelta(days=2))
+
+    assert report.by_model == {"Meta Quest 3": 1}
+    checkout = report.checkouts[0]
+    assert checkout.due_at == checkout.started_at + timedelta(days=1)
+
+
+def test_set_loan_policy_replaces_policy(overdue_service: OverdueCheckoutService):
+    """Tests that setting a model's loan policy again replaces it"""
+    policy = EquipmentLoanPolicy(model="Arduino Uno", loan_period=timedelta(days=3))
+    overdue_service.set_loan_policy(ambassador, policy)
+    policy.loan_period = timedelta(days=5)
+    overdue_service.set_loan_policy(ambassador, policy)
+
+    assert overdue_service.get_loan_policies(ambassador) == [policy]
+    overdue_service._permission.enforce.assert_called_with(
+        ambassador, "equipment.view.checkout", "equipment"
+    )
+
+
+def test_get_report_is_cached_until_return(
+    overdue_service: OverdueCheckoutService, session: Session
+):
+    """Tests that the latest report is served until a checkout is returned"""
+    scanned = overdue_service.scan(datetime.now() + timedelta(days=8))
+    assert overdue_service.get_report(ambassador) == scanned
+
+    equipment_service = EquipmentService(session)
+    equipment_service._permission = create_autospec(PermissionService)
+    equipment_service.return_checkout(active_checkouts[0], ambassador)
+
+    assert overdue_service.get_report(ambassador).count == 0
+
+
+def test_get_summary(overdue_service: OverdueCheckoutService):
+    """Tests that the summary holds the report's counts without its checkouts"""
+    report = overdue_service.scan(datetime.now() + timedelta(days=8))
+
+    summary = overdue_service.get_summary(ambassador)
+
+    assert summary.count == report.count
+    assert summary.by_model == report.by_model
+    assert not hasattr(summary, "checkouts")
+
+
+def test_get_report_not_authorized(session: Session):
+    """Tests that overdue checkouts cannot be viewed without ambassador permissions"""
+    with pytest.raises(UserPermissionException):
+        OverdueCheckoutService(session, PermissionService(session)).get_report(user)
+
+
+def test_set_loan_policy_not_authorized(session: Session):
+    """Tests that loan policies cannot be set without ambassador permissions"""
+    with pytest.raises(UserPermissionException):
+        OverdueCheckoutService(session, PermissionService(session)).set_loan_policy(
+            user, EquipmentLoanPolicy(model="Arduino Uno", loan_period=timedelta(1))
+        )
+
+
+def test_scanner_caches_report(test_engine: Engine, session: Session):
+    """Tests that the scanner runs a scan in its own session and caches the report"""
+    scanner = OverdueCheckoutScanner(lambda: Session(test_engine))
+    scanner.start()
+    scanner.stop()
+
+    overdue_service = OverdueCheckoutService(
+        session, create_autospec(PermissionService)
+    )
+    report = overdue_service.get_report(ambassador)
+    assert report == scanner.scan().model_copy(update={"scanned_at": report.scanned_at})
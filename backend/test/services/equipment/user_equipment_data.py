@@ -5,14 +5,24 @@
 import pytest
 from sqlalchemy.orm import Session
 from backend.entities.equipment_checkout_entity import EquipmentCheckoutEntity
+from backend.entities.equipment_checkout_history_entity import (
+    EquipmentCheckoutHistoryEntity,
+)
 from backend.entities.equipment_checkout_request_entity import (
     EquipmentCheckoutRequestEntity,
 )
+from backend.entities.equipment_condition_note_entity import (
+    EquipmentConditionNoteEntity,
+)
 from backend.entities.permission_entity import PermissionEntity
 from backend.entities.staged_checkout_request_entity import StagedCheckoutRequestEntity
 from backend.entities.user_entity import UserEntity
 from backend.models.StagedCheckoutRequest import StagedCheckoutRequest
 from backend.models.equipment_checkout_request import EquipmentCheckoutRequest
+from backend.models.equipment_history import (
+    EquipmentCheckoutHistory,
+    EquipmentConditionNote,
+)
 from datetime import datetime
 
 from backend.models.permission import Permission
@@ -43,8 +53,6 @@ quest_3 = Equipment(
     equipment_image=DeviceType.META_QUEST_3.value,
     condition=10,
     is_checked_out=False,
-    condition_notes=[],
-    checkout_history=[],
 )
 arduino = Equipment(
     equipment_id=2,
@@ -52,8 +60,6 @@ arduino = Equipment(
     equipment_image=DeviceType.ARDUINO_UNO.value,
     condition=10,
     is_checked_out=False,
-    condition_notes=[],
-    checkout_history=[],
 )
 
 arduino2 = Equipment(
@@ -62,8 +68,6 @@ arduino2 = Equipment(
     equipment_image=DeviceType.ARDUINO_UNO.value,
     condition=10,
     is_checked_out=False,
-    condition_notes=[],
-    checkout_history=[],
 )
 
 arduino3 = Equipment(
@@ -72,8 +76,6 @@ arduino3 = Equipment(
     equipment_image=DeviceType.ARDUINO_UNO.value,
     condition=10,
     is_checked_out=True,
-    condition_notes=[],
-    checkout_history=[],
 )
 
 quest_3_two = Equipment(
@@ -82,8 +84,6 @@ quest_3_two = Equipment(
     equipment_image=DeviceType.META_QUEST_3.value,
     condition=9,
     is_checked_out=True,
-    condition_notes=["Lights on fire whenever it is turned on."],
-    checkout_history=[111111111],
 )
 
 arduino4 = Equipment(
@@ -92,8 +92,6 @@ arduino4 = Equipment(
     equipment_image=DeviceType.ARDUINO_UNO.value,
     condition=10,
     is_checked_out=True,
-    condition_notes=[],
-    checkout_history=[],
 )
 
 arduino5 = Equipment(
@@ -102,8 +100,6 @@ arduino5 = Equipment(
     equipment_image=DeviceType.ARDUINO_UNO.value,
     condition=10,
     is_checked_out=True,
-    condition_notes=[],
-    checkout_history=[],
 )
 
 arduino6 = Equipment(
@@ -112,8 +108,16 @@ arduino6 = Equipment(
     equipment_image=DeviceType.ARDUINO_UNO.value,
     condition=10,
     is_checked_out=True,
-    condition_notes=[],
-    checkout_history=[],
+)
+
+quest_3_two_history = EquipmentCheckoutHistory(
+    equipment_id=5, pid=111111111, checked_out_at=datetime(2023, 10, 1, 12, 0)
+)
+
+quest_3_two_note = EquipmentConditionNote(
+    equipment_id=5,
+    note="Lights on fire whenever it is turned on.",
+    created_at=datetime(2023, 10, 2, 12, 0),
 )
 
 # checkout_request_quest_3 = EquipmentCheckoutRequest(
@@ -213,6 +217,10 @@ equipment = [
     arduino6,
 ]
 
+checkout_history = [quest_3_two_history]
+
+condition_notes = [quest_3_two_note]
+
 checkout_requests = [checkout_request_arduino]
 
 staged_requests = [staged_checkout_request_quest_3, staged_checkout_request_arduino]
@@ -237,6 +245,14 @@ def insert_fake_data(session: Session):
         session.add(entity)
         entities.append(entity)
 
+    session.flush()
+
+    # Create entities for test equipment checkout history and condition note data
+    for item in checkout_history:
+        session.add(EquipmentCheckoutHistoryEntity.from_model(item))
+    for item in condition_notes:
+        session.add(EquipmentConditionNoteEntity.from_model(item))
+
     # Create entities for test equipment checkout request data
     request_entities = []
     for item in checkout_requests:
@@ -39,8 +39,6 @@ quest3_1 = Equipment(
     equipment_image=DeviceType.META_QUEST_3.value,
     condition=10,
     is_checked_out=False,
-    condition_notes=[],
-    checkout_history=[],
 )
 
 quest3_2 = Equipment(
@@ -49,8 +47,6 @@ quest3_2 = Equipment(
     equipment_image=DeviceType.META_QUEST_3.value,
     condition=10,
     is_checked_out=False,
-    condition_notes=[],
-    checkout_history=[],
 )
 
 quest3_3 = Equipment(
@@ -59,8 +55,6 @@ quest3_3 = Equipment(
     equipment_image=DeviceType.META_QUEST_3.value,
     condition=10,
     is_checked_out=False,
-    condition_notes=[],
-    checkout_history=[],
 )
 
 arduino_1 = Equipment(
@@ -69,8 +63,6 @@ arduino_1 = Equipment(
     equipment_image=DeviceType.ARDUINO_UNO.value,
     condition=10,
     is_checked_out=False,
-    condition_notes=[],
-    checkout_history=[],
 )
 
 arduino_2 = Equipment(
@@ -79,8 +71,6 @@ arduino_2 = Equipment(
     equipment_image=DeviceType.ARDUINO_UNO.value,
     condition=10,
     is_checked_out=False,
-    condition_notes=[],
-    checkout_history=[],
 )
 
 arduino_3 = Equipment(
@@ -89,8 +79,6 @@ arduino_3 = Equipment(
     equipment_image=DeviceType.ARDUINO_UNO.value,
     condition=10,
     is_checked_out=False,
-    condition_notes=[],
-    checkout_history=[],
 )
 
 ipad_1 = Equipment(
@@ -99,8 +87,6 @@ ipad_1 = Equipment(
     equipment_image=DeviceType.IPAD_AIR.value,
     condition=10,
     is_checked_out=False,
-    condition_notes=[],
-    checkout_history=[],
 )
 
 ipad_2 = Equipment(
@@ -109,8 +95,6 @@ ipad_2 = Equipment(
     equipment_image=DeviceType.IPAD_AIR.value,
     condition=10,
     is_checked_out=False,
-    condition_notes=[],
-    checkout_history=[],
 )
 
 ipad_3 = Equipment(
@@ -119,8 +103,6 @@ ipad_3 = Equipment(
     equipment_image=DeviceType.IPAD_AIR.value,
     condition=10,
     is_checked_out=False,
-    condition_notes=[],
-    checkout_history=[],
 )
 
 android_1 = Equipment(
@@ -129,8 +111,6 @@ android_1 = Equipment(
     equipment_image=DeviceType.ANDROID.value,
     condition=10,
     is_checked_out=False,
-    condition_notes=[],
-    checkout_history=[],
 )
 
 android_2 = Equipment(
@@ -139,8 +119,6 @@ android_2 = Equipment(
     equipment_image=DeviceType.ANDROID.value,
     condition=10,
     is_checked_out=False,
-    condition_notes=[],
-    checkout_history=[],
 )
 
 # create permissions for the demo
@@ -12,10 +12,23 @@ from backend.test.services.reset_table_id_seq import reset_table_id_seq
 from backend.entities.role_entity import RoleEntity
 from backend.models.equipment_type import EquipmentType
 from backend.models.role import Role
+from backend.models.pagination import PaginationParams
+from backend.models.equipment_history import EquipmentConditionNote
+from backend.models.equipment_changes import EquipmentRequestKey
+from backend.models.equipment_inventory import (
+    EquipmentInventoryFilter,
+    EquipmentInventoryItem,
+)
+from backend.services.pagination import encode_cursor
 from backend.services.exceptions import (
     UserPermissionException,
 )
 from ....models.equipment import Equipment
+from ....entities.equipment_entity import EquipmentEntity
+from ....entities.equipment_checkout_entity import EquipmentCheckoutEntity
+from ....entities.equipment_checkout_request_entity import (
+    EquipmentCheckoutRequestEntity,
+)
 from ....services.equipment import (
     DuplicateEquipmentCheckoutRequestException,
     EquipmentAlreadyCheckedOutException,
@@ -27,6 +40,8 @@ from ....services.equipment import (
 )
 from ....services.user import UserService
 import pytest
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from .user_equipment_data import (
@@ -35,6 +50,10 @@ from .user_equipment_data import (
     arduino,
     insert_fake_data,
     checkouts,
+    quest_3_two_history,
+    quest_3_two_note,
+    checkout_request_arduino,
+    staged_checkout_request_arduino,
 )
 from ..user_data import user, ambassador
 
@@ -209,8 +228,31 @@ def test_get_all_types_when_zero_available(equipment_service: EquipmentService):
 
     _ = equipment_service.update(changed_item, ambassador)
 
-    fetched_equipment_types = equipment_service.get_all_types()
-    assert fetched_equipment_types[1].num_available == 0
+    fetched_equipment_types = {
+        equipment_type.model: equipment_type
+        for equipment_type in equipment_service.get_all_types()
+    }
+    assert fetched_equipment_types["Meta Quest 3"].num_available == 0
+
+
+def test_get_all_types_cached_until_update(equipment_service: EquipmentService):
+    """Tests that equipment types are cached until equipment is updated"""
+    assert equipment_service.get_all_types()[0].num_available == 1
+
+    # Changes made without the service are not seen while cached
+    equipment_service._session.execute(
+        update(EquipmentEntity)
+        .where(EquipmentEntity.model == "Meta Quest 3")
+        .values(is_checked_out=False)
+    )
+    assert equipment_service.get_all_types()[0].num_available == 1
+
+    # Changes made by the service clear the cache
+    equipment_service._permission = create_autospec(equipment_service._permission)
+    equipment_service.update(
+        arduino.model_copy(update={"is_checked_out": True}), ambassador
+    )
+    assert equipment_service.get_all_types()[0].num_available == 2
 
 
 def test_get_all_requests(equipment_service: EquipmentService):
@@ -296,8 +338,9 @@ def test_get_requested_equipment(equipment_service: EquipmentService):
         ambassador, "Meta Quest 3"
     )
 
-    assert len(available_equipment) == 1
-    assert isinstance(available_equipment[0], Equipment)
+    assert available_equipment == [
+        EquipmentInventoryItem(equipment_id=1, model="Meta Quest 3", condition=10)
+    ]
 
 
 def test_get_requested_equipment_none_available(equipment_service: EquipmentService):
@@ -398,6 +441,60 @@ def test_add_request_while_staged_request_exists(equipment_service: EquipmentSer
         assert True
 
 
+def test_add_request_while_checkout_active(equipment_service: EquipmentService):
+    """Tests that a user cannot add a checkout request for a model they have checked out."""
+    sally = User(
+        id=3,
+        pid=111111111,
+        onyen="user",
+        email="user@unc.edu",
+        first_name="Sally",
+        last_name="Student",
+        signed_equipment_wavier=True,
+    )
+    req = EquipmentCheckoutRequest(
+        user_name="Sally Student", model="Meta Quest 3", pid=111111111
+    )
+
+    with pytest.raises(DuplicateEquipmentCheckoutRequestException):
+        equipment_service.add_request(req, sally)
+
+
+def test_add_request_returns_added_request(equipment_service: EquipmentService):
+    """Tests that add_request returns the request it inserted."""
+    req = EquipmentCheckoutRequest(
+        user_name="Sally Student", model="Arduino Uno", pid=111111111
+    )
+
+    added = equipment_service.add_request(req, ambassador)
+
+    assert added == req
+
+
+def test_checkout_requests_unique_by_pid_and_model(session: Session):
+    """Tests that the database rejects a second checkout request for the same model."""
+    session.add(
+        EquipmentCheckoutRequestEntity(
+            user_name="Rhonda Root", model="Arduino Uno", pid=999999999
+        )
+    )
+
+    with pytest.raises(IntegrityError):
+        session.flush()
+
+
+def test_create_staged_request_duplicate(equipment_service: EquipmentService):
+    """Tests that a user cannot have two staged requests for the same model."""
+    equipment_service._permission = create_autospec(equipment_service._permission)
+
+    stage = StagedCheckoutRequest(
+        user_name="Rhonda Root", model="Arduino Uno", pid=999999999, id_choices=[]
+    )
+
+    with pytest.raises(DuplicateEquipmentCheckoutRequestException):
+        equipment_service.create_staged_request(ambassador, stage)
+
+
 def test_update_wavier_signed_field_unsigned(equipment_service: EquipmentService):
     """Tests that the service properly updates the waiver signed field when its unsigned."""
 
@@ -589,7 +686,7 @@ def test_create_checkout_adds_to_active_checkouts(equipment_service: EquipmentSe
     to_add = EquipmentCheckout(
         user_name="Tyrese Haliburton",
         pid=123456789,
-        equipment_id=2,
+        equipment_id=3,
         model="Arduino Uno",
         is_active=True,
         started_at=datetime.datetime.now(),
@@ -706,6 +803,104 @@ def test_create_checkout_does_not_work_on_checked_out_equipment(
         assert True
 
 
+def test_create_checkout_appends_checkout_history(equipment_service: EquipmentService):
+    """Tests that create_checkout appends the PID of the borrower to the item's checkout history"""
+    equipment_service._permission = create_autospec(equipment_service._permission)
+
+    to_add = EquipmentCheckout(
+        user_name="Lebron James",
+        pid=232323232,
+        equipment_id=1,
+        model="Meta Quest 3",
+        is_active=True,
+        started_at=datetime.datetime.now(),
+        end_at=datetime.datetime.now(),
+    )
+
+    equipment_service.create_checkout(to_add, ambassador)
+
+    history = equipment_service.get_checkout_history(1, ambassador, PaginationParams())
+    assert [entry.pid for entry in history.items] == [232323232]
+
+
+def test_create_checkout_twice_only_checks_out_once(
+    equipment_service: EquipmentService,
+):
+    """Tests that of two checkouts of the same available item only the first succeeds"""
+    equipment_service._permission = create_autospec(equipment_service._permission)
+
+    first = EquipmentCheckout(
+        user_name="Lebron James",
+        pid=232323232,
+        equipment_id=1,
+        model="Meta Quest 3",
+        is_active=True,
+        started_at=datetime.datetime.now(),
+        end_at=datetime.datetime.now(),
+    )
+    second = first.model_copy(update={"user_name": "Anthony Davis", "pid": 343434343})
+
+    equipment_service.create_checkout(first, ambassador)
+    with pytest.raises(EquipmentAlreadyCheckedOutException):
+        equipment_service.create_checkout(second, ambassador)
+
+    active = [
+        checkout
+        for checkout in equipment_service.get_all_active_checkouts(ambassador)
+        if checkout.equipment_id == 1
+    ]
+    assert [checkout.pid for checkout in active] == [232323232]
+    history = equipment_service.get_checkout_history(1, ambassador, PaginationParams())
+    assert [entry.pid for entry in history.items] == [232323232]
+
+
+def test_create_checkout_rejects_second_active_checkout(
+    equipment_service: EquipmentService,
+):
+    """
+    Tests that create_checkout raises EquipmentAlreadyCheckedOutException, rather than adding
+    a second active checkout, when an item marked available already has an active checkout
+    """
+    equipment_service._permission = create_autospec(equipment_service._permission)
+
+    to_add = EquipmentCheckout(
+        user_name="Tyrese Haliburton",
+        pid=123456789,
+        equipment_id=checkouts[0].equipment_id,
+        model="Arduino Uno",
+        is_active=True,
+        started_at=datetime.datetime.now(),
+        end_at=datetime.datetime.now(),
+    )
+
+    with pytest.raises(EquipmentAlreadyCheckedOutException):
+        equipment_service.create_checkout(to_add, ambassador)
+
+    assert len(equipment_service.get_all_active_checkouts(ambassador)) == 5
+    equipment_item = equipment_service.get_equipment_by_id(
+        to_add.equipment_id, ambassador
+    )
+    assert not equipment_item.is_checked_out
+
+
+def test_create_checkout_equipment_not_in_db(equipment_service: EquipmentService):
+    """Tests that create_checkout raises EquipmentNotFoundException for an unknown item"""
+    equipment_service._permission = create_autospec(equipment_service._permission)
+
+    to_add = EquipmentCheckout(
+        user_name="Drake",
+        pid=987654321,
+        equipment_id=100,
+        model="Meta Quest 3",
+        is_active=True,
+        started_at=datetime.datetime.now(),
+        end_at=datetime.datetime.now(),
+    )
+
+    with pytest.raises(EquipmentNotFoundException):
+        equipment_service.create_checkout(to_add, ambassador)
+
+
 def test_return_checkout_updates_is_active(equipment_service: EquipmentService):
     """Tests that return_checkout changes the is_active field in the given checkout to False"""
     equipment_service._permission = create_autospec(equipment_service._permission)
@@ -784,6 +979,21 @@ def test_return_checkout_error_if_not_in_db(equipment_service: EquipmentService)
         assert True
 
 
+def test_return_checkout_not_in_db_leaves_equipment_checked_out(
+    equipment_service: EquipmentService,
+):
+    """Tests that a failed return does not mark the equipment item as available"""
+    equipment_service._permission = create_autospec(equipment_service._permission)
+
+    to_return = checkouts[1].model_copy(update={"equipment_id": 4})
+
+    with pytest.raises(EquipmentCheckoutNotFoundException):
+        equipment_service.return_checkout(to_return, ambassador)
+
+    equipment_item = equipment_service.get_equipment_by_id(4, ambassador)
+    assert equipment_item.is_checked_out
+
+
 def test_return_checkout_not_authorized(equipment_service: EquipmentService):
     """Tests that checkout cannot be returned when user does not have ambassador permissions"""
 
@@ -792,3 +1002,299 @@ def test_return_checkout_not_authorized(equipment_service: EquipmentService):
         pytest.fail()
     except Exception as e:
         assert True
+
+
+def test_get_checkout_history(equipment_service: EquipmentService):
+    """Tests that get_checkout_history returns the history of an item"""
+    equipment_service._permission = create_autospec(equipment_service._permission)
+
+    history = equipment_service.get_checkout_history(5, ambassador, PaginationParams())
+
+    equipment_service._permission.enforce.assert_called_with(
+        ambassador, "equipment.view.checkout", "equipment"
+    )
+    assert history.items == [quest_3_two_history]
+    assert history.length == 1
+
+
+def test_get_checkout_history_pages_newest_first(equipment_service: EquipmentService):
+    """Tests that checkout history is paged newest first, following next_cursor"""
+    equipment_service._permission = create_autospec(equipment_service._permission)
+    for pid in (100000001, 100000002, 100000003):
+        equipment_service.create_checkout(
+            EquipmentCheckout(
+                user_name="Student",
+                pid=pid,
+                equipment_id=1,
+                model="Meta Quest 3",
+                started_at=datetime.datetime.now(),
+                end_at=datetime.datetime.now(),
+            ),
+            ambassador,
+        )
+        equipment_service.return_checkout(
+            equipment_service.get_all_active_checkouts(ambassador)[-1], ambassador
+        )
+
+    first = equipment_service.get_checkout_history(
+        1, ambassador, PaginationParams(page_size=2)
+    )
+    second = equipment_service.get_checkout_history(
+        1, ambassador, PaginationParams(page_size=2, cursor=first.next_cursor)
+    )
+
+    assert [entry.pid for entry in first.items] == [100000003, 100000002]
+    assert [entry.pid for entry in second.items] == [100000001]
+    assert first.length == 3
+    assert second.next_cursor == ""
+
+
+def test_get_checkout_history_equipment_not_in_db(equipment_service: EquipmentService):
+    """Tests that get_checkout_history raises EquipmentNotFoundException for an unknown item"""
+    equipment_service._permission = create_autospec(equipment_service._permission)
+
+    with pytest.raises(EquipmentNotFoundException):
+        equipment_service.get_checkout_history(100, ambassador, PaginationParams())
+
+
+def test_get_checkout_history_malformed_cursor(equipment_service: EquipmentService):
+    """Tests that get_checkout_history raises ValueError for a malformed cursor"""
+    equipment_service._permission = create_autospec(equipment_service._permission)
+
+    with pytest.raises(ValueError):
+        equipment_service.get_checkout_history(
+            5, ambassador, PaginationParams(cursor="not a cursor")
+        )
+
+
+def test_get_checkout_history_not_authorized(equipment_service: EquipmentService):
+    """Tests that checkout history cannot be read without ambassador permissions"""
+    with pytest.raises(UserPermissionException):
+        equipment_service.get_checkout_history(5, user, PaginationParams())
+
+
+def test_add_condition_note(equipment_service: EquipmentService):
+    """Tests that add_condition_note adds a note which get_condition_notes returns first"""
+    equipment_service._permission = create_autospec(equipment_service._permission)
+
+    added = equipment_service.add_condition_note(
+        EquipmentConditionNote(equipment_id=5, note="Strap is frayed."), ambassador
+    )
+    notes = equipment_service.get_condition_notes(5, ambassador, PaginationParams())
+
+    equipment_service._permission.enforce.assert_called_with(
+        ambassador, "equipment.view.checkout", "equipment"
+    )
+    assert added.created_at is not None
+    assert notes.items == [added, quest_3_two_note]
+
+
+def test_add_condition_note_equipment_not_in_db(equipment_service: EquipmentService):
+    """Tests that add_condition_note raises EquipmentNotFoundException for an unknown item"""
+    equipment_service._permission = create_autospec(equipment_service._permission)
+
+    with pytest.raises(EquipmentNotFoundException):
+        equipment_service.add_condition_note(
+            EquipmentConditionNote(equipment_id=100, note="Missing."), ambassador
+        )
+
+
+def test_get_utilization(equipment_service: EquipmentService, session: Session):
+    """Tests that get_utilization measures the time within the window an item was checked out"""
+    equipment_service._permission = create_autospec(equipment_service._permission)
+    start = datetime.datetime(2023, 10, 1)
+    end = datetime.datetime(2023, 10, 11)
+    for started_at, end_at in [
+        (datetime.datetime(2023, 9, 30), datetime.datetime(2023, 10, 2)),
+        (datetime.datetime(2023, 10, 5), datetime.datetime(2023, 10, 7)),
+        (datetime.datetime(2023, 10, 12), datetime.datetime(2023, 10, 13)),
+    ]:
+        session.add(
+            EquipmentCheckoutEntity(
+                user_name="Student",
+                pid=100000001,
+                equipment_id=1,
+                model="Meta Quest 3",
+                is_active=False,
+                started_at=started_at,
+                end_at=end_at,
+            )
+        )
+    session.commit()
+
+    utilization = equipment_service.get_utilization(1, ambassador, start, end)
+
+    assert utilization.checkouts == 2
+    assert utilization.checked_out_seconds == 3 * 24 * 60 * 60
+    assert utilization.utilization == pytest.approx(0.3)
+
+
+def test_get_utilization_counts_active_checkouts(equipment_service: EquipmentService):
+    """Tests that get_utilization counts active checkouts as checked out until now"""
+    equipment_service._permission = create_autospec(equipment_service._permission)
+
+    utilization = equipment_service.get_utilization(
+        checkouts[1].equipment_id, ambassador
+    )
+
+    assert utilization.checkouts == 1
+    assert utilization.checked_out_seconds > 0
+
+
+def test_get_utilization_aware_start(equipment_service: EquipmentService):
+    """Tests that get_utilization accepts a window start with a time zone and no end"""
+    equipment_service._permission = create_autospec(equipment_service._permission)
+    start = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=1)
+
+    utilization = equipment_service.get_utilization(
+        checkouts[1].equipment_id, ambassador, start
+    )
+
+    assert utilization.checkouts == 1
+
+
+def test_get_utilization_invalid_window(equipment_service: EquipmentService):
+    """Tests that get_utilization raises ValueError when the window ends before it starts"""
+    equipment_service._permission = create_autospec(equipment_service._permission)
+
+    with pytest.raises(ValueError):
+        equipment_service.get_utilization(
+            1,
+            ambassador,
+            datetime.datetime(2023, 10, 2),
+            datetime.datetime(2023, 10, 1),
+        )
+
+
+def test_get_changes_without_cursor_is_snapshot(equipment_service: EquipmentService):
+    """Tests that get_changes without a cursor returns every request and active checkout"""
+    equipment_service._permission = create_autospec(equipment_service._permission)
+
+    changes = equipment_service.get_changes(ambassador)
+
+    assert changes.reset
+    assert changes.cursor != ""
+    assert len(changes.requests) == 1
+    assert len(changes.staged_requests) == 2
+    assert len(changes.checkouts) == 5
+
+
+def test_get_changes_since_cursor(equipment_service: EquipmentService):
+    """Tests that get_changes returns only rows changed and requests deleted since a cursor"""
+    equipment_service._permission = create_autospec(equipment_service._permission)
+    equipment_service.CHANGE_OVERLAP = datetime.timedelta(0)
+    cursor = equipment_service.get_changes(ambassador).cursor
+
+    unchanged = equipment_service.get_changes(ambassador, cursor)
+    assert not unchanged.reset
+    assert unchanged.requests == unchanged.staged_requests == unchanged.checkouts == []
+
+    equipment_service.delete_request(ambassador, checkout_request_arduino)
+    equipment_service.add_request(
+        EquipmentCheckoutRequest(
+            user_name="Sally Student", model="Arduino Uno", pid=111111111
+        ),
+        ambassador,
+    )
+    equipment_service.return_checkout(checkouts[1], ambassador)
+
+    changes = equipment_service.get_changes(ambassador, cursor)
+
+    assert not changes.reset
+    assert [request.pid for request in changes.requests] == [111111111]
+    assert changes.deleted_requests == [
+        EquipmentRequestKey(pid=999999999, model="Arduino Uno")
+    ]
+    assert changes.staged_requests == []
+    assert changes.deleted_staged_requests == []
+    assert [(c.equipment_id, c.is_active) for c in changes.checkouts] == [
+        (checkouts[1].equipment_id, False)
+    ]
+
+
+def test_get_changes_reports_deleted_staged_requests(
+    equipment_service: EquipmentService,
+):
+    """Tests that get_changes reports staged requests deleted since a cursor"""
+    equipment_service._permission = create_autospec(equipment_service._permission)
+    cursor = equipment_service.get_changes(ambassador).cursor
+
+    equipment_service.delete_staged_request(ambassador, staged_checkout_request_arduino)
+
+    changes = equipment_service.get_changes(ambassador, cursor)
+    assert changes.deleted_staged_requests == [
+        EquipmentRequestKey(pid=999999999, model="Arduino Uno")
+    ]
+
+
+def test_get_changes_expired_cursor_is_snapshot(equipment_service: EquipmentService):
+    """Tests that a cursor older than deletions are remembered gets a snapshot"""
+    equipment_service._permission = create_autospec(equipment_service._permission)
+    expired = encode_cursor([datetime.datetime.now() - datetime.timedelta(days=2)])
+
+    changes = equipment_service.get_changes(ambassador, expired)
+
+    assert changes.reset
+    assert len(changes.checkouts) == 5
+
+
+def test_get_changes_malformed_cursor(equipment_service: EquipmentService):
+    """Tests that get_changes raises ValueError for a malformed cursor"""
+    equipment_service._permission = create_autospec(equipment_service._permission)
+
+    with pytest.raises(ValueError):
+        equipment_service.get_changes(ambassador, encode_cursor(["yesterday"]))
+
+
+def test_get_inventory_pages_by_cursor(equipment_service: EquipmentService):
+    """Tests that the inventory can be paged through by cursor, in order of equipment id"""
+    first = equipment_service.get_inventory(PaginationParams(page_size=5))
+    second = equipment_service.get_inventory(
+        PaginationParams(page_size=5, cursor=first.next_cursor)
+    )
+
+    assert first.length == len(equipment)
+    assert [item.equipment_id for item in first.items + second.items] == [
+        item.equipment_id for item in equipment
+    ]
+    assert first.items[0] == EquipmentInventoryItem(**equipment[0].model_dump())
+    assert second.next_cursor == ""
+
+
+def test_get_inventory_filters(equipment_service: EquipmentService):
+    """Tests that the inventory is filtered by model, checked out state, and condition"""
+    page = equipment_service.get_inventory(
+        PaginationParams(),
+        EquipmentInventoryFilter(model="Arduino Uno", is_checked_out=False),
+    )
+    assert [item.equipment_id for item in page.items] == [2, 3]
+    assert page.length == 2
+
+    page = equipment_service.get_inventory(
+        PaginationParams(), EquipmentInventoryFilter(max_condition=9)
+    )
+    assert [item.equipment_id for item in page.items] == [5]
+
+
+def test_get_inventory_selects_fields(equipment_service: EquipmentService):
+    """Tests that only the selected fields of equipment are fetched"""
+    page = equipment_service.get_inventory(
+        PaginationParams(page_size=2, order_by="model"), fields=["condition"]
+    )
+
+    assert page.items == [EquipmentInventoryItem(condition=10)] * 2
+    following = equipment_service.get_inventory(
+        PaginationParams(page_size=10, order_by="model", cursor=page.next_cursor),
+        fields=["model"],
+    )
+    assert [item.model for item in following.items] == ["Arduino Uno"] * 4 + [
+        "Meta Quest 3"
+    ] * 2
+
+
+def test_get_inventory_unknown_field(equipment_service: EquipmentService):
+    """Tests that selecting an unknown field or order raises a ValueError"""
+    with pytest.raises(ValueError):
+        equipment_service.get_inventory(PaginationParams(), fields=["pid"])
+    with pytest.raises(ValueError):
+        equipment_service.get_inventory(PaginationParams(order_by="condition"))
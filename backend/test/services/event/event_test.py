@@ -2,16 +2,22 @@
 
 # PyTest
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
 from unittest.mock import create_autospec
 
 from backend.services.exceptions import (
+    OrganizationNotFoundException,
     UserPermissionException,
     ResourceNotFoundException,
 )
 
 # Tested Dependencies
-from ....models import Event, EventDetails
-from ....services import EventService
+from ....models import Event, EventDetails, PaginationParams
+from ....services import EventService, PermissionService
+from ....services.cache import event_calendar_cache
+from ....services.event import EventFullException
 
 # Injected Service Fixtures
 from ..fixtures import event_svc_integration
@@ -20,8 +26,9 @@ from ..fixtures import event_svc_integration
 from ..core_data import setup_insert_data_fixture
 
 # Data Models for Fake Data Inserted in Setup
-from .event_test_data import events, event_one, to_add, updated_event
-from ..user_data import root, user
+from .event_test_data import events, event_one, event_two, to_add, updated_event
+from ..organization.organization_test_data import cads, cssg
+from ..user_data import root, ambassador, user, users
 
 # Test Functions
 
@@ -120,3 +127,192 @@ def test_delete_event_as_user(event_svc_integration: EventService):
     """Test that any user is *unable* to delete events."""
     with pytest.raises(UserPermissionException):
         event_svc_integration.delete(user, 1)
+
+
+def test_feed(event_svc_integration: EventService):
+    """Test that the feed includes events in order of time, with their organizations once."""
+    feed = event_svc_integration.feed()
+    assert feed.events == events
+    assert list(feed.organizations) == [cssg.id]
+    assert feed.organizations[cssg.id].slug == cssg.slug
+    assert feed.next_cursor == ""
+
+
+def test_feed_pages_by_cursor(event_svc_integration: EventService):
+    """Test that the feed can be paged through by cursor."""
+    first = event_svc_integration.feed(limit=1)
+    second = event_svc_integration.feed(cursor=first.next_cursor, limit=1)
+    assert first.events == [event_one]
+    assert second.events == [event_two]
+
+
+def test_feed_within_window(event_svc_integration: EventService):
+    """Test that the feed only includes events within its window of time."""
+    feed = event_svc_integration.feed(start=event_two.time)
+    assert feed.events == [event_two]
+    feed = event_svc_integration.feed(end=event_two.time)
+    assert feed.events == [event_one]
+    feed = event_svc_integration.feed(start=event_two.time, end=event_two.time)
+    assert feed.events == []
+    assert feed.organizations == {}
+
+
+def test_feed_malformed_cursor(event_svc_integration: EventService):
+    """Test that a malformed cursor raises a ValueError."""
+    with pytest.raises(ValueError):
+        event_svc_integration.feed(cursor="not a cursor")
+
+
+def test_search(event_svc_integration: EventService):
+    """Test that events are searched by their name, location, and description."""
+    results = event_svc_integration.search(PaginationParams(filter="workshop"))
+    assert results.length == 1
+    assert results.items[0].event == event_two
+    assert results.items[0].organization.slug == cssg.slug
+
+
+def test_search_highlights_description(event_svc_integration: EventService):
+    """Test that search results include an excerpt with the matching words marked."""
+    results = event_svc_integration.search(PaginationParams(filter="datathon"))
+    assert [result.event for result in results.items] == [event_one]
+    assert "<mark>datathon</mark>" in results.items[0].headline
+
+
+def test_search_ranks_names_first(event_svc_integration: EventService):
+    """Test that events matching a search by name rank above those matching by description."""
+    results = event_svc_integration.search(PaginationParams(filter="sample or mixer"))
+    assert [result.event for result in results.items] == [event_one, event_two]
+
+
+def test_calendar(event_svc_integration: EventService):
+    """Test that the calendar lists all public events."""
+    calendar = event_svc_integration.calendar()
+    content = calendar.content.decode()
+    assert content.startswith("BEGIN:VCALENDAR\r\n")
+    assert content.endswith("END:VCALENDAR\r\n")
+    assert content.count("BEGIN:VEVENT") == len(events)
+    assert f"UID:event-{event_one.id}@csxl.unc.edu" in content
+    assert "SUMMARY:CS+SG Workshop" in content
+    assert all(len(line.encode()) <= 75 for line in content.split("\r\n"))
+
+
+def test_calendar_of_organization(event_svc_integration: EventService):
+    """Test that an organization's calendar lists only its events."""
+    assert event_svc_integration.calendar(cssg.slug).content.count(b"BEGIN:VEVENT") == 2
+    assert event_svc_integration.calendar(cads.slug).content.count(b"BEGIN:VEVENT") == 0
+    with pytest.raises(OrganizationNotFoundException):
+        event_svc_integration.calendar("zebra")
+
+
+def test_calendar_is_cached(event_svc_integration: EventService):
+    """Test that calendars are served from the cache while events are unchanged."""
+    calendar = event_svc_integration.calendar(cssg.slug)
+    session = event_svc_integration._session
+    event_svc_integration._session = None
+    assert event_svc_integration.calendar(cssg.slug) is calendar
+    event_svc_integration._session = session
+
+
+def test_calendar_is_stable(event_svc_integration: EventService):
+    """Test that rendering a calendar again, with no event changed, gives the same feed."""
+    calendar = event_svc_integration.calendar()
+    event_calendar_cache.clear()
+    event_svc_integration.rsvp(user, event_one.id)
+    rendered = event_svc_integration.calendar()
+    assert rendered is not calendar
+    assert rendered.etag == calendar.etag
+    assert rendered.last_modified == calendar.last_modified
+    assert rendered.content == calendar.content
+
+
+def test_calendar_of_no_events(event_svc_integration: EventService):
+    """Test that a calendar of no events has no Last-Modified time."""
+    calendar = event_svc_integration.calendar(cads.slug)
+    assert calendar.last_modified is None
+    event_calendar_cache.clear()
+    assert event_svc_integration.calendar(cads.slug).etag == calendar.etag
+
+
+def test_calendar_invalidated_by_changes(event_svc_integration: EventService):
+    """Test that creating, updating, and deleting events changes the calendars."""
+    calendar = event_svc_integration.calendar()
+    event_svc_integration.update(root, updated_event)
+    updated = event_svc_integration.calendar()
+    assert updated.etag != calendar.etag
+    assert updated.last_modified >= calendar.last_modified
+    assert b"LOCATION:Fetzer Gym" in updated.content
+
+    event_svc_integration.create(root, to_add)
+    assert event_svc_integration.calendar().content.count(b"BEGIN:VEVENT") == 3
+    event_svc_integration.delete(root, event_two.id)
+    assert event_svc_integration.calendar().content.count(b"BEGIN:VEVENT") == 2
+
+
+def test_rsvp(event_svc_integration: EventService):
+    """Test that RSVPs are counted, and repeated RSVPs are counted once."""
+    rsvp = event_svc_integration.rsvp(user, event_one.id)
+    assert rsvp.attending
+    assert rsvp.rsvp_count == 1
+    assert event_svc_integration.rsvp(user, event_one.id).rsvp_count == 1
+    assert event_svc_integration.rsvp(root, event_one.id).rsvp_count == 2
+    assert event_svc_integration.get_from_id(event_one.id).rsvp_count == 2
+    assert not event_svc_integration.get_rsvp(ambassador, event_one.id).attending
+
+
+def test_rsvp_at_capacity(event_svc_integration: EventService):
+    """Test that RSVPs to an event at its capacity are refused."""
+    event_svc_integration.update(root, event_one.model_copy(update={"capacity": 1}))
+    event_svc_integration.rsvp(user, event_one.id)
+    with pytest.raises(EventFullException):
+        event_svc_integration.rsvp(root, event_one.id)
+    rsvp = event_svc_integration.get_rsvp(root, event_one.id)
+    assert not rsvp.attending
+    assert rsvp.rsvp_count == 1
+    assert rsvp.capacity == 1
+
+    # Those who have RSVP'd may RSVP again, and cancelling frees a place
+    assert event_svc_integration.rsvp(user, event_one.id).attending
+    assert event_svc_integration.cancel_rsvp(user, event_one.id).rsvp_count == 0
+    assert event_svc_integration.rsvp(root, event_one.id).rsvp_count == 1
+
+
+def test_cancel_rsvp(event_svc_integration: EventService):
+    """Test that cancelling an RSVP uncounts it, and cancelling without one does nothing."""
+    event_svc_integration.rsvp(user, event_one.id)
+    rsvp = event_svc_integration.cancel_rsvp(user, event_one.id)
+    assert not rsvp.attending
+    assert rsvp.rsvp_count == 0
+    assert event_svc_integration.cancel_rsvp(user, event_one.id).rsvp_count == 0
+
+
+def test_rsvp_not_found(event_svc_integration: EventService):
+    """Test that RSVPs to events which do not exist are refused."""
+    with pytest.raises(ResourceNotFoundException):
+        event_svc_integration.rsvp(user, 404)
+    with pytest.raises(ResourceNotFoundException):
+        event_svc_integration.cancel_rsvp(user, 404)
+    with pytest.raises(ResourceNotFoundException):
+        event_svc_integration.get_rsvp(user, 404)
+
+
+def test_rsvp_concurrently(event_svc_integration: EventService, test_engine: Engine):
+    """Test that concurrent RSVPs do not exceed an event's capacity."""
+    event_svc_integration.update(
+        root, event_one.model_copy(update={"capacity": len(users) - 1})
+    )
+
+    def rsvp(subject):
+        with Session(test_engine) as session:
+            try:
+                EventService(session, PermissionService(session)).rsvp(
+                    subject, event_one.id
+                )
+                return True
+            except EventFullException:
+                return False
+
+    with ThreadPoolExecutor(len(users)) as executor:
+        accepted = list(executor.map(rsvp, users))
+
+    assert accepted.count(True) == len(users) - 1
+    assert event_svc_integration.get_from_id(event_one.id).rsvp_count == len(users) - 1
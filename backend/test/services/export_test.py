@@ -0,0 +1,110 @@
+"""Tests for the ExportService class."""
+
+import csv
+import io
+import json
+import pytest
+from sqlalchemy.orm import Session
+
+# Tested Dependencies
+from ...entities.equipment_checkout_entity import EquipmentCheckoutEntity
+from ...models.export import ExportFormat
+from ...services import PermissionService, UserPermissionException
+from ...services.export import ExportService
+
+# Data Setup and Injected Service Fixtures
+# The order in which these fixtures run is dependent on their imported alias.
+from .core_data import setup_insert_data_fixture as insert_order_0
+from .coworking.operating_hours_data import fake_data_fixture as insert_order_1
+from .coworking.room_data import fake_data_fixture as insert_order_2
+from .coworking.seat_data import fake_data_fixture as insert_order_3
+from .coworking.reservation.reservation_data import fake_data_fixture as insert_order_4
+from .coworking.time import *
+
+# Data Models for Fake Data Inserted in Setup
+from .user_data import root, user, users
+from .coworking.reservation import reservation_data
+from .equipment import user_equipment_data
+
+__authors__ = ["Kris Jordan", "Nicholas Mountain", "Jacob Brown"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+@pytest.fixture(autouse=True)
+def checkout_data_fixture(session: Session):
+    for checkout in user_equipment_data.checkouts:
+        session.add(EquipmentCheckoutEntity.from_model(checkout))
+    session.commit()
+
+
+@pytest.fixture()
+def export_svc(session: Session):
+    svc = ExportService(session, PermissionService(session))
+    svc.CHUNK_ROWS = 2
+    return svc
+
+
+def _csv(chunks) -> list[dict]:
+    return list(csv.DictReader(io.StringIO("".join(chunks))))
+
+
+def test_export_users_csv(export_svc: ExportService):
+    rows = _csv(export_svc.users(root, ExportFormat.CSV))
+    assert [int(row["pid"]) for row in rows] == [u.pid for u in users]
+    assert rows[0]["onyen"] == root.onyen
+
+
+def test_export_users_ndjson(export_svc: ExportService):
+    chunks = "".join(export_svc.users(root, ExportFormat.NDJSON))
+    rows = [json.loads(line) for line in chunks.splitlines()]
+    assert [row["pid"] for row in rows] == [u.pid for u in users]
+
+
+def test_export_streams_in_chunks(export_svc: ExportService):
+    chunks = list(export_svc.users(root, ExportFormat.NDJSON))
+    assert len(chunks) == 2
+    assert chunks[0].count("\n") == 2
+
+
+def test_export_users_enforces_permission(export_svc: ExportService):
+    with pytest.raises(UserPermissionException):
+        export_svc.users(user, ExportFormat.CSV)
+
+
+def test_export_reservations(export_svc: ExportService):
+    rows = _csv(export_svc.reservations(root, ExportFormat.CSV))
+    assert len(rows) == len(reservation_data.reservations)
+    exported = {int(row["id"]): row for row in rows}
+    for reservation in reservation_data.reservations:
+        row = exported[reservation.id]
+        assert row["state"] == reservation.state
+        assert row["start"] == reservation.start.isoformat()
+        onyens = row["users"].split(";") if row["users"] else []
+        assert sorted(onyens) == sorted(u.onyen for u in reservation.users)
+
+
+def test_export_reservations_between(export_svc: ExportService, time):
+    rows = _csv(
+        export_svc.reservations(
+            root, ExportFormat.CSV, start=time[NOW], end=time[TOMORROW]
+        )
+    )
+    expected = [
+        r
+        for r in reservation_data.reservations
+        if time[NOW] <= r.start < time[TOMORROW]
+    ]
+    assert sorted(int(row["id"]) for row in rows) == sorted(r.id for r in expected)
+
+
+def test_export_checkouts(export_svc: ExportService):
+    rows = _csv(export_svc.checkouts(root, ExportFormat.CSV))
+    assert len(rows) == len(user_equipment_data.checkouts)
+
+
+def test_export_active_checkouts(export_svc: ExportService):
+    rows = _csv(export_svc.checkouts(root, ExportFormat.CSV, active_only=True))
+    active = [c for c in user_equipment_data.checkouts if c.is_active]
+    assert len(rows) == len(active)
+    assert all(row["is_active"] == "True" for row in rows)
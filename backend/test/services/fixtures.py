@@ -10,6 +10,7 @@ from ...services import (
     OrganizationService,
     EventService,
 )
+from ...services.roster import RosterService
 
 __authors__ = ["Kris Jordan", "Ajay Gandecha"]
 __copyright__ = "Copyright 2023"
@@ -54,3 +55,9 @@ def organization_svc_integration(session: Session):
 def event_svc_integration(session: Session):
     """This fixture is used to test the EventService class with a real PermissionService."""
     return EventService(session, PermissionService(session))
+
+
+@pytest.fixture()
+def roster_svc_integration(session: Session):
+    """This fixture is used to test the RosterService class with a real PermissionService."""
+    return RosterService(session, PermissionService(session))
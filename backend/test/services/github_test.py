@@ -0,0 +1,189 @@
+"""Tests for the GitHubService, GitHubClient, and GitHubLinkJobs.
+
+A local stand-in for GitHub's OAuth2 and REST APIs is served from a background thread for the
+client to make real HTTP requests against."""
+
+import json
+import time
+import pytest
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from urllib.parse import parse_qs
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+from ...models.github import GitHubLinkJobStatus
+from ...services import UserService, PermissionService
+from ...services.github import GitHubClient, GitHubLinkJobs, GitHubService
+
+# Data Setup and Injected Service Fixtures
+from .core_data import setup_insert_data_fixture
+from .fixtures import user_svc_integration
+
+# Data Models for Fake Data Inserted in Setup
+from .user_data import ambassador, user
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+AVATAR = b"\x89PNG not really a png"
+
+
+class StandInGitHubHandler(BaseHTTPRequestHandler):
+    """Responds to the subset of GitHub's routes used for linking accounts and fetching avatars."""
+
+    requests_received: list[str] = []
+
+    def do_POST(self):
+        StandInGitHubHandler.requests_received.append(self.path)
+        length = int(self.headers["Content-Length"])
+        code = parse_qs(self.rfile.read(length).decode())["code"][0]
+        if code == "good":
+            self._respond(200, json.dumps({"access_token": "gho_token"}).encode())
+        else:
+            self._respond(200, json.dumps({"error": "bad_verification_code"}).encode())
+
+    def do_GET(self):
+        StandInGitHubHandler.requests_received.append(self.path)
+        if self.path == "/user":
+            if self.headers["Authorization"] != "Bearer gho_token":
+                self._respond(401, b"{}")
+                return
+            github_user = {
+                "login": "sallystudent",
+                "id": 1234,
+                "avatar_url": f"http://127.0.0.1:{self.server.server_address[1]}/avatar.png",
+            }
+            self._respond(200, json.dumps(github_user).encode())
+        elif self.path == "/avatar.png":
+            self._respond(200, AVATAR, "image/png")
+        else:
+            self._respond(404, b"{}")
+
+    def _respond(self, status: int, payload: bytes, content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        ...
+
+
+@pytest.fixture(scope="module")
+def github_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInGitHubHandler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture()
+def github_client(github_server: str, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("GITHUB_CLIENT_ID", "client_id")
+    monkeypatch.setenv("GITHUB_CLIENT_SECRET", "client_secret")
+    StandInGitHubHandler.requests_received = []
+    client = GitHubClient(
+        github_server, github_server, read_timeout=timedelta(seconds=1)
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture()
+def github_svc(user_svc_integration: UserService, github_client: GitHubClient):
+    return GitHubService(user_svc_integration, github_client)
+
+
+def test_link_with_user(github_svc: GitHubService, user_svc_integration: UserService):
+    assert github_svc.link_with_user(user.model_copy(), "good", "http://localhost")
+    linked = user_svc_integration.get_by_id(user.id)
+    assert linked is not None
+    assert linked.github == "sallystudent"
+    assert linked.github_id == 1234
+    assert linked.github_avatar.endswith("/avatar.png")
+
+
+def test_link_with_user_bad_code(
+    github_svc: GitHubService, user_svc_integration: UserService
+):
+    assert not github_svc.link_with_user(user.model_copy(), "bad", "http://localhost")
+    assert user_svc_integration.get_by_id(user.id).github == ""
+
+
+def test_link_with_user_unreachable(user_svc_integration: UserService):
+    client = GitHubClient(
+        "http://127.0.0.1:9",
+        "http://127.0.0.1:9",
+        connect_timeout=timedelta(seconds=0.1),
+    )
+    github_svc = GitHubService(user_svc_integration, client)
+    assert not github_svc.link_with_user(user.model_copy(), "good", "http://localhost")
+
+
+def test_get_avatar_fetches_once(github_svc: GitHubService):
+    github_svc.link_with_user(user.model_copy(), "good", "http://localhost")
+    StandInGitHubHandler.requests_received = []
+    avatar = github_svc.get_avatar(user.id)
+    assert avatar is not None
+    assert avatar.content == AVATAR
+    assert avatar.media_type == "image/png"
+    assert github_svc.get_avatar(user.id) == avatar
+    assert StandInGitHubHandler.requests_received == ["/avatar.png"]
+
+
+def test_get_avatar_invalidated_by_unlink(
+    github_svc: GitHubService, user_svc_integration: UserService
+):
+    github_svc.link_with_user(user.model_copy(), "good", "http://localhost")
+    assert github_svc.get_avatar(user.id) is not None
+    github_svc.remove_association(user_svc_integration.get_by_id(user.id))
+    assert github_svc.get_avatar(user.id) is None
+
+
+def test_get_avatar_without_github(github_svc: GitHubService):
+    assert github_svc.get_avatar(ambassador.id) is None
+    assert github_svc.get_avatar(404) is None
+
+
+def _wait_for(jobs: GitHubLinkJobs, subject, job_id: str):
+    for _ in range(100):
+        job = jobs.get(subject, job_id)
+        if job.status != GitHubLinkJobStatus.PENDING:
+            return job
+        time.sleep(0.05)
+    raise TimeoutError("GitHub link job did not complete")
+
+
+def test_link_job(
+    github_client: GitHubClient,
+    test_engine: Engine,
+    user_svc_integration: UserService,
+):
+    jobs = GitHubLinkJobs(github_client, lambda: Session(test_engine))
+    job = jobs.submit(user.model_copy(), "good", "http://localhost")
+    assert job.user_id == user.id
+    assert _wait_for(jobs, user, job.id).status == GitHubLinkJobStatus.SUCCEEDED
+    jobs.shutdown()
+    assert user_svc_integration.get_by_id(user.id).github == "sallystudent"
+
+
+def test_link_job_fails(github_client: GitHubClient, test_engine: Engine):
+    jobs = GitHubLinkJobs(github_client, lambda: Session(test_engine))
+    job = jobs.submit(user.model_copy(), "bad", "http://localhost")
+    assert _wait_for(jobs, user, job.id).status == GitHubLinkJobStatus.FAILED
+    jobs.shutdown()
+
+
+def test_link_job_visible_only_to_owner(
+    github_client: GitHubClient, test_engine: Engine
+):
+    jobs = GitHubLinkJobs(github_client, lambda: Session(test_engine))
+    job = jobs.submit(user.model_copy(), "good", "http://localhost")
+    jobs.shutdown()
+    assert jobs.get(ambassador, job.id) is None
+    assert jobs.get(user, "unknown") is None
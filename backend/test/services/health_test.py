@@ -1,19 +1,43 @@
 """Tests for the HealthService class."""
 
 # Tested Dependencies
+from ...database import _engine_options
+from ...services import PermissionService, UserPermissionException
 from ...services.health import HealthService
 
 # Library Requirements
+import pytest
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 
+# Data Setup and Injected Service Fixtures
+from .core_data import setup_insert_data_fixture
+
+# Data Models for Fake Data Inserted in Setup
+from .user_data import root, user
+
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
 
 def test_health_check(session: Session):
-    health_service = HealthService(session)
+    health_service = HealthService(session, PermissionService(session))
     now = str(datetime.now(tz=timezone.utc))[:16]
     result = health_service.check()
     assert f"OK @ {now}" in health_service.check()
+
+
+def test_pool_status(session: Session):
+    health_service = HealthService(session, PermissionService(session))
+    session.connection()
+    status = health_service.pool_status(root)
+    assert status.checked_out >= 1
+    assert status.checked_in + status.checked_out <= status.size + status.overflow
+    assert status.max_overflow == _engine_options()["max_overflow"]
+
+
+def test_pool_status_requires_permission(session: Session):
+    health_service = HealthService(session, PermissionService(session))
+    with pytest.raises(UserPermissionException):
+        health_service.pool_status(user)
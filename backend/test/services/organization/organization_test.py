@@ -1,15 +1,18 @@
 """Tests for the OrganizationService class."""
 
 # PyTest
+import json
 import pytest
+from datetime import timedelta
 from unittest.mock import create_autospec
 
 from backend.services.organization import OrganizationNotFoundException
 from backend.services.exceptions import UserPermissionException
 
 # Tested Dependencies
-from ....models import Organization
+from ....models import Organization, PaginationParams
 from ....services import OrganizationService
+from ....services.cache import organization_slug_cache
 
 # Injected Service Fixtures
 from ..fixtures import organization_svc_integration
@@ -22,8 +25,11 @@ from .organization_test_data import (
     organizations,
     to_add,
     cads,
+    cssg,
+    appteam,
     new_cads,
 )
+from ..event.event_test_data import event_one, event_two
 from ..user_data import root, user
 
 __authors__ = ["Ajay Gandecha"]
@@ -43,6 +49,50 @@ def test_get_all(organization_svc_integration: OrganizationService):
     assert isinstance(fetched_organizations[0], Organization)
 
 
+# Test `OrganizationService.summaries()` and `OrganizationService.directory()`
+
+
+def test_summaries(organization_svc_integration: OrganizationService):
+    """Test that organization summaries leave out long descriptions and are ordered by name."""
+    summaries = organization_svc_integration.summaries()
+    assert [summary.name for summary in summaries] == sorted(
+        organization.name for organization in organizations
+    )
+    assert not hasattr(summaries[0], "long_description")
+
+
+def test_directory_is_cached(organization_svc_integration: OrganizationService):
+    """Test that the directory is served from the cache while organizations are unchanged."""
+    directory = organization_svc_integration.directory()
+    assert json.loads(directory.content) == [
+        summary.model_dump() for summary in organization_svc_integration.summaries()
+    ]
+    organization_svc_integration._session = None
+    assert organization_svc_integration.directory() is directory
+
+
+def test_directory_invalidated_by_update(
+    organization_svc_integration: OrganizationService,
+):
+    """Test that updating an organization changes the directory and its ETag."""
+    directory = organization_svc_integration.directory()
+    organization_svc_integration.update(root, new_cads)
+    updated = organization_svc_integration.directory()
+    assert updated.etag != directory.etag
+    assert new_cads.short_description.encode() in updated.content
+
+
+def test_directory_invalidated_by_create_and_delete(
+    organization_svc_integration: OrganizationService,
+):
+    """Test that creating and deleting organizations changes the directory."""
+    directory = organization_svc_integration.directory()
+    organization_svc_integration.create(root, to_add)
+    assert to_add.slug.encode() in organization_svc_integration.directory().content
+    organization_svc_integration.delete(root, to_add.slug)
+    assert organization_svc_integration.directory().etag == directory.etag
+
+
 # Test `OrganizationService.get_from_id()`
 
 
@@ -54,6 +104,66 @@ def test_get_from_slug(organization_svc_integration: OrganizationService):
     assert fetched_organization.slug == cads.slug
 
 
+def test_get_from_slug_pages_upcoming_events(
+    organization_svc_integration: OrganizationService,
+):
+    """Test that an organization's page includes a page of its upcoming events."""
+    page = organization_svc_integration.get_from_slug(cssg.slug, limit=1)
+    assert page.events == [event_one]
+    assert page.past_events_cursor == ""
+
+    rest = organization_svc_integration.get_events(cssg.slug, page.events_cursor)
+    assert rest.events == [event_two]
+    assert rest.next_cursor == ""
+
+
+def test_get_from_slug_without_events(
+    organization_svc_integration: OrganizationService,
+):
+    """Test that the page of an organization without events has no cursors."""
+    page = organization_svc_integration.get_from_slug(cads.slug)
+    assert page.events == []
+    assert page.events_cursor == ""
+    assert page.past_events_cursor == ""
+
+
+def test_get_events_past(organization_svc_integration: OrganizationService):
+    """Test that an organization's past events are paged most recent first."""
+    page = organization_svc_integration.get_from_slug(
+        cssg.slug, now=event_two.time + timedelta(hours=1)
+    )
+    assert page.events == []
+    assert page.events_cursor == ""
+
+    past = organization_svc_integration.get_events(
+        cssg.slug, page.past_events_cursor, past=True, limit=1
+    )
+    assert past.events == [event_two]
+    past = organization_svc_integration.get_events(
+        cssg.slug, past.next_cursor, past=True, limit=1
+    )
+    assert past.events == [event_one]
+    assert past.next_cursor == ""
+
+
+def test_get_events_invalid(organization_svc_integration: OrganizationService):
+    """Test that events cannot be paged with a malformed cursor or unknown organization."""
+    with pytest.raises(ValueError):
+        organization_svc_integration.get_events(cssg.slug, "not a cursor")
+    with pytest.raises(OrganizationNotFoundException):
+        organization_svc_integration.get_events("zebra", "")
+
+
+def test_get_from_slug_caches_id(organization_svc_integration: OrganizationService):
+    """Test that organization IDs are cached by slug, and stale IDs are looked up again."""
+    organization_svc_integration.get_from_slug(cssg.slug)
+    assert organization_slug_cache.get(cssg.slug) == cssg.id
+
+    organization_slug_cache.set(cssg.slug, cads.id)
+    assert organization_svc_integration.get_from_slug(cssg.slug).id == cssg.id
+    assert organization_slug_cache.get(cssg.slug) == cssg.id
+
+
 # Test `OrganizationService.create()`
 
 
@@ -132,3 +242,41 @@ def test_delete_organization_as_user(organization_svc_integration: OrganizationS
     """Test that any user is *unable* to delete organizations."""
     with pytest.raises(UserPermissionException):
         organization_svc_integration.delete(user, cads.slug)
+
+
+# Test `OrganizationService.search()`
+
+
+def test_search(organization_svc_integration: OrganizationService):
+    """Test that organizations are searched by their names and short descriptions."""
+    results = organization_svc_integration.search(
+        PaginationParams(filter="development team")
+    )
+    assert results.length == 1
+    assert results.items[0].organization == appteam
+    assert "<mark>development</mark>" in results.items[0].headline
+
+
+def test_search_ranks_names_first(organization_svc_integration: OrganizationService):
+    """Test that organizations matching a search by name rank above those matching by description."""
+    results = organization_svc_integration.search(PaginationParams(filter="apps"))
+    assert [result.organization for result in results.items] == [appteam, cssg]
+    assert results.items[0].rank > results.items[1].rank
+
+
+def test_search_pages(organization_svc_integration: OrganizationService):
+    """Test that search results are paginated."""
+    results = organization_svc_integration.search(
+        PaginationParams(filter="apps", page=1, page_size=1)
+    )
+    assert results.length == 2
+    assert [result.organization for result in results.items] == [cssg]
+
+
+def test_search_no_matches(organization_svc_integration: OrganizationService):
+    """Test that a search matching no organizations, or with no words, finds nothing."""
+    assert (
+        organization_svc_integration.search(PaginationParams(filter="zebra")).items
+        == []
+    )
+    assert organization_svc_integration.search(PaginationParams(filter="")).length == 0
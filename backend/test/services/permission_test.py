@@ -5,6 +5,7 @@ import pytest
 # Tested Dependencies
 from ...models import Permission, User
 from ...services import PermissionService
+from ...services.cache import registered_user_cache
 
 # Data Setup and Injected Service Fixtures
 from .core_data import setup_insert_data_fixture
@@ -42,6 +43,28 @@ def test_grant_user_permission(permission_svc: PermissionService):
     assert permission_svc.check(ambassador, "checkin.delete", "checkin")
 
 
+def test_grant_user_permission_invalidates_registered_user(
+    permission_svc: PermissionService,
+):
+    """Tests that granting a user a permission evicts their cached authenticated details"""
+    registered_user_cache.set(ambassador.pid, ambassador)
+    registered_user_cache.set(user.pid, user)
+    p = Permission(action="checkin.delete", resource="*")
+    permission_svc.grant(root, ambassador, p)
+    assert registered_user_cache.get(ambassador.pid) is None
+    assert registered_user_cache.get(user.pid) is not None
+
+
+def test_grant_role_permission_invalidates_registered_users(
+    permission_svc: PermissionService,
+):
+    """Tests that granting a role a permission evicts all cached authenticated users"""
+    registered_user_cache.set(ambassador.pid, ambassador)
+    p = Permission(action="checkin.delete", resource="*")
+    permission_svc.grant(root, ambassador_role, p)
+    assert registered_user_cache.get(ambassador.pid) is None
+
+
 def test_grant_none_exception(permission_svc: PermissionService):
     """Tests that a ValueError is raised if attempting to grant to an improper object"""
     with pytest.raises(ValueError):
@@ -3,6 +3,7 @@
 # Tested Dependencies
 from ...models import Permission, Role
 from ...services import RoleService, PermissionService
+from ...services.cache import registered_user_cache
 
 # Data Setup and Injected Service Fixtures
 from .core_data import setup_insert_data_fixture
@@ -108,6 +109,12 @@ def test_add_member(role_svc: RoleService):
     assert role_svc.is_member(root, ambassador_role.id, user.id)
 
 
+def test_add_member_invalidates_registered_user(role_svc: RoleService):
+    registered_user_cache.set(user.pid, user)
+    role_svc.add_member(root, ambassador_role.id, user)
+    assert registered_user_cache.get(user.pid) is None
+
+
 def test_remove_member(role_svc: RoleService):
     assert role_svc.is_member(root, ambassador_role.id, ambassador.id)
     role_svc.remove_member(root, ambassador_role.id, ambassador.id)
@@ -0,0 +1,124 @@
+"""Tests for the RosterService class."""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+# Tested Dependencies
+from ...entities import UserEntity
+from ...models.roster import RosterFormat
+from ...services import UserPermissionException
+from ...services.roster import RosterService
+from ...services.cache import registered_user_cache
+
+# Data Setup and Injected Service Fixtures
+from .core_data import setup_insert_data_fixture
+from .fixtures import roster_svc_integration
+
+# Data Models for Fake Data Inserted in Setup
+from .role_data import ambassador_role
+from .user_data import root, ambassador, user
+
+__authors__ = ["Kris Jordan", "Ajay Gandecha"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+CSV_ROSTER = """pid,onyen,email,first_name,last_name,pronouns,roles
+123456789,newbie,newbie@unc.edu,New,Student,,ambassadors
+111111111,user,user@unc.edu,Sally,Studious,She / They,ambassadors;root
+"""
+
+
+def _user(session: Session, pid: int) -> UserEntity:
+    return session.scalar(select(UserEntity).where(UserEntity.pid == pid))
+
+
+def test_import_csv(roster_svc_integration: RosterService, session: Session):
+    """Test that a CSV roster creates new users, updates existing users, and adds memberships."""
+    result = roster_svc_integration.import_roster(root, CSV_ROSTER, RosterFormat.CSV)
+    assert result.created == 1
+    assert result.updated == 1
+    assert result.memberships_added == 3
+    assert result.errors == []
+
+    newbie = _user(session, 123456789)
+    assert newbie.onyen == "newbie"
+    assert newbie.pronouns == ""
+    assert [role.name for role in newbie.roles] == ["ambassadors"]
+
+    updated = _user(session, user.pid)
+    assert updated.id == user.id
+    assert updated.last_name == "Studious"
+    assert sorted(role.name for role in updated.roles) == ["ambassadors", "root"]
+
+
+def test_import_ndjson(roster_svc_integration: RosterService, session: Session):
+    """Test that an NDJSON roster is imported."""
+    roster = '{"pid": 123456789, "onyen": "newbie", "email": "newbie@unc.edu", "roles": ["ambassadors"]}\n'
+    result = roster_svc_integration.import_roster(root, roster, RosterFormat.NDJSON)
+    assert result.created == 1
+    assert [role.name for role in _user(session, 123456789).roles] == ["ambassadors"]
+
+
+def test_import_existing_membership(roster_svc_integration: RosterService):
+    """Test that memberships a user already has are not added again."""
+    roster = f"pid,onyen,email,roles\n{ambassador.pid},{ambassador.onyen},{ambassador.email},ambassadors\n"
+    result = roster_svc_integration.import_roster(root, roster, RosterFormat.CSV)
+    assert result.updated == 1
+    assert result.memberships_added == 0
+
+
+def test_import_reports_row_errors(
+    roster_svc_integration: RosterService, session: Session
+):
+    """Test that invalid rows are reported and skipped while valid rows are imported."""
+    roster = "\n".join(
+        [
+            "pid,onyen,email,roles",
+            "123456789,newbie,newbie@unc.edu,",
+            "123456789,again,again@unc.edu,",
+            f"222222222,{ambassador.onyen},other@unc.edu,",
+            "333333333,third,third@unc.edu,nonexistent",
+            "notapid,fourth,fourth@unc.edu,",
+        ]
+    )
+    result = roster_svc_integration.import_roster(root, roster, RosterFormat.CSV)
+    assert result.created == 1
+    assert [error.row for error in result.errors] == [2, 3, 4, 5]
+    assert "Duplicate pid" in result.errors[0].message
+    assert "belongs to another user" in result.errors[1].message
+    assert "Unknown role" in result.errors[2].message
+    assert result.errors[3].pid is None
+    assert _user(session, 222222222) is None
+
+
+def test_import_invalid_json(roster_svc_integration: RosterService):
+    """Test that malformed NDJSON lines are reported."""
+    result = roster_svc_integration.import_roster(root, "{nope\n", RosterFormat.NDJSON)
+    assert result.created == 0
+    assert result.errors[0].row == 1
+
+
+def test_import_in_batches(roster_svc_integration: RosterService, session: Session):
+    """Test that rosters larger than a batch are fully imported."""
+    roster = "pid,onyen,email\n" + "\n".join(
+        f"{200000000 + i},onyen{i},onyen{i}@unc.edu" for i in range(25)
+    )
+    result = roster_svc_integration.import_roster(
+        root, roster, RosterFormat.CSV, batch_size=10
+    )
+    assert result.created == 25
+    assert _user(session, 200000024).onyen == "onyen24"
+
+
+def test_import_invalidates_registered_users(roster_svc_integration: RosterService):
+    """Test that cached authenticated users are invalidated by an import."""
+    registered_user_cache.set(user.pid, user)
+    roster_svc_integration.import_roster(root, CSV_ROSTER, RosterFormat.CSV)
+    assert registered_user_cache.get(user.pid) is None
+
+
+def test_import_enforces_permission(roster_svc_integration: RosterService):
+    """Test that importing requires permission to create users."""
+    with pytest.raises(UserPermissionException):
+        roster_svc_integration.import_roster(user, CSV_ROSTER, RosterFormat.CSV)
@@ -0,0 +1,82 @@
+"""Tests for the SnapshotService class and the static file middleware serving snapshots."""
+
+import gzip
+import json
+from pathlib import Path
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+# Tested Dependencies
+from ...api.static_files import StaticFileMiddleware
+from ...services.snapshot import SnapshotBuilder, SnapshotService, read_manifest
+
+# Data Setup
+from .core_data import setup_insert_data_fixture
+
+# Data Models for Fake Data Inserted in Setup
+from .organization.organization_test_data import organizations
+from .event.event_test_data import events
+
+__authors__ = ["Ajay Gandecha", "Jade Keegan", "Brianna Ta", "Audrey Toney"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+def test_build(session: Session, tmp_path: Path):
+    """Tests that snapshots and gzipped copies are written and listed in the manifest"""
+    manifest = SnapshotService(session, tmp_path).build()
+
+    assert read_manifest(tmp_path) == manifest
+    organizations_path = tmp_path / manifest.organizations.lstrip("/")
+    assert len(json.loads(organizations_path.read_bytes())) == len(organizations)
+    events_path = tmp_path / manifest.events.lstrip("/")
+    events_gzipped = events_path.with_name(f"{events_path.name}.gz").read_bytes()
+    assert len(json.loads(gzip.decompress(events_gzipped))["events"]) == len(events)
+
+
+def test_build_versions_by_content(session: Session, tmp_path: Path):
+    """Tests that unchanged data keeps its version, and only the latest versions are kept"""
+    service = SnapshotService(session, tmp_path)
+    manifest = service.build()
+    assert service.build().organizations == manifest.organizations
+
+    for name in ["a", "b", "c"]:
+        service._write("organizations", name.encode())
+    service._prune("organizations")
+    assert len(list((tmp_path / "snapshots").glob("organizations.*.json"))) == 2
+    assert len(list((tmp_path / "snapshots").glob("organizations.*.json.gz"))) == 2
+
+
+def test_read_manifest_before_build(tmp_path: Path):
+    """Tests that there is no manifest before snapshots are built"""
+    assert read_manifest(tmp_path) is None
+
+
+def test_builder(test_engine: Engine, tmp_path: Path):
+    """Tests that the builder builds snapshots in its own session"""
+    builder = SnapshotBuilder(lambda: Session(test_engine), tmp_path)
+    assert builder.build() == builder.manifest()
+
+
+def test_serve_snapshot(session: Session, tmp_path: Path):
+    """Tests that snapshots are served gzipped, to clients accepting gzip, and immutable"""
+    (tmp_path / "index.html").write_text("<html></html>")
+    manifest = SnapshotService(session, tmp_path).build()
+    app = FastAPI()
+    app.mount("/", StaticFileMiddleware(directory=tmp_path))
+    client = TestClient(app)
+
+    response = client.get(manifest.events)
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"] == "application/json"
+    assert "immutable" in response.headers["cache-control"]
+    assert len(response.json()["events"]) == len(events)
+
+    response = client.get(manifest.events, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert len(response.json()["events"]) == len(events)
+
+    response = client.get("/snapshots/manifest.json")
+    assert "cache-control" not in response.headers
@@ -1,9 +1,13 @@
 """Tests for the UserService class."""
 
+import pytest
+from sqlalchemy import text
+
 # Tested Dependencies
 from ...models.user import User, NewUser
 from ...models.pagination import PaginationParams
 from ...services import UserService, PermissionService
+from ...services.cache import registered_user_cache
 
 # Data Setup and Injected Service Fixtures
 from .core_data import setup_insert_data_fixture
@@ -41,6 +45,18 @@ def test_get_nonexistent(user_svc_integration: UserService):
     assert user_svc_integration.get(423) is None
 
 
+def test_get_identity(user_svc: UserService, permission_svc_mock: PermissionService):
+    """Test that a user can be retrieved by PID without loading permissions."""
+    user = user_svc.get_identity(ambassador.pid)
+    assert user == ambassador
+    permission_svc_mock.get_permissions.assert_not_called()
+
+
+def test_get_identity_nonexistent(user_svc: UserService):
+    """Test that a nonexistent PID returns None."""
+    assert user_svc.get_identity(423) is None
+
+
 def test_search_by_first_name(user_svc: UserService):
     """Test that a user can be retrieved by Searching for their first name."""
     users = user_svc.search(ambassador, "amy")
@@ -93,6 +109,46 @@ def test_search_no_match(user_svc: UserService):
     assert len(users) == 0
 
 
+def test_search_by_pid(user_svc: UserService):
+    """Test that a user can be retrieved by Searching for their exact PID."""
+    users = user_svc.search(ambassador, str(user.pid))
+    assert [found.id for found in users] == [user.id]
+
+
+def test_search_multiple_terms(user_svc: UserService):
+    """Test that every term of a search must match one of a user's fields."""
+    assert [found.id for found in user_svc.search(ambassador, "sally stu")] == [user.id]
+    assert user_svc.search(ambassador, "amy stu") == []
+
+
+def test_search_ranks_prefix_matches_first(user_svc: UserService):
+    """Test that users with a field beginning with the query rank before substring matches."""
+    users = user_svc.search(ambassador, "st")
+    assert [found.id for found in users] == [user.id, ambassador.id]
+
+
+def test_search_ranks_exact_onyen_first(user_svc: UserService):
+    """Test that a user whose onyen exactly matches the query ranks first."""
+    user_svc.create(
+        root,
+        User(
+            pid=123456789,
+            onyen="aardv",
+            email="aardv@unc.edu",
+            first_name="User",
+            last_name="Aardvark",
+        ),
+    )
+    users = user_svc.search(ambassador, "user")
+    assert [found.onyen for found in users] == ["user", "aardv"]
+
+
+def test_search_escapes_wildcards(user_svc: UserService):
+    """Test that LIKE wildcards in a query are matched literally."""
+    assert user_svc.search(ambassador, "%") == []
+    assert user_svc.search(ambassador, "_") == []
+
+
 def test_list(user_svc: UserService):
     """Test that a paginated list of users can be produced."""
     pagination_params = PaginationParams(page=0, page_size=2, order_by="id", filter="")
@@ -140,6 +196,66 @@ def test_list_filter(user_svc: UserService):
     assert users.items[0].id == ambassador.id
 
 
+def test_list_filter_by_email(user_svc: UserService):
+    """Test that users are filtered by search criteria matching their email."""
+    pagination_params = PaginationParams(
+        page=0, page_size=3, order_by="", filter="amam"
+    )
+    users = user_svc.list(ambassador, pagination_params)
+    assert users.length == 1
+    assert users.items[0].id == ambassador.id
+
+
+def test_list_next_cursor(user_svc: UserService):
+    """Test that the next page of users can be produced from the previous page's cursor."""
+    pagination_params = PaginationParams(page_size=2, order_by="last_name")
+    first = user_svc.list(ambassador, pagination_params)
+    assert [found.id for found in first.items] == [ambassador.id, root.id]
+    assert first.next_cursor != ""
+
+    pagination_params = PaginationParams(
+        page=1, page_size=2, order_by="last_name", cursor=first.next_cursor
+    )
+    second = user_svc.list(ambassador, pagination_params)
+    assert [found.id for found in second.items] == [user.id]
+    assert second.next_cursor == ""
+    assert second.length == len(user_data.users)
+
+
+def test_list_order_by_not_sortable(user_svc: UserService):
+    """Test that users cannot be ordered by columns which are not sortable."""
+    pagination_params = PaginationParams(order_by="pronouns")
+    with pytest.raises(ValueError):
+        user_svc.list(ambassador, pagination_params)
+
+
+def test_list_malformed_cursor(user_svc: UserService):
+    """Test that a malformed cursor is rejected."""
+    pagination_params = PaginationParams(order_by="id", cursor="not a cursor")
+    with pytest.raises(ValueError):
+        user_svc.list(ambassador, pagination_params)
+
+
+def test_list_estimate_length_with_filter_is_cached(user_svc: UserService):
+    """Test that estimated lengths of filtered lists are cached until users are created."""
+    pagination_params = PaginationParams(order_by="id", filter="unc.edu")
+    assert user_svc.list(ambassador, pagination_params, True).length == 3
+    user_svc.create(
+        root,
+        User(pid=123456789, onyen="new", email="new@unc.edu", first_name="N"),
+    )
+    assert user_svc.list(ambassador, pagination_params, True).length == 4
+
+
+def test_list_estimate_length_without_filter(user_svc: UserService):
+    """Test that the unfiltered length is estimated from table statistics once analyzed."""
+    pagination_params = PaginationParams(order_by="id")
+    user_svc._session.execute(text('ANALYZE "user"'))
+    assert user_svc.list(ambassador, pagination_params, True).length == len(
+        user_data.users
+    )
+
+
 def test_list_enforces_permission(
     user_svc: UserService, permission_svc_mock: PermissionService
 ):
@@ -205,6 +321,18 @@ def test_update_user_as_user(
     assert updated_user.last_name == "Ambassy"
 
 
+def test_update_user_invalidates_registered_user_cache(
+    user_svc: UserService, permission_svc_mock: PermissionService
+):
+    """Test that updating a user evicts their cached authenticated details."""
+    permission_svc_mock.get_permissions.return_value = []
+    user = user_svc.get(ambassador.pid)
+    assert user is not None
+    registered_user_cache.set(ambassador.pid, user)
+    user_svc.update(ambassador, user)
+    assert registered_user_cache.get(ambassador.pid) is None
+
+
 def test_update_user_as_root(
     user_svc: UserService, permission_svc_mock: PermissionService
 ):
@@ -55,6 +55,12 @@ export class AdminUsersListComponent {
 
   handlePageEvent(e: PageEvent) {
     let paginationParams = this.page.params;
+    // Continue from the end of the current page when moving to the next page
+    paginationParams.cursor =
+      e.pageIndex === paginationParams.page + 1 &&
+      e.pageSize === paginationParams.page_size
+        ? this.page.next_cursor
+        : '';
     paginationParams.page = e.pageIndex;
     paginationParams.page_size = e.pageSize;
     this.userAdminService
@@ -12,7 +12,9 @@ export class UserAdminService {
       page: params.page.toString(),
       page_size: params.page_size.toString(),
       order_by: params.order_by,
-      filter: params.filter
+      filter: params.filter,
+      cursor: params.cursor ?? '',
+      estimate_length: 'true'
     };
     let query = new URLSearchParams(paramStrings);
     return this.http.get<Paginated<Profile>>(
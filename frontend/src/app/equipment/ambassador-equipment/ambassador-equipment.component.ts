@@ -4,13 +4,17 @@ import { permissionGuard } from 'src/app/permission.guard';
 import { profileResolver } from 'src/app/profile/profile.resolver';
 import { EquipmentService } from '../equipment.service';
 import { CheckoutRequestModel } from '../checkoutRequest.model';
-import { Observable, map, reduce, tap, timer } from 'rxjs';
+import { Observable, of, tap, timer } from 'rxjs';
 import { StagedCheckoutRequestModel } from '../staged-checkout-request.model';
 import { StageCard } from '../widgets/staged-checkout-request-card/staged-checkout-request-card.widget';
 import { CheckoutRequestCard } from '../widgets/checkout-request-card/checkout-request-card.widget';
 import { EquipmentCheckoutCard } from '../widgets/equipment-checkout-card/equipment-checkout-card.widget';
 import { EquipmentCheckoutConfirmationComponent } from '../equipment-checkout-confirmation/equipment-checkout-confirmation.component';
 import { EquipmentCheckoutModel } from '../equipment-checkout.model';
+import {
+  EquipmentChanges,
+  EquipmentRequestKey
+} from '../equipment-changes.model';
 import { MatSnackBar } from '@angular/material/snack-bar';
 
 @Component({
@@ -28,13 +32,19 @@ export class AmbassadorEquipmentComponent implements OnInit {
     resolve: { profile: profileResolver }
   };
 
-  checkoutRequests$: Observable<CheckoutRequestModel[]>;
+  checkoutRequests$: Observable<CheckoutRequestModel[]> = of([]);
   checkoutRequestsLength: number = 0;
-  stagedCheckoutRequests$: Observable<StagedCheckoutRequestModel[]>;
+  stagedCheckoutRequests$: Observable<StagedCheckoutRequestModel[]> = of([]);
   stagedCheckoutRequestsLength: number = 0;
-  equipmentCheckouts$: Observable<EquipmentCheckoutModel[]>;
+  equipmentCheckouts$: Observable<EquipmentCheckoutModel[]> = of([]);
   checkoutsLength: number = 0;
 
+  /** Cursor of the latest changes applied to the tables, empty until the first snapshot */
+  private changesCursor: string = '';
+  private checkoutRequests: CheckoutRequestModel[] = [];
+  private stagedCheckoutRequests: StagedCheckoutRequestModel[] = [];
+  private equipmentCheckouts: EquipmentCheckoutModel[] = [];
+
   @ViewChild(StageCard) stageTable: StageCard | undefined;
   @ViewChild(CheckoutRequestCard) requestTable: CheckoutRequestCard | undefined;
   @ViewChild(EquipmentCheckoutCard) checkoutTable:
@@ -45,46 +55,84 @@ export class AmbassadorEquipmentComponent implements OnInit {
     public router: Router,
     private equipmentService: EquipmentService,
     protected snackBar: MatSnackBar
-  ) {
-    this.checkoutRequests$ = equipmentService.getAllRequest();
-    this.setCheckoutRequestsLength();
-    this.stagedCheckoutRequests$ = equipmentService.getAllStagedCheckouts();
-    this.setStagedCheckoutLength();
-    this.equipmentCheckouts$ = equipmentService.get_all_active_checkouts();
-    this.setCheckoutsLength();
-  }
+  ) {}
 
-  // Update checkoutRequestsTable every 5 seconds
+  // Poll for changes to the tables every 5 seconds
   ngOnInit(): void {
     timer(0, 5000)
       .pipe(
         tap(() => {
-          this.updateCheckoutRequestsTable();
+          this.pollChanges();
         })
       )
       .subscribe();
   }
 
+  // Fetches the changes to the tables since the last poll and applies them
+  pollChanges() {
+    this.equipmentService
+      .getChanges(this.changesCursor)
+      .subscribe((changes) => this.applyChanges(changes));
+  }
+
+  // Applies deletions and then insertions or replacements to each table
+  applyChanges(changes: EquipmentChanges) {
+    if (changes.reset) {
+      this.checkoutRequests = [];
+      this.stagedCheckoutRequests = [];
+      this.equipmentCheckouts = [];
+    }
+    const sameRequest = (a: EquipmentRequestKey) => (b: EquipmentRequestKey) =>
+      a.pid === b.pid && a.model === b.model;
+
+    this.checkoutRequests = this.checkoutRequests
+      .filter(
+        (request) =>
+          !changes.deleted_requests.some(sameRequest(request)) &&
+          !changes.requests.some(sameRequest(request))
+      )
+      .concat(changes.requests);
+    this.stagedCheckoutRequests = this.stagedCheckoutRequests
+      .filter(
+        (request) =>
+          !changes.deleted_staged_requests.some(sameRequest(request)) &&
+          !changes.staged_requests.some(sameRequest(request))
+      )
+      .concat(changes.staged_requests);
+    this.equipmentCheckouts = this.equipmentCheckouts
+      .filter(
+        (checkout) =>
+          !changes.checkouts.some(
+            (changed) => changed.equipment_id === checkout.equipment_id
+          )
+      )
+      .concat(changes.checkouts.filter((checkout) => checkout.is_active));
+    this.changesCursor = changes.cursor;
+
+    this.checkoutRequests$ = of(this.checkoutRequests);
+    this.checkoutRequestsLength = this.checkoutRequests.length;
+    this.requestTable?.refreshTable();
+    this.stagedCheckoutRequests$ = of(this.stagedCheckoutRequests);
+    this.stagedCheckoutRequestsLength = this.stagedCheckoutRequests.length;
+    this.stageTable?.refreshTable();
+    this.equipmentCheckouts$ = of(this.equipmentCheckouts);
+    this.checkoutsLength = this.equipmentCheckouts.length;
+    this.checkoutTable?.refreshTable();
+  }
+
   // Updates the checkoutRequestTable
   updateCheckoutRequestsTable() {
-    this.checkoutRequests$ = this.equipmentService.getAllRequest();
-    this.setCheckoutRequestsLength();
-    this.requestTable?.refreshTable();
+    this.pollChanges();
   }
 
   // Updates the StagedCheckouts table
   updateStagedCheckoutTable() {
-    this.stagedCheckoutRequests$ =
-      this.equipmentService.getAllStagedCheckouts();
-    this.setStagedCheckoutLength();
-    this.stageTable?.refreshTable();
+    this.pollChanges();
   }
 
   // Updates the activeCheckouts table
   updateCheckoutTable() {
-    this.equipmentCheckouts$ = this.equipmentService.get_all_active_checkouts();
-    this.setCheckoutsLength();
-    this.checkoutTable?.refreshTable();
+    this.pollChanges();
   }
 
   approveRequest(request: CheckoutRequestModel) {
@@ -148,26 +196,6 @@ export class AmbassadorEquipmentComponent implements OnInit {
     );
   }
 
-  // Gets the length of the observable array of checkout request models.
-  setCheckoutRequestsLength() {
-    this.checkoutRequests$.subscribe((array) => {
-      this.checkoutRequestsLength = array.length;
-    });
-  }
-
-  // Gets the length of the observable array of staged checkout request models
-  setStagedCheckoutLength() {
-    this.stagedCheckoutRequests$.subscribe((array) => {
-      this.stagedCheckoutRequestsLength = array.length;
-    });
-  }
-  // Gets the length of the observable array of checkout models
-  setCheckoutsLength() {
-    this.equipmentCheckouts$.subscribe((array) => {
-      this.checkoutsLength = array.length;
-    });
-  }
-
   // Returns a piece of equipment by calling service method and rerendering if successful
   returnEquipment(checkout: EquipmentCheckoutModel) {
     // Calls proper API route to return an equipment checkout
@@ -0,0 +1,23 @@
+/**
+ * The Equipment Changes Model defines the shape of changes to the ambassador equipment queue
+ * since a cursor, retrieved from the Equipment Service and API.
+ */
+
+import { CheckoutRequestModel } from './checkoutRequest.model';
+import { EquipmentCheckoutModel } from './equipment-checkout.model';
+import { StagedCheckoutRequestModel } from './staged-checkout-request.model';
+
+export interface EquipmentRequestKey {
+  pid: Number;
+  model: String;
+}
+
+export interface EquipmentChanges {
+  requests: CheckoutRequestModel[];
+  staged_requests: StagedCheckoutRequestModel[];
+  checkouts: EquipmentCheckoutModel[];
+  deleted_requests: EquipmentRequestKey[];
+  deleted_staged_requests: EquipmentRequestKey[];
+  reset: boolean;
+  cursor: string;
+}
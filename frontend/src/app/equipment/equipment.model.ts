@@ -11,3 +11,9 @@ export interface Equipment {
   condition: number;
   is_checked_out: boolean;
 }
+
+/** The fields of an available Equipment item an ambassador chooses it by. */
+export type AvailableEquipment = Pick<
+  Equipment,
+  'equipment_id' | 'model' | 'condition'
+>;
@@ -1,12 +1,13 @@
 import { Injectable } from '@angular/core';
 import { HttpClient, HttpHeaders } from '@angular/common/http';
 import { Observable, Subscription, map } from 'rxjs';
-import { Equipment } from './equipment.model';
+import { AvailableEquipment } from './equipment.model';
 import { EquipmentType } from './equipmentType.model';
 import { Profile, ProfileService } from '../profile/profile.service';
 import { CheckoutRequestModel } from './checkoutRequest.model';
 import { EquipmentCheckoutModel } from './equipment-checkout.model';
 import { StagedCheckoutRequestModel } from './staged-checkout-request.model';
+import { EquipmentChanges } from './equipment-changes.model';
 @Injectable({
   providedIn: 'root'
 })
@@ -89,15 +90,8 @@ export class EquipmentService {
    * @returns {StagedCheckoutRequestModel}
    */
   approveRequest(request: CheckoutRequestModel) {
+    // The backend fills in the ids of the available equipment of the request's model.
     let id_choices: Number[] = [];
-    let equipment_list = this.getAllEquipmentByModel(request.model);
-    equipment_list.subscribe({
-      next(equipment_arr) {
-        equipment_arr.forEach((item) => {
-          id_choices?.push(item.equipment_id);
-        });
-      }
-    });
     let user_name = request.user_name;
     let model = request.model;
     let pid = request.pid;
@@ -118,10 +112,10 @@ export class EquipmentService {
   /**
    * Retrieve all Equipment of a specific model type that is not currently checkout out
    * @param model of the equipment to be retrieved
-   * @returns {Observable<Equipment[]>}
+   * @returns {Observable<AvailableEquipment[]>} only the id, model, and condition of each item
    */
-  getAllEquipmentByModel(model: String): Observable<Equipment[]> {
-    return this.http.get<Equipment[]>(
+  getAllEquipmentByModel(model: String): Observable<AvailableEquipment[]> {
+    return this.http.get<AvailableEquipment[]>(
       `/api/equipment/get_equipment_for_request/${model}`
     );
   }
@@ -180,6 +174,25 @@ export class EquipmentService {
       );
   }
 
+  /**
+   * Get changes to checkout requests, staged requests, and active checkouts since a cursor
+   * @param since: cursor of the previous changes, or empty for a snapshot of everything
+   * @returns {Observable<EquipmentChanges>}
+   */
+  getChanges(since: string): Observable<EquipmentChanges> {
+    return this.http
+      .get<EquipmentChanges>('/api/equipment/changes', { params: { since } })
+      .pipe(
+        // Maps the end_at date retrieved from backend to be a new date object for each checkout
+        map((changes) => {
+          changes.checkouts.forEach((checkout) => {
+            checkout.end_at = new Date(checkout.end_at);
+          });
+          return changes;
+        })
+      );
+  }
+
   /**
    * Create new equipmentCheckout model and post to backend
    * @param stagedCheckoutRequestModel: staged checkout to be added to backend
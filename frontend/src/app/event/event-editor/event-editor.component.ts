@@ -58,6 +58,7 @@ export class EventEditorComponent {
     Validators.maxLength(2000)
   ]);
   public = new FormControl('', [Validators.required]);
+  capacity = new FormControl<number | null>(null, [Validators.min(0)]);
 
   /** Create a form group */
   public eventForm = this.formBuilder.group({
@@ -65,7 +66,8 @@ export class EventEditorComponent {
     time: new Date(this.time.value!),
     location: this.location,
     description: this.description,
-    public: this.public.value! == 'true'
+    public: this.public.value! == 'true',
+    capacity: this.capacity
   });
 
   constructor(
@@ -99,7 +101,8 @@ export class EventEditorComponent {
       time: this.event.time,
       location: this.event.location,
       description: this.event.description,
-      public: this.event.public
+      public: this.event.public,
+      capacity: this.event.capacity
     });
 
     /** Set permission value */
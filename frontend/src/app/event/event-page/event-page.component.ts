@@ -16,6 +16,7 @@ import { Event } from '../event.model';
 import { DatePipe } from '@angular/common';
 import { EventFilterPipe } from '../event-filter/event-filter.pipe';
 import { EventService } from '../event.service';
+import { Subject, debounceTime, of, switchMap } from 'rxjs';
 
 @Component({
   selector: 'app-event-page',
@@ -50,6 +51,9 @@ export class EventPageComponent implements OnInit {
   /** Stores the width of the window. */
   public innerWidth: any;
 
+  /** Stream of search bar queries, which are searched for once typing pauses */
+  private searchBarQueries = new Subject<string>();
+
   /** Constructor for the events page. */
   constructor(
     private route: ActivatedRoute,
@@ -72,6 +76,20 @@ export class EventPageComponent implements OnInit {
     if (data.events.length > 0) {
       this.selectedEvent = data.events[0];
     }
+
+    // Search all events on the backend, rather than only the events loaded
+    this.searchBarQueries
+      .pipe(
+        debounceTime(250),
+        switchMap((query) =>
+          query.trim() === ''
+            ? of(this.events)
+            : this.eventService.searchEvents(query)
+        )
+      )
+      .subscribe((events) => {
+        this.eventsPerDay = this.eventService.groupEventsByDate(events);
+      });
   }
 
   /** Runs when the frontend UI loads */
@@ -91,7 +109,8 @@ export class EventPageComponent implements OnInit {
    * @param query: Search bar query to filter the items
    */
   onSearchBarQueryChange(query: string) {
-    this.eventsPerDay = this.eventService.groupEventsByDate(this.events, query);
+    this.searchBarQuery = query;
+    this.searchBarQueries.next(query);
   }
 
   /** Handler that runs when an event card is clicked.
@@ -18,9 +18,25 @@ export interface Event {
   description: string;
   public: boolean;
   organization_id: number | null;
-  organization: Organization | null;
+  organization: Organization | EventFeedOrganization | null;
+  capacity: number | null;
+  rsvp_count: number;
 }
 
+/** Interface for whether the user has RSVP'd to an event, and how many have */
+export interface EventRsvp {
+  event_id: number;
+  attending: boolean;
+  rsvp_count: number;
+  capacity: number | null;
+}
+
+/** The fields of the organization hosting an event included in an event feed */
+export type EventFeedOrganization = Pick<
+  Organization,
+  'id' | 'name' | 'shorthand' | 'slug' | 'logo'
+>;
+
 /** Interface for the Event JSON Response model
  *  Note: The API returns object data, such as `Date`s, as strings. So,
  *  this interface models the data directly received from the API. It is
@@ -34,7 +50,9 @@ export interface EventJson {
   description: string;
   public: boolean;
   organization_id: number | null;
-  organization: Organization | null;
+  organization: Organization | EventFeedOrganization | null;
+  capacity: number | null;
+  rsvp_count: number;
 }
 
 /** Function that converts an EventJSON response model to an Event model.
@@ -45,3 +63,35 @@ export interface EventJson {
 export const parseEventJson = (eventJson: EventJson): Event => {
   return Object.assign({}, eventJson, { time: new Date(eventJson.time) });
 };
+
+/** Interface for the Event Feed JSON Response model
+ *  Each organization hosting an event in the feed is included once, keyed by its ID.
+ */
+export interface EventFeedJson {
+  events: Omit<EventJson, 'organization'>[];
+  organizations: { [id: number]: EventFeedOrganization };
+  next_cursor: string;
+}
+
+/** Function that converts the events of an EventFeedJson response model to Event models,
+ *  attaching the organization hosting each event.
+ */
+export const parseEventFeedJson = (feedJson: EventFeedJson): Event[] => {
+  return feedJson.events.map((eventJson) =>
+    parseEventJson(
+      Object.assign({}, eventJson, {
+        organization: feedJson.organizations[eventJson.organization_id!] ?? null
+      })
+    )
+  );
+};
+
+/** Interface for an Event Search Result JSON Response model
+ *  `headline` is an excerpt of the event's description with matching words wrapped in `<mark>` tags.
+ */
+export interface EventSearchResultJson {
+  event: Omit<EventJson, 'organization'>;
+  organization: EventFeedOrganization;
+  headline: string;
+  rank: number;
+}
@@ -12,9 +12,9 @@ import { ResolveFn } from '@angular/router';
 import { Event } from './event.model';
 import { EventService } from './event.service';
 
-/** This resolver injects the list of events into the events component. */
+/** This resolver injects the list of events from today onward into the events component. */
 export const eventResolver: ResolveFn<Event[] | undefined> = (route, state) => {
-  return inject(EventService).getEvents();
+  return inject(EventService).getUpcomingEvents();
 };
 
 /** This resolver injects an event into the events detail component. */
@@ -33,7 +33,9 @@ export const eventDetailResolver: ResolveFn<Event | undefined> = (
       description: '',
       public: true,
       organization_id: null,
-      organization: null
+      organization: null,
+      capacity: null,
+      rsvp_count: 0
     };
   }
 };
@@ -8,9 +8,19 @@
  */
 
 import { Injectable } from '@angular/core';
-import { HttpClient } from '@angular/common/http';
-import { Observable, map } from 'rxjs';
-import { Event, EventJson, parseEventJson } from './event.model';
+import { HttpClient, HttpParams } from '@angular/common/http';
+import { Observable, catchError, map, switchMap } from 'rxjs';
+import {
+  Event,
+  EventFeedJson,
+  EventJson,
+  EventRsvp,
+  EventSearchResultJson,
+  parseEventFeedJson,
+  parseEventJson
+} from './event.model';
+import { Paginated } from '../pagination';
+import { SnapshotManifest } from '../snapshot';
 import { DatePipe } from '@angular/common';
 import { EventFilterPipe } from './event-filter/event-filter.pipe';
 
@@ -33,6 +43,64 @@ export class EventService {
       .pipe(map((eventJsons) => eventJsons.map(parseEventJson)));
   }
 
+  /** Returns a page of events within a window of time, in order of time, using the backend HTTP get request.
+   * @param from: only include events at or after this time
+   * @param to: only include events before this time
+   * @param cursor: the next_cursor of the previous page, or empty for the first page
+   * @returns {Observable<Event[]>}
+   */
+  getEventFeed(
+    from: Date | null = null,
+    to: Date | null = null,
+    cursor: string = ''
+  ): Observable<Event[]> {
+    let params = new HttpParams();
+    if (from) params = params.set('from', from.toISOString());
+    if (to) params = params.set('to', to.toISOString());
+    if (cursor) params = params.set('cursor', cursor);
+    return this.http
+      .get<EventFeedJson>('/api/events/feed', { params })
+      .pipe(map(parseEventFeedJson));
+  }
+
+  /** Returns the upcoming events from their current static snapshot, from the start of today,
+   * or using the backend HTTP get request if there is no snapshot.
+   * @returns {Observable<Event[]>}
+   */
+  getUpcomingEvents(): Observable<Event[]> {
+    let today = new Date();
+    today.setHours(0, 0, 0, 0);
+    return this.http.get<SnapshotManifest>('/api/snapshots').pipe(
+      switchMap((manifest) => this.http.get<EventFeedJson>(manifest.events)),
+      map(parseEventFeedJson),
+      catchError(() => this.getEventFeed(today))
+    );
+  }
+
+  /** Returns the events most relevant to a search query using the backend HTTP get request.
+   * @param query: the search query
+   * @param page_size: the maximum number of events to return
+   * @returns {Observable<Event[]>}
+   */
+  searchEvents(query: string, page_size: number = 50): Observable<Event[]> {
+    let params = new HttpParams()
+      .set('q', query)
+      .set('page_size', page_size.toString());
+    return this.http
+      .get<Paginated<EventSearchResultJson>>('/api/events/search', { params })
+      .pipe(
+        map((page) =>
+          page.items.map((result) =>
+            parseEventJson(
+              Object.assign({}, result.event, {
+                organization: result.organization
+              })
+            )
+          )
+        )
+      );
+  }
+
   /** Returns the event object from the backend database table using the backend HTTP get request.
    * @param id: ID of the event to retrieve
    * @returns {Observable<Event>}
@@ -77,6 +145,30 @@ export class EventService {
     return this.http.delete<Event>('/api/events/' + event.id);
   }
 
+  /** Returns whether the user has RSVP'd to an event using the backend HTTP get request.
+   * @param event: Event to get the user's RSVP to
+   * @returns {Observable<EventRsvp>}
+   */
+  getRsvp(event: Event): Observable<EventRsvp> {
+    return this.http.get<EventRsvp>(`/api/events/${event.id}/rsvp`);
+  }
+
+  /** RSVPs the user to an event using the backend HTTP post request.
+   * @param event: Event to RSVP to
+   * @returns {Observable<EventRsvp>}
+   */
+  rsvp(event: Event): Observable<EventRsvp> {
+    return this.http.post<EventRsvp>(`/api/events/${event.id}/rsvp`, {});
+  }
+
+  /** Cancels the user's RSVP to an event using the backend HTTP delete request.
+   * @param event: Event to cancel the RSVP to
+   * @returns {Observable<EventRsvp>}
+   */
+  cancelRsvp(event: Event): Observable<EventRsvp> {
+    return this.http.delete<EventRsvp>(`/api/events/${event.id}/rsvp`);
+  }
+
   /** Helper function to group a list of events by date,
    * filtered based on the input query string.
    * @param events: List of the input events
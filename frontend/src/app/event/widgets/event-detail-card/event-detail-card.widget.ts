@@ -7,8 +7,8 @@
  * @license MIT
  */
 
-import { Component, Input } from '@angular/core';
-import { Event } from '../../event.model';
+import { Component, Input, OnInit } from '@angular/core';
+import { Event, EventRsvp } from '../../event.model';
 import { MatSnackBar } from '@angular/material/snack-bar';
 import { EventService } from '../../event.service';
 import { Observable } from 'rxjs';
@@ -19,10 +19,13 @@ import { PermissionService } from 'src/app/permission.service';
   templateUrl: './event-detail-card.widget.html',
   styleUrls: ['./event-detail-card.widget.css']
 })
-export class EventDetailCard {
+export class EventDetailCard implements OnInit {
   /** The event for the event card to display */
   @Input() event!: Event;
 
+  /** Whether the user has RSVP'd to the event, once known */
+  public attending: boolean | null = null;
+
   /** Constructs the widget */
   constructor(
     protected snackBar: MatSnackBar,
@@ -30,6 +33,15 @@ export class EventDetailCard {
     private permission: PermissionService
   ) {}
 
+  /** Loads whether the signed in user has RSVP'd to the event */
+  ngOnInit(): void {
+    if (this.event.id === null) return;
+    this.eventService.getRsvp(this.event).subscribe({
+      next: (rsvp: EventRsvp) => (this.attending = rsvp.attending),
+      error: () => (this.attending = null)
+    });
+  }
+
   checkPermissions(): Observable<boolean> {
     return this.permission.check(
       'organization.events.manage',
@@ -52,6 +64,31 @@ export class EventDetailCard {
     });
   }
 
+  /** Handler for when the RSVP button is pressed
+   *  This function RSVPs the user to the event, or cancels their RSVP.
+   */
+  onRsvpButtonClick() {
+    let request = this.attending
+      ? this.eventService.cancelRsvp(this.event)
+      : this.eventService.rsvp(this.event);
+    request.subscribe({
+      next: (rsvp: EventRsvp) => {
+        this.attending = rsvp.attending;
+        this.event.rsvp_count = rsvp.rsvp_count;
+        this.event.capacity = rsvp.capacity;
+      },
+      error: (response) => {
+        this.snackBar.open(
+          response.status === 409
+            ? 'This event is at capacity.'
+            : 'Sign in to RSVP to this event.',
+          '',
+          { duration: 3000 }
+        );
+      }
+    });
+  }
+
   /** Delete the given event object using the Event Service's deleteEvent method
    * @param event: Event representing the updated event
    * @returns void
@@ -16,14 +16,15 @@ import {
 } from '@angular/router';
 import { MatSnackBar } from '@angular/material/snack-bar';
 import { profileResolver } from '/workspace/frontend/src/app/profile/profile.resolver';
-import { Organization } from '../organization.model';
-import { Profile } from '/workspace/frontend/src/app/profile/profile.service';
 import {
-  organizationDetailResolver,
-  organizationEventsResolver
-} from '../organization.resolver';
+  Organization,
+  OrganizationEventsJson
+} from '../organization.model';
+import { Profile } from '/workspace/frontend/src/app/profile/profile.service';
+import { organizationDetailResolver } from '../organization.resolver';
+import { OrganizationService } from '../organization.service';
 import { EventService } from 'src/app/event/event.service';
-import { Event } from 'src/app/event/event.model';
+import { Event, EventJson, parseEventJson } from 'src/app/event/event.model';
 import { Observable } from 'rxjs';
 import { PermissionService } from 'src/app/permission.service';
 
@@ -44,8 +45,7 @@ export class OrganizationDetailsComponent {
     component: OrganizationDetailsComponent,
     resolve: {
       profile: profileResolver,
-      organization: organizationDetailResolver,
-      events: organizationEventsResolver
+      organization: organizationDetailResolver
     },
     children: [
       {
@@ -62,9 +62,18 @@ export class OrganizationDetailsComponent {
   /** The organization to show */
   public organization: Organization;
 
+  /** The organization's events loaded so far, upcoming events first */
+  private events: Event[];
+
   /** Store a map of days to a list of events for that day */
   public eventsPerDay: [string, Event[]][];
 
+  /** Cursor to the organization's next upcoming events, empty when all are loaded */
+  public eventsCursor: string;
+
+  /** Cursor to the organization's next past events, empty when all are loaded */
+  public pastEventsCursor: string;
+
   /** Whether or not the user has permission to update events. */
   public eventCreationPermission$: Observable<boolean>;
 
@@ -73,20 +82,53 @@ export class OrganizationDetailsComponent {
     private route: ActivatedRoute,
     protected snackBar: MatSnackBar,
     protected eventService: EventService,
+    protected organizationService: OrganizationService,
     private permission: PermissionService
   ) {
     /** Initialize data from resolvers. */
     const data = this.route.snapshot.data as {
       profile: Profile;
       organization: Organization;
-      events: Event[];
     };
     this.profile = data.profile;
     this.organization = data.organization;
-    this.eventsPerDay = eventService.groupEventsByDate(data.events ?? []);
+    this.events = this.parseEvents(
+      (this.organization.events ?? []) as unknown as EventJson[]
+    );
+    this.eventsPerDay = eventService.groupEventsByDate(this.events);
+    this.eventsCursor = this.organization.events_cursor ?? '';
+    this.pastEventsCursor = this.organization.past_events_cursor ?? '';
     this.eventCreationPermission$ = this.permission.check(
       'organization.events.manage',
       `organization/${this.organization!.id}`
     );
   }
+
+  /** Loads the organization's next page of upcoming or past events. */
+  loadMoreEvents(past: boolean = false) {
+    this.organizationService
+      .getOrganizationEvents(
+        this.organization.slug,
+        past ? this.pastEventsCursor : this.eventsCursor,
+        past
+      )
+      .subscribe((page: OrganizationEventsJson) => {
+        if (past) {
+          this.pastEventsCursor = page.next_cursor;
+        } else {
+          this.eventsCursor = page.next_cursor;
+        }
+        this.events = this.events.concat(this.parseEvents(page.events));
+        this.eventsPerDay = this.eventService.groupEventsByDate(this.events);
+      });
+  }
+
+  /** Parses events of the organization, which are sent without it. */
+  private parseEvents(eventJsons: EventJson[]): Event[] {
+    return eventJsons.map((eventJson) =>
+      parseEventJson(
+        Object.assign({}, eventJson, { organization: this.organization })
+      )
+    );
+  }
 }
@@ -10,11 +10,13 @@
 
 import { Component } from '@angular/core';
 import { profileResolver } from '/workspace/frontend/src/app/profile/profile.resolver';
-import { Organization } from '../organization.model';
+import { OrganizationSummary } from '../organization.model';
 import { ActivatedRoute } from '@angular/router';
 import { MatSnackBar } from '@angular/material/snack-bar';
 import { Profile } from '/workspace/frontend/src/app/profile/profile.service';
 import { organizationResolver } from '../organization.resolver';
+import { OrganizationService } from '../organization.service';
+import { Subject, debounceTime, of, switchMap } from 'rxjs';
 
 @Component({
   selector: 'app-organization-page',
@@ -31,12 +33,18 @@ export class OrganizationPageComponent {
     resolve: { profile: profileResolver, organizations: organizationResolver }
   };
 
-  /** Store Observable list of Organizations */
-  public organizations: Organization[];
+  /** Store list of Organization summaries */
+  public organizations: OrganizationSummary[];
+
+  /** Store the Organizations shown, which match the search bar query */
+  public shownOrganizations: OrganizationSummary[];
 
   /** Store searchBarQuery */
   public searchBarQuery = '';
 
+  /** Stream of search bar queries, which are searched for once typing pauses */
+  private searchBarQueries = new Subject<string>();
+
   /** Store the currently-logged-in user's profile.  */
   public profile: Profile;
 
@@ -45,14 +53,36 @@ export class OrganizationPageComponent {
 
   constructor(
     private route: ActivatedRoute,
-    protected snackBar: MatSnackBar
+    protected snackBar: MatSnackBar,
+    private organizationService: OrganizationService
   ) {
     /** Initialize data from resolvers. */
     const data = this.route.snapshot.data as {
       profile: Profile;
-      organizations: Organization[];
+      organizations: OrganizationSummary[];
     };
     this.profile = data.profile;
     this.organizations = data.organizations;
+    this.shownOrganizations = this.organizations;
+
+    // Search organizations on the backend once typing pauses
+    this.searchBarQueries
+      .pipe(
+        debounceTime(250),
+        switchMap((query) =>
+          query.trim() === ''
+            ? of(this.organizations)
+            : this.organizationService.searchOrganizations(query)
+        )
+      )
+      .subscribe((organizations) => (this.shownOrganizations = organizations));
+  }
+
+  /** Handler that runs when the search bar query changes.
+   * @param query: Search bar query to search organizations for
+   */
+  onSearchBarQueryChange(query: string) {
+    this.searchBarQuery = query;
+    this.searchBarQueries.next(query);
   }
 }
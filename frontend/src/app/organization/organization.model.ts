@@ -7,7 +7,7 @@
  * @license MIT
  */
 
-import { Event } from '../event/event.model';
+import { Event, EventJson } from '../event/event.model';
 
 /** Interface for Organization Type (used on frontend for organization detail) */
 export interface Organization {
@@ -26,4 +26,31 @@ export interface Organization {
   slug: string;
   shorthand: string;
   events: Event[] | null;
+  events_cursor?: string;
+  past_events_cursor?: string;
+}
+
+/** Interface for a page of an organization's events following a cursor.
+ *  `next_cursor` is empty on the last page.
+ */
+export interface OrganizationEventsJson {
+  events: EventJson[];
+  next_cursor: string;
+}
+
+/** Interface for an Organization as listed in the organization directory,
+ *  without its long description and events.
+ */
+export type OrganizationSummary = Omit<
+  Organization,
+  'long_description' | 'heel_life' | 'events'
+>;
+
+/** Interface for an Organization Search Result
+ *  `headline` is an excerpt of the short description with matching words wrapped in `<mark>` tags.
+ */
+export interface OrganizationSearchResult {
+  organization: Organization;
+  headline: string;
+  rank: number;
 }
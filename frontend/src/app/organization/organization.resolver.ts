@@ -9,13 +9,13 @@
 
 import { inject } from '@angular/core';
 import { ResolveFn } from '@angular/router';
-import { Organization } from './organization.model';
+import { Organization, OrganizationSummary } from './organization.model';
 import { OrganizationService } from './organization.service';
-import { EventService } from '../event/event.service';
-import { Event } from '../event/event.model';
 
 /** This resolver injects the list of organizations into the organization component. */
-export const organizationResolver: ResolveFn<Organization[] | undefined> = (
+export const organizationResolver: ResolveFn<
+  OrganizationSummary[] | undefined
+> = (
   route,
   state
 ) => {
@@ -51,13 +51,3 @@ export const organizationDetailResolver: ResolveFn<Organization | undefined> = (
     };
   }
 };
-
-/** This resolver injects the events for a given organization into the organization component. */
-export const organizationEventsResolver: ResolveFn<Event[] | undefined> = (
-  route,
-  state
-) => {
-  return inject(EventService).getEventsByOrganization(
-    route.paramMap.get('slug')!
-  );
-};
@@ -8,11 +8,18 @@
  */
 
 import { Injectable } from '@angular/core';
-import { HttpClient } from '@angular/common/http';
+import { HttpClient, HttpParams } from '@angular/common/http';
 import { AuthenticationService } from '../authentication.service';
 import { MatSnackBar } from '@angular/material/snack-bar';
-import { Observable } from 'rxjs';
-import { Organization } from './organization.model';
+import { Observable, catchError, map, switchMap } from 'rxjs';
+import {
+  Organization,
+  OrganizationEventsJson,
+  OrganizationSearchResult,
+  OrganizationSummary
+} from './organization.model';
+import { Paginated } from '../pagination';
+import { SnapshotManifest } from '../snapshot';
 
 @Injectable({
   providedIn: 'root'
@@ -24,11 +31,39 @@ export class OrganizationService {
     protected snackBar: MatSnackBar
   ) {}
 
-  /** Returns all organization entries from the backend database table using the backend HTTP get request.
+  /** Returns the summaries of all organizations in the directory from its current static snapshot,
+   * or using the backend HTTP get request if there is no snapshot.
+   * The browser revalidates its cached copy of the directory with the backend by ETag.
+   * @returns {Observable<OrganizationSummary[]>}
+   */
+  getOrganizations(): Observable<OrganizationSummary[]> {
+    return this.http.get<SnapshotManifest>('/api/snapshots').pipe(
+      switchMap((manifest) =>
+        this.http.get<OrganizationSummary[]>(manifest.organizations)
+      ),
+      catchError(() =>
+        this.http.get<OrganizationSummary[]>('/api/organizations')
+      )
+    );
+  }
+
+  /** Returns the organizations most relevant to a search query using the backend HTTP get request.
+   * @param query: the search query
+   * @param page_size: the maximum number of organizations to return
    * @returns {Observable<Organization[]>}
    */
-  getOrganizations(): Observable<Organization[]> {
-    return this.http.get<Organization[]>('/api/organizations');
+  searchOrganizations(
+    query: string,
+    page_size: number = 50
+  ): Observable<Organization[]> {
+    let params = new HttpParams()
+      .set('q', query)
+      .set('page_size', page_size.toString());
+    return this.http
+      .get<Paginated<OrganizationSearchResult>>('/api/organizations/search', {
+        params
+      })
+      .pipe(map((page) => page.items.map((result) => result.organization)));
   }
 
   /** Returns the organization object from the backend database table using the backend HTTP get request.
@@ -39,6 +74,26 @@ export class OrganizationService {
     return this.http.get<Organization>('/api/organizations/' + slug);
   }
 
+  /** Returns a page of an organization's events following a cursor using the backend HTTP get request.
+   * @param slug: String representing the organization slug
+   * @param cursor: the events_cursor or past_events_cursor of the organization, or the next_cursor of the previous page
+   * @param past: whether the cursor is of past events, which are ordered most recent first
+   * @returns {Observable<OrganizationEventsJson>}
+   */
+  getOrganizationEvents(
+    slug: string,
+    cursor: string,
+    past: boolean = false
+  ): Observable<OrganizationEventsJson> {
+    let params = new HttpParams()
+      .set('cursor', cursor)
+      .set('past', past.toString());
+    return this.http.get<OrganizationEventsJson>(
+      `/api/organizations/${slug}/events`,
+      { params }
+    );
+  }
+
   /** Returns the new organization object from the backend database table using the backend HTTP post request.
    * @param organization: OrganizationSummary representing the new organization
    * @returns {Observable<Organization>}
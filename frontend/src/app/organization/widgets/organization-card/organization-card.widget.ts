@@ -8,7 +8,7 @@
  */
 
 import { Component, Input } from '@angular/core';
-import { Organization } from '../../organization.model';
+import { OrganizationSummary } from '../../organization.model';
 import { Profile } from '/workspace/frontend/src/app/profile/profile.service';
 
 @Component({
@@ -18,7 +18,7 @@ import { Profile } from '/workspace/frontend/src/app/profile/profile.service';
 })
 export class OrganizationCard {
   /** The organization to show */
-  @Input() organization!: Organization;
+  @Input() organization!: OrganizationSummary;
   /** The profile of the currently signed in user */
   @Input() profile?: Profile;
   /** @deprecated Stores the permission values for a profile */
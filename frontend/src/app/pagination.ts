@@ -3,10 +3,12 @@ export interface PaginationParams {
   page_size: number;
   order_by: string;
   filter: string;
+  cursor?: string;
 }
 
 export interface Paginated<T> {
   items: T[];
   length: number;
   params: PaginationParams;
+  next_cursor: string;
 }
@@ -1,4 +1,4 @@
-import { Component, OnInit } from '@angular/core';
+import { Component, OnDestroy, OnInit } from '@angular/core';
 import { FormBuilder, Validators } from '@angular/forms';
 import { MatSnackBar } from '@angular/material/snack-bar';
 import { ActivatedRoute, Route } from '@angular/router';
@@ -11,7 +11,7 @@ import { Profile, ProfileService } from '../profile.service';
   templateUrl: './profile-editor.component.html',
   styleUrls: ['./profile-editor.component.css']
 })
-export class ProfileEditorComponent implements OnInit {
+export class ProfileEditorComponent implements OnInit, OnDestroy {
   public static Route: Route = {
     path: 'profile',
     component: ProfileEditorComponent,
@@ -22,6 +22,9 @@ export class ProfileEditorComponent implements OnInit {
 
   public profile: Profile;
 
+  /** Object URL of the linked GitHub account's avatar, fetched with the bearer token */
+  public avatarUrl: string | null = null;
+
   public profileForm = this.formBuilder.group({
     first_name: '',
     last_name: '',
@@ -60,6 +63,16 @@ export class ProfileEditorComponent implements OnInit {
       email: profile.email,
       pronouns: profile.pronouns
     });
+
+    if (profile.id !== null && profile.github) {
+      this.profileService.getAvatar(profile.id).subscribe({
+        next: (avatar) => (this.avatarUrl = URL.createObjectURL(avatar))
+      });
+    }
+  }
+
+  ngOnDestroy(): void {
+    this.revokeAvatarUrl();
   }
 
   onSubmit(): void {
@@ -88,7 +101,17 @@ export class ProfileEditorComponent implements OnInit {
 
   unlinkGitHub() {
     this.profileService.unlinkGitHub().subscribe({
-      next: () => (this.profile.github = '')
+      next: () => {
+        this.profile.github = '';
+        this.revokeAvatarUrl();
+      }
     });
   }
+
+  private revokeAvatarUrl() {
+    if (this.avatarUrl !== null) {
+      URL.revokeObjectURL(this.avatarUrl);
+      this.avatarUrl = null;
+    }
+  }
 }
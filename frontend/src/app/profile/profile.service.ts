@@ -65,6 +65,10 @@ export class ProfileService {
     return this.http.get<Profile[]>(`/api/user?q=${encodedQuery}`);
   }
 
+  getAvatar(id: number): Observable<Blob> {
+    return this.http.get(`/api/user/${id}/avatar`, { responseType: 'blob' });
+  }
+
   getGitHubOAuthLoginURL(): Observable<string> {
     return this.http.get<string>('/oauth/github_oauth_login_url');
   }
@@ -0,0 +1,8 @@
+/** Interface for the manifest of the current static snapshots of public data.
+ *  Each snapshot is a URL path of a JSON file which may be cached indefinitely.
+ */
+export interface SnapshotManifest {
+  built_at: string;
+  organizations: string;
+  events: string;
+}